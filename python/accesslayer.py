@@ -1,6 +1,8 @@
 from plugins import *
 from interface import *
+import numpy as np
 import logging
+import time
 import inspect
 import ctypes
 import sys
@@ -10,6 +12,253 @@ import re
 DeviceNames = { Device.Board : "Board", Device.FPGA_1 : "FPGA 1", Device.FPGA_2 : "FPGA 2" }
 # ------------------------------------------------------
 
+# --------------- Register handle ----------------------
+class RegisterHandle(object):
+    """ Register resolved once, which is then read and written directly by memory
+        address. The handle is resolved again when firmware is loaded on its board """
+
+    def __init__(self, board, name):
+        """ Class constructor
+        :param board: Board on which register is defined
+        :param name: Register name, including device
+        """
+        self._board = board
+        self.name   = name
+        self._resolve()
+
+    def _resolve(self):
+        """ Look up register information """
+        info = self._board._get_register_info(self.name)
+        self.address     = info['address']
+        self.size        = info['size']
+        self.bitmask     = info['bitmask']
+        self.shift       = bitmask_shift(self.bitmask)
+        self._generation = self._board._firmware_generation
+
+    def _check(self):
+        """ Resolve register again if firmware was reloaded since handle was created """
+        if self._generation != self._board._firmware_generation:
+            self._board._checks()
+            self._resolve()
+
+    def _read_words(self, address, n, as_array = False):
+        """ Read words within register from board by memory address """
+        values = call_read_address(self._board.id, address, n, as_array)
+        if values is Error.Failure:
+            raise BoardError("Failed to read register %s from board" % self.name)
+        return values
+
+    def _write_words(self, address, values):
+        """ Write words within register to board by memory address """
+        if call_write_address(self._board.id, address, values) == Error.Failure:
+            raise BoardError("Failed to write register %s on board" % self.name)
+
+    def read(self, n = None, offset = 0, as_array = False):
+        """ Read register value
+        :param n: Number of words to read, defaults to register size
+        :param offset: Word offset within register to read from
+        :param as_array: Return values as a numpy uint32 array
+        :return: Values
+        """
+        self._check()
+
+        # Check that read is within register
+        n = self.size if n is None else n
+        if offset + n > self.size:
+            raise LibraryError("Offset and n exceed size of register %s" % self.name)
+
+        # Single words are served from the shadow cache, if enabled
+        address = self.address + offset * 4
+        cache = self._board._get_cache()
+        cached = n == 1 and not as_array and cache is not None
+        values = cache.get(address) if cached else None
+
+        # Otherwise, read values from board
+        if values is None:
+            values = self._read_words(address, n, as_array)
+            if cached:
+                cache.put(address, values)
+
+        # Apply bitmask and shift
+        if self.bitmask == 0xFFFFFFFF:
+            return values
+        elif as_array:
+            return (values & np.uint32(self.bitmask)) >> np.uint32(self.shift)
+        elif n == 1:
+            return (values & self.bitmask) >> self.shift
+        else:
+            return [(v & self.bitmask) >> self.shift for v in values]
+
+    def write(self, values, offset = 0):
+        """ Write register value
+        :param values: Values to write
+        :param offset: Word offset within register to write to
+        """
+        self._check()
+
+        # Check that write is within register
+        vals = wrap_write_values(values)
+        if vals is None or offset + vals.size > self.size:
+            raise LibraryError("Invalid values for register %s" % self.name)
+        address = self.address + offset * 4
+
+        # If a batch is in progress, add write to batch
+        if self._board._batch is not None:
+            self._board._batch.add([(address + i * 4, self.bitmask, int(v)) for i, v in enumerate(vals)])
+            return
+
+        # If register does not span the full word, merge values with current content,
+        # taken from the shadow cache if available
+        cache = self._board._get_cache()
+        if self.bitmask != 0xFFFFFFFF:
+            current = cache.get(address) if cache is not None and vals.size == 1 else None
+            if current is not None:
+                current = np.array([current], dtype = np.uint32)
+            else:
+                current = self._read_words(address, vals.size, as_array = True)
+            vals = (current & np.uint32(~self.bitmask & 0xFFFFFFFF)) | \
+                   ((vals << np.uint32(self.shift)) & np.uint32(self.bitmask))
+
+        # Write values
+        self._write_words(address, vals)
+
+        # Update shadow cache
+        if cache is not None:
+            if vals.size == 1:
+                cache.put(address, int(vals[0]))
+            else:
+                cache.invalidate(address, vals.size)
+
+    def __repr__(self):
+        return "RegisterHandle(%s, address=%s, size=%d, bitmask=0x%08X)" % \
+               (self.name, hex(self.address), self.size, self.bitmask)
+
+# --------------- Shadow cache -------------------------
+class ShadowCache(object):
+    """ Cache of register words written to or read from a board. Each word is
+        assigned a policy from the registers which map to it """
+
+    def __init__(self, ttl = 0.0):
+        """ Class constructor
+        :param ttl: Time in seconds for which words with the TTL policy are valid
+        """
+        self.ttl       = ttl
+        self.hits      = 0
+        self.misses    = 0
+        self._words    = { }  # Word address -> (value, time stored)
+        self._policies = None # Word address -> CachePolicy
+
+    @staticmethod
+    def register_policy(register):
+        """ Get default cache policy for a register
+        :param register: Register information dictionary
+        :return: CachePolicy
+        """
+
+        # Only single word registers which are written by the host are cached
+        if register['size'] != 1 or register['permission'] == Permission.Read:
+            return CachePolicy.Never
+        elif register['volatility'] == Volatility.Volatile:
+            return CachePolicy.Never
+        elif register['volatility'] == Volatility.NonVolatile:
+            return CachePolicy.WriteThrough
+        else:
+            return CachePolicy.TTL
+
+    def configured(self):
+        """ Check whether word policies have been assigned """
+        return self._policies is not None
+
+    def configure(self, register_list, overrides):
+        """ Assign a policy to each word. When multiple registers map to the same word,
+            the least permissive policy is used
+        :param register_list: Board register list
+        :param overrides: Dictionary of register name, CachePolicy pairs overriding defaults
+        """
+        self._words    = { }
+        self._policies = { }
+        for name, register in register_list.iteritems():
+            policy = overrides.get(name, self.register_policy(register))
+            current = self._policies.get(register['address'], CachePolicy.WriteThrough)
+            self._policies[register['address']] = CachePolicy(min(policy.value, current.value))
+
+    def reset(self):
+        """ Discard all words and policies, called when firmware changes """
+        self._words    = { }
+        self._policies = None
+
+    def get(self, address):
+        """ Get cached word
+        :param address: Word address
+        :return: Word value, None if word is not cached or has expired
+        """
+        entry = self._words.get(address)
+        if entry is not None and self._policies.get(address) is CachePolicy.TTL and \
+           time.time() - entry[1] > self.ttl:
+            del self._words[address]
+            entry = None
+
+        if entry is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return entry[0]
+
+    def put(self, address, value):
+        """ Store word value, if its policy allows it
+        :param address: Word address
+        :param value: Word value
+        """
+        if self._policies.get(address, CachePolicy.Never) is not CachePolicy.Never:
+            self._words[address] = (value, time.time())
+
+    def clear(self):
+        """ Discard all words, keeping policies """
+        self._words = { }
+
+    def invalidate(self, address, n = 1):
+        """ Discard words in an address range
+        :param address: First word address
+        :param n: Number of words
+        """
+        for i in range(n):
+            self._words.pop(address + i * 4, None)
+
+# --------------- Register batch -----------------------
+class RegisterBatch(object):
+    """ Context manager which collects register writes on a board and commits
+        them on exit, with one read and one write per word """
+
+    def __init__(self, board, use_opcodes = False):
+        """ Class constructor
+        :param board: Board to collect writes for
+        :param use_opcodes: Merge partially written words on the board
+        """
+        self._board       = board
+        self._use_opcodes = use_opcodes
+        self._writes      = []
+
+    def add(self, writes):
+        """ Add writes to batch
+        :param writes: List of (address, bitmask, value) tuples
+        """
+        self._writes.extend(writes)
+
+    def __enter__(self):
+        if self._board._batch is not None:
+            raise LibraryError("A batch is already in progress on this board")
+        self._board._batch = self
+        self._writes = []
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self._board._batch = None
+
+        # Discard writes if block raised an exception
+        if exc_type is None and len(self._writes) > 0:
+            self._board._commit_writes(self._writes, self._use_opcodes)
+        return False
+
 # Wrap functionality for a TPM board
 class FPGABoard(object):
     """ Class which wraps LMC functionality for generic FPGA boards """
@@ -23,12 +272,24 @@ class FPGABoard(object):
         self._firmwareList = None
         self._fpga_board    = 0
         self._deviceList   = None
+        self._device_index = None
         self.id            = None
         self.status        = Status.NotConnected
         self._programmed   = False
         self._logger       = None
         self._string_id    = "Board"
 
+        # Register handles, invalidated when firmware changes
+        self._register_handles    = { }
+        self._firmware_generation = 0
+
+        # Batch in progress, if any
+        self._batch = None
+
+        # Shadow register cache, disabled by default
+        self._cache = None
+        self._cache_overrides = { }
+
         # List all available subclasses of FirmwareBlock (plugins)
         self._available_plugins = []
         for plugin in [cls.__name__ for cls in sys.modules['plugins'].FirmwareBlock.__subclasses__()]:
@@ -98,6 +359,10 @@ class FPGABoard(object):
                 raise LibraryError("IP and port are required for initialisation")
             self.connect(config['ip'], int(config['port']))
 
+        # Set number of outstanding requests for large transfers, if defined
+        if 'window' in config:
+            self.set_window_size(int(config['window']))
+
         # Check if firmware was defined in config
         if 'firmware' not in config:
             raise BoardError("Firmware must be specified in configuration file")
@@ -255,7 +520,7 @@ class FPGABoard(object):
 
         ret = call_disconnect_board(self.id)
         if ret == Error.Success:
-            self._registerList = None
+            self._invalidate_registers()
             self._logger.info(self.log("Disconnected from board with ID %s" % self.id))
             self.id = None
 
@@ -291,8 +556,9 @@ class FPGABoard(object):
         if not type(device) is Device:
             raise LibraryError("Device argument for load_firmware_blocking should be of type Device")
 
-        # All OK, call function
+        # All OK, call function. Register information from previous firmware is no longer valid
         self.status = Status.LoadingFirmware
+        self._invalidate_registers()
         err = call_load_firmware_blocking(self.id, device, filepath)
         self._logger.debug(self.log("Called load_firmware_blocking"))
 
@@ -340,12 +606,13 @@ class FPGABoard(object):
         # All done, return
         return self._deviceList
 
-    def read_register(self, device, register, n = 1, offset = 0):
+    def read_register(self, device, register, n = 1, offset = 0, as_array = False):
         """" Get register value
          :param device: Device on board to read register from
          :param register: Register name
          :param n: Number of words to read
          :param offset: Memory address offset to read from
+         :param as_array: Return values as a numpy uint32 array
          :return: Values
          """
 
@@ -362,18 +629,43 @@ class FPGABoard(object):
         self._logger.debug(self.log("Called read_register"))
 
         # Check if value succeeded, otherwise return
-        if values.error == Error.Failure.value:
+        if values.error != Error.Success.value:
             raise BoardError("Failed to read_register %s from board" % register)
 
         # Read succeeded, wrap data and return
-        valPtr = ctypes.cast(values.values, ctypes.POINTER(ctypes.c_uint32))
+        return wrap_values(values, n, as_array)
 
-        self._logger.debug(self.log("Called read_register on board"))
+    def read_register_into(self, device, register, buf, offset = 0):
+        """" Read register values into a pre-allocated array
+         :param device: Device on board to read register from
+         :param register: Register name
+         :param buf: Numpy uint32 array, one word is read per array element
+         :param offset: Memory address offset to read from
+         :return: buf
+         """
 
-        if n == 1:
-            return valPtr[0]
-        else:
-            return [valPtr[i] for i in range(n)]
+        # Perform basic checks
+        if not self._checks():
+            return
+
+        # Check if device argument is of type Device
+        if not type(device) is Device:
+            raise LibraryError("Device argument for read_register_into should be of type Device")
+
+        # Check if buffer can be written to
+        if not check_output_buffer(buf, 1):
+            raise LibraryError("Buffer argument for read_register_into should be a contiguous, writable uint32 array")
+
+        # Call function
+        values = call_read_register(self.id, device, self._remove_device(register), buf.size, offset)
+        self._logger.debug(self.log("Called read_register_into"))
+
+        # Check if value succeeded, otherwise return
+        if values.error != Error.Success.value:
+            raise BoardError("Failed to read_register %s from board" % register)
+
+        # Read succeeded, copy data to buffer
+        return wrap_values(values, buf.size, out = buf)
 
     def write_register(self, device, register, values, offset = 0):
         """ Set register value
@@ -391,23 +683,47 @@ class FPGABoard(object):
         if not type(device) is Device:
            raise LibraryError("Device argument for write_register should be of type Device")
 
+        # Register is written by name, so discard all cached words
+        if self._cache is not None:
+            self._cache.clear()
+
         # Call function and return
         err = call_write_register(self.id, device, self._remove_device(register), values, offset)
         self._logger.debug(self.log("Called write_register"))
         if err == Error.Failure:
             raise BoardError("Failed to write_register %s on board" % register)
 
-    def read_address(self, address, n = 1):
+    def read_address(self, address, n = 1, as_array = False):
         """" Get register value
          :param address: Memory address to read from
          :param n: Number of words to read
+         :param as_array: Return values as a numpy uint32 array
          :return: Values
          """
 
         # Call function and return
-        ret = call_read_address(self.id, address, n)
+        ret = call_read_address(self.id, address, n, as_array)
         self._logger.debug(self.log("Called read_address"))
-        if ret == Error.Failure:
+        if ret is Error.Failure:
+            raise BoardError("Failed to read_address %s on board" % hex(address))
+        else:
+            return ret
+
+    def read_address_into(self, address, buf):
+        """" Read memory values into a pre-allocated array
+         :param address: Memory address to read from
+         :param buf: Numpy uint32 array, one word is read per array element
+         :return: buf
+         """
+
+        # Check if buffer can be written to
+        if not check_output_buffer(buf, 1):
+            raise LibraryError("Buffer argument for read_address_into should be a contiguous, writable uint32 array")
+
+        # Call function and return
+        ret = call_read_address(self.id, address, buf.size, out = buf)
+        self._logger.debug(self.log("Called read_address_into"))
+        if ret is Error.Failure:
             raise BoardError("Failed to read_address %s on board" % hex(address))
         else:
             return ret
@@ -418,12 +734,178 @@ class FPGABoard(object):
          :param values: Values to write
          """
 
+        # Discard cached words in address range
+        if self._cache is not None:
+            vals = wrap_write_values(values)
+            self._cache.invalidate(address, vals.size if vals is not None else 1)
+
         # Call function and return
         err = call_write_address(self.id, address, values)
         self._logger.debug(self.log("Called write_address"))
         if err == Error.Failure:
             raise BoardError("Failed to write_address %s on board" % hex(address))
 
+    def read_registers(self, names, as_record = False):
+        """ Read multiple registers in a single batch. Registers with adjacent
+            addresses are combined into contiguous reads
+         :param names: List of register names, including device
+         :param as_record: Return values as a numpy record instead of a dictionary
+         :return: Dictionary or numpy record of register values
+         """
+
+        # Run checks
+        if not self._checks():
+            return
+
+        # Resolve registers, skipping duplicates
+        registers, seen = [], set()
+        for name in names:
+            if name not in seen:
+                seen.add(name)
+                registers.append(self._get_register_info(name))
+
+        # Combine registers into contiguous memory areas and read them
+        values, offsets = np.empty(0, dtype = np.uint32), []
+        if len(registers) > 0:
+            addresses, counts, offsets = coalesce_areas([(reg['address'], reg['size']) for reg in registers])
+            values = call_read_address_batch(self.id, addresses, counts)
+            self._logger.debug(self.log("Called read_registers"))
+            if values is Error.Failure:
+                raise BoardError("Failed to read_registers on board")
+
+        # Extract register values, applying bitmask and shift
+        result = { }
+        for reg, offset in zip(registers, offsets):
+            vals = (values[offset : offset + reg['size']] & np.uint32(reg['bitmask'])) >> \
+                   np.uint32(bitmask_shift(reg['bitmask']))
+            result[reg['name']] = int(vals[0]) if reg['size'] == 1 and not as_record else vals
+
+        if not as_record:
+            return result
+
+        # Place values in numpy record
+        record = np.zeros((), dtype = [(reg['name'], np.uint32) if reg['size'] == 1
+                                       else (reg['name'], np.uint32, (reg['size'],)) for reg in registers])
+        for reg in registers:
+            record[reg['name']] = result[reg['name']]
+        return record
+
+    def write_registers(self, values):
+        """ Write multiple registers in a single batch. Registers which do not span a
+            full word are merged with the word's current value, read in one batch.
+            If a batch is in progress the writes are added to it
+         :param values: Dictionary of register name, values pairs
+         """
+
+        # Run checks
+        if not self._checks():
+            return
+
+        # Split register values into words
+        writes = []
+        for name, value in values.iteritems():
+            reg = self._get_register_info(name)
+            vals = wrap_write_values(value)
+            if vals is None or vals.size > reg['size']:
+                raise LibraryError("Invalid values for register %s" % name)
+            writes.extend([(reg['address'] + i * 4, reg['bitmask'], int(v)) for i, v in enumerate(vals)])
+
+        # Add to current batch or write immediately
+        if self._batch is not None:
+            self._batch.add(writes)
+        else:
+            self._commit_writes(writes)
+            self._logger.debug(self.log("Called write_registers"))
+
+    def batch(self, use_opcodes = False):
+        """ Collect register writes performed through handles, item access and
+            write_registers, and commit them when the with block exits. All writes
+            to the same word are merged, such that each word is read and written once.
+            Reads within the block return values from before the batch.
+            Usage: with tpm.batch(): ...
+         :param use_opcodes: Merge partially written words on the board using the
+                             bit write opcode, one atomic request per word, instead
+                             of reading them
+         :return: RegisterBatch
+         """
+        return RegisterBatch(self, use_opcodes)
+
+    def _commit_writes(self, writes, use_opcodes = False):
+        """ Write a list of word writes to the board in a single batch
+         :param writes: List of (address, bitmask, value) tuples, applied in order.
+                        Values are shifted into place according to their bitmask
+         :param use_opcodes: Merge partially written words on the board
+         """
+
+        # Combine writes to the same word
+        words, masks = { }, { }
+        for address, bitmask, v in writes:
+            shifted = (v << bitmask_shift(bitmask)) & bitmask
+            words[address] = (words.get(address, 0) & ~bitmask & 0xFFFFFFFF) | shifted
+            masks[address] = masks.get(address, 0) | bitmask
+
+        # Words which are only partially written. Words which are in the shadow
+        # cache are merged with their cached value
+        cache = self._get_cache()
+        partial = []
+        for address in sorted(words.keys()):
+            if masks[address] == 0xFFFFFFFF:
+                continue
+            current = cache.get(address) if cache is not None else None
+            if current is not None:
+                words[address] |= current & ~masks[address] & 0xFFFFFFFF
+                masks[address] = 0xFFFFFFFF
+            else:
+                partial.append(address)
+
+        # Merge partial words on the board
+        if use_opcodes and len(partial) > 0:
+            err = call_write_address_masked(self.id, partial, [masks[address] for address in partial],
+                                            [words[address] for address in partial])
+            if err != Error.Success:
+                raise BoardError("Failed to write partial words on board")
+            for address in partial:
+                del words[address]
+                if cache is not None:
+                    cache.invalidate(address)
+
+        # Otherwise read the current value of partial words and merge
+        elif len(partial) > 0:
+            addresses, counts, offsets = coalesce_areas([(address, 1) for address in partial])
+            current = call_read_address_batch(self.id, addresses, counts)
+            if current is Error.Failure:
+                raise BoardError("Failed to read registers for write_registers on board")
+            for address, offset in zip(partial, offsets):
+                words[address] |= int(current[offset]) & ~masks[address] & 0xFFFFFFFF
+
+        # Write all words in a single batch
+        if len(words) == 0:
+            return
+        ordered = sorted(words.keys())
+        addresses, counts, offsets = coalesce_areas([(address, 1) for address in ordered])
+        err = call_write_address_batch(self.id, addresses, counts, [words[address] for address in ordered])
+        if err == Error.Failure:
+            raise BoardError("Failed to write_registers on board")
+
+        # Update shadow cache
+        if cache is not None:
+            for address in ordered:
+                cache.put(address, words[address])
+
+    def set_window_size(self, window):
+        """ Set the number of requests which can be in flight when a read or write
+            is split up into multiple packets. A window of 1 issues one request at a time
+         :param window: Number of outstanding requests
+         """
+
+        # Call function and return
+        err = call_set_window_size(self.id, window)
+        self._logger.debug(self.log("Called set_window_size"))
+        if err == Error.Failure:
+            raise BoardError("Failed to set window size %d on board" % window)
+        elif err == Error.NotImplemented:
+            raise LibraryError("Window size not supported by board protocol")
+
     def read_device(self, device, address):
         """" Get device value
          :param device: SPI Device to read from
@@ -460,6 +942,40 @@ class FPGABoard(object):
         if ret == Error.Failure:
             raise BoardError("Failed to write_device %s, %s on board" % (device, hex(address)))
 
+    def execute_device_transactions(self, transactions):
+        """ Issue a list of SPI transactions, which are executed in order without
+            polling the SPI controller from python between transactions
+        :param transactions: List of (device, address, operation, value) tuples, where
+                             operation is SPIOperation.Read or SPIOperation.Write. Value
+                             can be omitted for reads
+        :return: List of values, one per transaction, read values for reads
+        """
+
+        # Check transactions and fill in missing values
+        requests = []
+        for transaction in transactions:
+            device, address, op, value = (tuple(transaction) + (None,))[:4]
+            if device not in self._deviceList:
+                raise LibraryError("Device %s for execute_device_transactions not found" % device)
+            if type(op) is not SPIOperation:
+                raise LibraryError("Operation for execute_device_transactions should be of type SPIOperation")
+            if op == SPIOperation.Write and value is None:
+                raise LibraryError("No value specified for write to device %s, %s" % (device, hex(address)))
+            requests.append((device, address, op, value))
+
+        # Call function
+        err, values = call_execute_device_transactions(self.id, requests)
+        self._logger.debug(self.log("Called execute_device_transactions"))
+
+        # Report first transaction which failed
+        if err != Error.Success:
+            for (device, address, op, value), result in zip(requests, values):
+                if result is None:
+                    raise BoardError("Failed to execute SPI transaction on %s, %s on board" % (device, hex(address)))
+            raise BoardError("Failed to execute SPI transactions on board")
+
+        return values
+
     def list_register_names(self):
         """ Print list of register names """
 
@@ -497,10 +1013,12 @@ class FPGABoard(object):
         for k in self._deviceList:
             print k
 
-    def find_register(self, string, display = False):
+    def find_register(self, string, display = False, glob = False):
         """ Return register information for provided search string
          :param string: Regular expression to search against
          :param display: True to output result to console
+         :param glob: True to match string as a shell-style wildcard pattern (such as
+                      board.regfile.*) against whole register names
          :return: List of found registers
          """
         
@@ -508,48 +1026,55 @@ class FPGABoard(object):
         if not self._checks():
             return
 
-        # Go through all registers and store the name of registers
-        # which generate a match
-        matches = []
-        for k, v in self._registerList.iteritems():
-            if re.search(string, k) is not None:
-                matches.append(v)
+        # Look up matching names in the register list's search index
+        matches = [self._registerList[name] for name in self._registerList.search_index().search(string, glob = glob)]
 
         # Display to screen if required
         if display:
-            string = "\n"
-            for v in sorted(matches, key = lambda l : l['name']):
-                string += '%s:\n%s\n'            % (v['name'], '-' * len(v['name']))
-                string += 'Address:\t%s\n'       % (hex(v['address']))
-                string += 'Type:\t\t%s\n'        % str(v['type'])
-                string += 'Device:\t\t%s\n'      % str(v['device'])
-                string += 'Permission:\t%s\n'    % str(v['permission'])
-                string += 'Bitmask:\t0x%X\n'     % v['bitmask']
-                string += 'Bits:\t\t%d\n'        % v['bits']
-                string += 'Size:\t\t%d\n'        % v['size']
-                string += 'Description:\t%s\n\n' % v['description']
+            self._display_registers(matches)
 
-            print string
+        # Return matches
+        return matches
+
+    def find_component(self, path, display = False):
+        """ Return register information for all registers within a component
+         :param path: Dotted component path, such as fpga1.jesd
+         :param display: True to output result to console
+         :return: List of found registers
+         """
+
+        # Run checks
+        if not self._checks():
+            return
+
+        # Look up registers within path
+        matches = [self._registerList[name] for name in self._registerList.search_index().component(path)]
+
+        # Display to screen if required
+        if display:
+            self._display_registers(matches)
 
         # Return matches
         return matches
 
-    def find_device(self, string, display = False):
+    def find_device(self, string, display = False, glob = False):
         """ Return SPI device information for provided search string
-         :param string: Regular expression to search against
+         :param string: Regular expression to match against the start of device names
          :param display: True to output result to console
+         :param glob: True to match string as a shell-style wildcard pattern against whole device names
          :return: List of found devices
          """
 
         # Run check
-        if not self._check():
+        if not self._checks():
             return
 
-        # Loop over all devices
-        matches = []
-        for k, v in self._deviceList:
-            if re.match(string, k) is not None:
-                matches.append(v)
+        # Create search index over devices if required
+        if self._device_index is None:
+            self._device_index = NameIndex(self.get_device_list().keys())
+
+        # Look up matching devices
+        matches = [self._deviceList[name] for name in self._device_index.search(string, anchored = True, glob = glob)]
 
         # Display to screen if required
         if display:
@@ -561,6 +1086,25 @@ class FPGABoard(object):
         # Return matches
         return matches
 
+    @staticmethod
+    def _display_registers(registers):
+        """ Print register information to console
+         :param registers: List of register information dictionaries
+         """
+        string = "\n"
+        for v in sorted(registers, key = lambda l : l['name']):
+            string += '%s:\n%s\n'            % (v['name'], '-' * len(v['name']))
+            string += 'Address:\t%s\n'       % (hex(v['address']))
+            string += 'Type:\t\t%s\n'        % str(v['type'])
+            string += 'Device:\t\t%s\n'      % str(v['device'])
+            string += 'Permission:\t%s\n'    % str(v['permission'])
+            string += 'Bitmask:\t0x%X\n'     % v['bitmask']
+            string += 'Bits:\t\t%d\n'        % v['bits']
+            string += 'Size:\t\t%d\n'        % v['size']
+            string += 'Description:\t%s\n\n' % v['description']
+
+        print string
+
     def __len__(self):
         """ Override __len__, return number of registers """
         if self._registerList is not None:
@@ -590,6 +1134,75 @@ class FPGABoard(object):
         """
         return "%s (%s)" % (string, self._string_id)
 
+    def register(self, name):
+        """ Get a handle to a register, which reads and writes the register by
+            memory address without looking it up on every access
+        :param name: Register name, including device
+        :return: RegisterHandle
+        """
+
+        # Run checks
+        if not self._checks():
+            return
+
+        # Create handle if it does not exist yet
+        if name not in self._register_handles:
+            self._register_handles[name] = RegisterHandle(self, name)
+        return self._register_handles[name]
+
+    def enable_cache(self, ttl = 0.0):
+        """ Enable shadow register cache. Single word registers are cached according to
+            their memory map attributes: read-only and volatile registers are never
+            cached, non-volatile registers are cached when written or read, and others
+            are cached for ttl seconds. Cached values are used when reading registers
+            through handles and item access, and when merging partial register writes
+         :param ttl: Time in seconds for which registers without a volatility attribute are cached
+         """
+        self._cache = ShadowCache(ttl)
+
+    def disable_cache(self):
+        """ Disable shadow register cache """
+        self._cache = None
+
+    def set_cache_policy(self, name, policy):
+        """ Override cache policy for a register
+         :param name: Register name, including device
+         :param policy: CachePolicy
+         """
+        if type(policy) is not CachePolicy:
+            raise LibraryError("Policy argument for set_cache_policy should be of type CachePolicy")
+        self._cache_overrides[name] = policy
+        if self._cache is not None:
+            self._cache.reset()
+
+    def _get_cache(self):
+        """ Get shadow cache, assigning word policies if required
+         :return: ShadowCache, None if cache is disabled
+         """
+        if self._cache is not None and not self._cache.configured():
+            self._checks()
+            self._cache.configure(self._registerList, self._cache_overrides)
+        return self._cache
+
+    def _invalidate_registers(self):
+        """ Discard register information and handles, called when firmware changes """
+        self._registerList = None
+        self._deviceList = None
+        self._device_index = None
+        self._register_handles = { }
+        self._firmware_generation += 1
+        if self._cache is not None:
+            self._cache.reset()
+
+    def _get_register_info(self, name):
+        """ Get register information from register list
+        :param name: Register name, including device
+        :return: Register information dictionary
+        """
+        if not self._registerList.has_key(name):
+            raise LibraryError("Register '%s' not found" % name)
+        return self._registerList[name]
+
     @staticmethod
     def _get_device(name):
         """ Extract device name from provided register name, if present """
@@ -651,12 +1264,8 @@ class TPM(FPGABoard):
                 raise LibraryError("A device name and address need to be specified for writing to SPI devices")
 
         elif type(key) is str:
-            # Check if a device is specified in the register name
-            device = self._get_device(key)
             if self._registerList.has_key(key):
-                reg = self._registerList[key]
-                key = '.'.join(key.split('.')[1:])
-                return self.read_register(device, key, reg['size'])
+                return self.register(key).read()
         else:
             raise LibraryError("Unrecognised key type, must be register name or memory address")
 
@@ -682,11 +1291,8 @@ class TPM(FPGABoard):
                 raise LibraryError("A device name and address need to be specified for writing to SPI devices")
 
         elif type(key) is str:      
-            # Check if device is specified in the register name
-            device = self._get_device(key)
             if self._registerList.has_key(key):
-                key = '.'.join(key.split('.')[1:])
-                return self.write_register(device, key, value)
+                return self.register(key).write(value)
         else:
             raise LibraryError("Unrecognised key type, must be register name or memory address")
 
@@ -757,7 +1363,11 @@ class Roach(FPGABoard):
 
     def get_register_list(self):
         """ Add functionality to getRegisterList in order to map register names 
-            as python attributes """
+            as python attributes. The renamed list is kept until firmware is loaded """
+
+        # Register list has already been acquired and renamed
+        if self._registerList is not None:
+            return self._registerList
 
         # Populate register list
         super(Roach, self).get_register_list()
@@ -769,12 +1379,7 @@ class Roach(FPGABoard):
         # The super class will prepend the device type to the register name.
         # Since everyting on the roach is controlled by a single entity,
         # we don't need this. Remove prepended device type
-        newRegList = { }
-        for k in self._registerList.keys():
-            newKey = k.replace("fpga1.", "")
-            newRegList[newKey] = self._registerList[k]
-            newRegList[newKey]['name'] = newKey
-        self._registerList = newRegList
+        self._registerList = self._registerList.renamed(lambda name: name.replace("fpga1.", ""))
 
         return self._registerList
 
@@ -782,9 +1387,13 @@ class Roach(FPGABoard):
         """ Roach helper for getFirmwareList """
         return super(Roach, self).get_firmware_list(Device.FPGA_1)
 
-    def read_register(self, register, n = 1, offset = 0):
+    def read_register(self, register, n = 1, offset = 0, as_array = False):
         """ Roach helper for readRegister """
-        return super(Roach, self).read_register(Device.FPGA_1, register, n, offset)
+        return super(Roach, self).read_register(Device.FPGA_1, register, n, offset, as_array)
+
+    def read_register_into(self, register, buf, offset = 0):
+        """ Roach helper for readRegisterInto """
+        return super(Roach, self).read_register_into(Device.FPGA_1, register, buf, offset)
 
     def write_register(self, register, values, offset = 0):
         """ Roach helper for writeRegister"""
@@ -798,14 +1407,38 @@ class Roach(FPGABoard):
        """ Roach helpder for loadFirmware """
        return super(Roach, self).loadFirmware(Device.FPGA_1, boffile)
 
-    def read_address(self, address, n = 1):
+    def read_address(self, address, n = 1, as_array = False):
         """ Roach helper for readAddress """
         print "Read memory address not supported for ROACH"
 
+    def read_address_into(self, address, buf):
+        """ Roach helper for readAddressInto """
+        print "Read memory address not supported for ROACH"
+
     def write_address(self, address, values):
         """ Roach helper for writeAddress """
         print "Write memory address not supported for ROACH"
 
+    def register(self, name):
+        """ Roach helper for register """
+        print "Register handles not supported for ROACH"
+
+    def read_registers(self, names, as_record = False):
+        """ Roach helper for readRegisters """
+        print "Read registers not supported for ROACH"
+
+    def write_registers(self, values):
+        """ Roach helper for writeRegisters """
+        print "Write registers not supported for ROACH"
+
+    def batch(self, use_opcodes = False):
+        """ Roach helper for batch """
+        print "Register batches not supported for ROACH"
+
+    def enable_cache(self, ttl = 0.0):
+        """ Roach helper for enableCache """
+        print "Shadow register cache not supported for ROACH"
+
     def write_device(self, device, address, value):
         """ Roach helper for writeDevice """
         print "Write device is not supported for ROACH"
@@ -814,6 +1447,10 @@ class Roach(FPGABoard):
         """ Roach helper for readDevice """
         print "Read device is not supported for ROACH"
 
+    def execute_device_transactions(self, transactions):
+        """ Roach helper for executeDeviceTransactions """
+        print "Execute device transactions is not supported for ROACH"
+
     def __getitem__(self, key):
         """ Override __getitem__, return value from board """
 
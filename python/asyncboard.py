@@ -0,0 +1,264 @@
+from accesslayer import *
+from multiprocessing.pool import ThreadPool
+from multiprocessing import TimeoutError
+import collections
+import threading
+
+# ------------------------- Shared worker pool ---------------------------
+
+# Calls into the access layer are executed on a thread pool shared by all
+# asynchronous boards. ctypes releases the GIL for the duration of a library
+# call, so requests to different boards are processed concurrently
+
+# Default number of worker threads
+DEFAULT_WORKERS = 32
+
+_pool = None
+_pool_lock = threading.Lock()
+
+def get_pool(workers = None):
+    """ Get the shared worker pool, creating it if required
+    :param workers: Number of worker threads, only used when the pool is created
+    :return: ThreadPool instance
+    """
+    global _pool
+
+    with _pool_lock:
+        if _pool is None:
+            _pool = ThreadPool(workers or DEFAULT_WORKERS)
+        return _pool
+
+def wait_all(results, timeout = None, return_exceptions = False):
+    """ Wait for a list of pending requests to complete
+    :param results: List of AsyncResult objects returned by asynchronous boards
+    :param timeout: Maximum time in seconds to wait for each request
+    :param return_exceptions: If True, failed requests return their exception
+                              instead of raising it
+    :return: List of request results, in the same order as results
+    """
+
+    values = []
+    for result in results:
+        try:
+            values.append(result.get(timeout))
+        except Exception as e:
+            if not return_exceptions:
+                raise
+            values.append(e)
+    return values
+
+# ---------------------------- Board request ------------------------------
+class _Request(object):
+    """ Request queued on an asynchronous board, with the same interface as
+        multiprocessing's AsyncResult """
+
+    def __init__(self, func, args, kwargs, callback):
+        """ Class constructor
+        :param func: Board function to call
+        :param args: Positional arguments for func
+        :param kwargs: Keyword arguments for func
+        :param callback: Optional function called with the result when the request succeeds
+        """
+        self._func     = func
+        self._args     = args
+        self._kwargs   = kwargs
+        self._callback = callback
+        self._event    = threading.Event()
+        self._success  = None
+        self._value    = None
+
+    def _run(self):
+        """ Call board function and store its result. The callback is called
+            before the request is marked as ready, as with AsyncResult """
+        try:
+            self._value, self._success = self._func(*self._args, **self._kwargs), True
+        except Exception as e:
+            self._value, self._success = e, False
+
+        try:
+            if self._callback is not None and self._success:
+                self._callback(self._value)
+        finally:
+            self._func = self._args = self._kwargs = self._callback = None
+            self._event.set()
+
+    def ready(self):
+        """ Check whether the request has completed """
+        return self._event.is_set()
+
+    def successful(self):
+        """ Check whether the request completed without raising an exception """
+        assert self.ready()
+        return self._success
+
+    def wait(self, timeout = None):
+        """ Wait for the request to complete
+        :param timeout: Maximum time in seconds to wait
+        """
+        self._event.wait(timeout)
+
+    def get(self, timeout = None):
+        """ Get request result
+        :param timeout: Maximum time in seconds to wait
+        :return: Value returned by the board function, whose exception is raised if it failed
+        """
+        self.wait(timeout)
+        if not self.ready():
+            raise TimeoutError
+        if self._success:
+            return self._value
+        raise self._value
+
+# ----------------------------- Async board -------------------------------
+class AsyncFPGABoard(object):
+    """ Asynchronous wrapper for FPGABoard. Blocking calls are submitted to the
+        shared worker pool and return an AsyncResult, whose get(timeout) method
+        returns the call's value or raises its exception. Requests to the same
+        board are serialised, requests to different boards run concurrently.
+        Each board keeps its own queue, of which only the head is submitted
+        to the pool, such that a slow board does not tie up pool workers """
+
+    # Board class being wrapped
+    _board_class = FPGABoard
+
+    def __init__(self, pool = None, **kwargs):
+        """ Class constructor
+        :param pool: Thread pool to submit requests to, the shared pool is used if not specified
+        :param kwargs: Arguments passed on to the wrapped board class. If ip and port
+                       are provided, the board is connected asynchronously and the
+                       AsyncResult is stored in self.connected
+        """
+
+        # Requests to the same board are queued and issued one at a time
+        self._lock    = threading.Lock()
+        self._queue   = collections.deque()
+        self._running = False
+        self._pool    = pool if pool is not None else get_pool()
+
+        # Create board instance. Connection is performed asynchronously
+        # so remove ip and port from arguments
+        ip   = kwargs.pop('ip', None)
+        port = kwargs.pop('port', None)
+        self.board = self._board_class(**kwargs)
+
+        # Result of the initial connection, if ip and port were provided. Wait on
+        # it before issuing requests, connection errors are raised by its get()
+        self.connected = None
+        if ip is not None and port is not None:
+            self.connected = self.connect(ip, port)
+
+    def _run(self):
+        """ Run the request at the head of the board's queue on a pool worker,
+            then submit the next request, if any, to the back of the pool """
+        with self._lock:
+            request = self._queue.popleft()
+        try:
+            request._run()
+        finally:
+            with self._lock:
+                self._running = len(self._queue) > 0
+                running = self._running
+            if running:
+                self._pool.apply_async(self._run)
+
+    def _submit(self, func, *args, **kwargs):
+        """ Queue board function, submitting it to the worker pool if the board is idle
+        :param func: Board function to call
+        :param callback: Optional function called with the result when the request succeeds
+        :return: AsyncResult
+        """
+        callback = kwargs.pop('callback', None)
+        request = _Request(func, args, kwargs, callback)
+        with self._lock:
+            self._queue.append(request)
+            if self._running:
+                return request
+            self._running = True
+        self._pool.apply_async(self._run)
+        return request
+
+    def connect(self, ip, port, callback = None):
+        """ Connect to board
+        :param ip: Board IP
+        :param port: Port to connect to
+        :return: AsyncResult
+        """
+        return self._submit(self.board.connect, ip, port, callback = callback)
+
+    def disconnect(self, callback = None):
+        """ Disconnect from board
+        :return: AsyncResult
+        """
+        return self._submit(self.board.disconnect, callback = callback)
+
+    def initialise(self, config, callback = None):
+        """ Initialise board from configuration dictionary
+        :param config: Configuration dictionary
+        :return: AsyncResult
+        """
+        return self._submit(self.board.initialise, config, callback = callback)
+
+    def get_status(self, callback = None):
+        """ Get board status
+        :return: AsyncResult
+        """
+        return self._submit(self.board.get_status, callback = callback)
+
+    def load_firmware(self, *args, **kwargs):
+        """ Load firmware on board, completes once firmware is loaded
+        :param args: Arguments for the wrapped board's load_firmware_blocking
+        :return: AsyncResult
+        """
+        return self._submit(self.board.load_firmware_blocking, *args, **kwargs)
+
+    def read_register(self, *args, **kwargs):
+        """ Read register value, see FPGABoard.read_register
+        :return: AsyncResult
+        """
+        return self._submit(self.board.read_register, *args, **kwargs)
+
+    def write_register(self, *args, **kwargs):
+        """ Write register value, see FPGABoard.write_register
+        :return: AsyncResult
+        """
+        return self._submit(self.board.write_register, *args, **kwargs)
+
+    def read_address(self, *args, **kwargs):
+        """ Read memory address, see FPGABoard.read_address
+        :return: AsyncResult
+        """
+        return self._submit(self.board.read_address, *args, **kwargs)
+
+    def write_address(self, *args, **kwargs):
+        """ Write memory address, see FPGABoard.write_address
+        :return: AsyncResult
+        """
+        return self._submit(self.board.write_address, *args, **kwargs)
+
+    def read_device(self, *args, **kwargs):
+        """ Read SPI device, see FPGABoard.read_device
+        :return: AsyncResult
+        """
+        return self._submit(self.board.read_device, *args, **kwargs)
+
+    def write_device(self, *args, **kwargs):
+        """ Write SPI device, see FPGABoard.write_device
+        :return: AsyncResult
+        """
+        return self._submit(self.board.write_device, *args, **kwargs)
+
+    def execute_device_transactions(self, *args, **kwargs):
+        """ Issue list of SPI transactions, see FPGABoard.execute_device_transactions
+        :return: AsyncResult
+        """
+        return self._submit(self.board.execute_device_transactions, *args, **kwargs)
+
+# ================================== TPM Board ======================================
+class AsyncTPM(AsyncFPGABoard):
+    """ Asynchronous wrapper for TPM """
+    _board_class = TPM
+
+# ================================= ROACH Board ====================================
+class AsyncRoach(AsyncFPGABoard):
+    """ Asynchronous wrapper for Roach """
+    _board_class = Roach
@@ -63,6 +63,23 @@ class Permission(Enum):
     Write     = 2
     ReadWrite = 3
 
+class Volatility(Enum):
+    """ Volatility enumeration """
+    Unknown     = 0
+    Volatile    = 1
+    NonVolatile = 2
+
+class SPIOperation(Enum):
+    """ SPI transaction operation enumeration """
+    Read  = 1
+    Write = 2
+
+class CachePolicy(Enum):
+    """ Shadow cache policy enumeration """
+    Never        = 0
+    TTL          = 1
+    WriteThrough = 2
+
 # --------------- Structures --------------------------
 class Values(object):
     """ Class representing VALUES struct """
@@ -107,6 +124,7 @@ class RegisterInfoStruct(ctypes.Structure):
         ('type',        ctypes.c_int),
         ('device',      ctypes.c_int),
         ('permission',  ctypes.c_int),
+        ('volatility',  ctypes.c_int),
         ('bitmask',     ctypes.c_uint32),
         ('bits',        ctypes.c_uint32),
         ('value',       ctypes.c_uint32),
@@ -122,6 +140,16 @@ class SPIDeviceInfoStruct(ctypes.Structure):
         ('spi_en',   ctypes.c_uint32)
     ]
 
+class SPITransactionStruct(ctypes.Structure):
+    """ Class representing SPI_TRANSACTION struct """
+    _fields_ = [
+        ('device',   ctypes.c_char_p),
+        ('address',  ctypes.c_uint32),
+        ('op',       ctypes.c_int),
+        ('value',    ctypes.c_uint32),
+        ('error',    ctypes.c_int)
+    ]
+
 # ------------------- Exceptions -----------------------
 class BoardError(Exception):
     """ Define an exception which occurs when an operation occuring
@@ -1,6 +1,9 @@
 from accesslayer import *
 from definitions import *
+from sequencer import Sequence
+from multiprocessing.pool import ThreadPool
 import xml.etree.ElementTree as ET
+import time
 
 # ----------------------- Config Handler --------------------
 class ConfigHandler(object):
@@ -115,9 +118,11 @@ class ConfigHandler(object):
 class Instrument(object):
     """ Instrument class """
 
-    def __init__(self, config_file):
+    def __init__(self, config_file, workers = None):
         """ Initialise instrument
         :param config_file: Configuration file
+        :param workers: Number of boards to initialise and check concurrently. Overrides
+                        the workers attribute of the initialisation tag in the configuration
         """
 
         # Set instrument status
@@ -136,18 +141,61 @@ class Instrument(object):
         else:
             self._logger = logging.getLogger('dummy')
 
-        # Create board and initialise instances
+        # Number of boards to process concurrently, one at a time by default
+        self._workers = 1
+        if workers is not None:
+            self._workers = int(workers)
+        elif 'initialisation' in self._config.instrument.keys() and \
+             'workers' in self._config.instrument['initialisation']:
+            self._workers = int(self._config.instrument['initialisation']['workers'])
+
+        # Create board instances
         self.boards = { }
         for k, v in self._config.boards.iteritems():
             self.boards[k] = eval(v['board_class'])()
-            self.boards[k].initialise(v)
-            self._logger.info("Initialised board %s, has internal id %d" % (k, self.boards[k].id))
+
+        # Initialise boards. A board which fails to initialise does not stop the others
+        self.failed_boards = { }
+        self.initialisation_report = self._run_on_boards(lambda k, board: board.initialise(self._config.boards[k]))
+        for k, report in self.initialisation_report.iteritems():
+            if report['error'] is None:
+                self._logger.info("Initialised board %s in %.2fs, has internal id %d" % (k, report['time'], self.boards[k].id))
+            else:
+                self._logger.error("Failed to initialise board %s after %.2fs: %s" % (k, report['time'], report['error']))
+                self.failed_boards[k] = self.boards.pop(k)
 
         # Check status
         self.status_check()
 
         self._logger.info("Initialised intrument")
 
+    def _run_on_boards(self, func):
+        """ Run a function on all boards, concurrently if more than one worker is configured
+        :param func: Function to call, with board id and board instance as arguments
+        :return: Dictionary containing the result, time taken and error (if any) for each board
+        """
+
+        def run(key):
+            start = time.time()
+            try:
+                result, error = func(key, self.boards[key]), None
+            except Exception as e:
+                result, error = None, e
+            return key, { 'result' : result, 'time' : time.time() - start, 'error' : error }
+
+        # Process boards one at a time if no concurrency is required
+        keys = self.boards.keys()
+        if self._workers <= 1 or len(keys) <= 1:
+            return dict(map(run, keys))
+
+        # Otherwise, distribute boards over a pool of threads
+        pool = ThreadPool(min(self._workers, len(keys)))
+        try:
+            return dict(pool.map(run, keys))
+        finally:
+            pool.close()
+            pool.join()
+
     def status_check(self):
         """ Check instrument status
         :return: Status
@@ -155,8 +203,16 @@ class Instrument(object):
 
         # Check status of all boards
         status = { }
-        for k, v in self.boards.iteritems():
-            status[k] = self.boards[k].status_check()
+        for k, report in self._run_on_boards(lambda k, board: board.status_check()).iteritems():
+            if report['error'] is None:
+                status[k] = report['result']
+            else:
+                self._logger.error("Status check for board %s failed: %s" % (k, report['error']))
+                status[k] = Status.BoardError
+
+        # Boards which failed to initialise are in error
+        for k in self.failed_boards.keys():
+            status[k] = Status.BoardError
 
         # Set instrument status
         stat = set([v for k, v in status.iteritems()]) - set([Status.OK])
@@ -167,6 +223,34 @@ class Instrument(object):
 
         return status
 
+    def run_sequence(self, filename, **parameters):
+        """ Run a bring-up sequence on all boards, concurrently if more than one worker is configured
+        :param filename: Sequence file
+        :param parameters: Values for sequence parameters
+        :return: Dictionary containing the per-step report (see Sequence.run), time taken
+                 and error (if any) for each board
+        """
+
+        # Load sequence once, it is shared by all boards
+        sequence = Sequence(filename)
+
+        reports = self._run_on_boards(lambda k, board: sequence.run(board, **dict(parameters)))
+        for k, report in reports.iteritems():
+            if report['error'] is not None:
+                self._logger.error("Sequence %s failed on board %s after %.2fs: %s" % (sequence.name, k, report['time'], report['error']))
+                continue
+
+            # Log per-step timing and any failed checks
+            for step in report['result']:
+                self._logger.info("Board %s: step %s took %.3fs (%d SPI transactions)" %
+                                  (k, step['step'], step['time'], step['transactions']))
+                for device, address, value in step['failed_checks']:
+                    self._logger.warn("Board %s: step %s, register %s on %s has unexpected value %s" %
+                                      (k, step['step'], hex(address), device, hex(value)))
+            self._logger.info("Sequence %s completed on board %s in %.2fs" % (sequence.name, k, report['time']))
+
+        return reports
+
     def configure_logging(self, log_filename = None, log_level = logging.DEBUG):
         """ Basic logging configuration
         :param log_filename: Log filename
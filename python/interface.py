@@ -1,11 +1,20 @@
 from definitions import *
+import numpy as np
+from fnmatch import fnmatchcase
+import bisect
+import numbers
 import ctypes
+import re
 
 # ------------- Wrap library calls ---------------------------
 
 # Global store for interface object
 library = None
 
+# Register lists, keyed by memory map checksum. Boards running the same
+# firmware share the same register list
+_register_lists = { }
+
 def initialise_library(filepath = None):
     """ Wrap access library shared library functionality in ctypes
     :param filepath: Path to library path
@@ -46,6 +55,14 @@ def initialise_library(filepath = None):
     library.loadFirmware.argtypes =  [ctypes.c_uint32, ctypes.c_int, ctypes.c_char_p]
     library.loadFirmware.restype = ctypes.c_int
 
+    # Define compileMemoryMap function
+    library.compileMemoryMap.argtypes = [ctypes.c_char_p]
+    library.compileMemoryMap.restype = ctypes.c_int
+
+    # Define getMemoryMapChecksum function
+    library.getMemoryMapChecksum.argtypes = [ctypes.c_uint32, ctypes.POINTER(ctypes.c_uint32)]
+    library.getMemoryMapChecksum.restype = ctypes.c_int
+
     # Define getRegisterList function
     library.getRegisterList.argtypes = [ctypes.c_uint32, ctypes.POINTER(ctypes.c_int)]
     library.getRegisterList.restype = ctypes.POINTER(RegisterInfoStruct)
@@ -66,6 +83,22 @@ def initialise_library(filepath = None):
     library.writeAddress.argtypes = [ctypes.c_uint32, ctypes.c_uint32, ctypes.POINTER(ctypes.c_uint32), ctypes.c_uint32]
     library.writeAddress.restype = ctypes.c_int
 
+    # Define setWindowSize function
+    library.setWindowSize.argtypes = [ctypes.c_uint32, ctypes.c_uint32]
+    library.setWindowSize.restype = ctypes.c_int
+
+    # Define readAddressBatch function
+    library.readAddressBatch.argtypes = [ctypes.c_uint32, ctypes.POINTER(ctypes.c_uint32), ctypes.POINTER(ctypes.c_uint32), ctypes.c_uint32]
+    library.readAddressBatch.restype = ValuesStruct
+
+    # Define writeAddressBatch function
+    library.writeAddressBatch.argtypes = [ctypes.c_uint32, ctypes.POINTER(ctypes.c_uint32), ctypes.POINTER(ctypes.c_uint32), ctypes.c_uint32, ctypes.POINTER(ctypes.c_uint32)]
+    library.writeAddressBatch.restype = ctypes.c_int
+
+    # Define writeAddressMasked function
+    library.writeAddressMasked.argtypes = [ctypes.c_uint32, ctypes.POINTER(ctypes.c_uint32), ctypes.POINTER(ctypes.c_uint32), ctypes.POINTER(ctypes.c_uint32), ctypes.c_uint32]
+    library.writeAddressMasked.restype = ctypes.c_int
+
     # Define getDeviceList function
     library.getDeviceList.argtypes = [ctypes.c_uint32, ctypes.POINTER(ctypes.c_uint32)]
     library.getDeviceList.restype = ctypes.POINTER(SPIDeviceInfoStruct)
@@ -78,6 +111,10 @@ def initialise_library(filepath = None):
     library.writeDevice.argtypes = [ctypes.c_uint32, ctypes.c_char_p, ctypes.c_uint32, ctypes.c_uint32]
     library.writeDevice.restype = ctypes.c_int
 
+    # Define executeDeviceTransactions function
+    library.executeDeviceTransactions.argtypes = [ctypes.c_uint32, ctypes.POINTER(SPITransactionStruct), ctypes.c_uint32]
+    library.executeDeviceTransactions.restype = ctypes.c_int
+
     # Define getStatus function
     library.getStatus.argtype = [ctypes.c_uint32]
     library.getStatus.restype = Status
@@ -85,6 +122,215 @@ def initialise_library(filepath = None):
     # Define freeMemory function
     library.freeMemory.argtypes = [ctypes.c_void_p]
 
+# ------------- Register table ---------------------------
+
+# Numeric register information, one record per register
+register_dtype = np.dtype([('address',    np.uint32),
+                           ('size',       np.uint32),
+                           ('bitmask',    np.uint32),
+                           ('value',      np.uint32),
+                           ('type',       np.uint8),
+                           ('device',     np.uint8),
+                           ('permission', np.uint8),
+                           ('volatility', np.uint8),
+                           ('bits',       np.uint8)])
+
+# Lookup tables from library values to enumerations
+_register_types = dict([(e.value, e) for e in RegisterType])
+_devices        = dict([(e.value, e) for e in Device])
+_permissions    = dict([(e.value, e) for e in Permission])
+_volatilities   = dict([(e.value, e) for e in Volatility])
+
+# Patterns which give the same result when matched as plain strings as when evaluated
+# as regular expressions. Dots match any character, so dotted names are not literal
+_literal_pattern = re.compile(r'^\w+$')
+
+class NameIndex(object):
+    """ Search index over dotted names, such as register and SPI device names. Holds
+        a sorted name list for prefix queries, a map from each dotted path to the
+        names within it and a map from each name component to the names containing it.
+        Results are cached, the index is built once per firmware load """
+
+    # Maximum number of cached search results
+    max_cached = 1024
+
+    def __init__(self, names):
+        """ Class constructor
+        :param names: List of names
+        """
+        self._names      = sorted(names)
+        self._components = { }  # Dotted path -> names within path
+        self._tokens     = { }  # Name component -> names containing component
+        self._results    = { }  # (pattern, anchored, glob) -> names
+
+        for name in self._names:
+            parts = name.split('.')
+            for i in range(1, len(parts) + 1):
+                self._components.setdefault('.'.join(parts[:i]), []).append(name)
+            for part in set(parts):
+                self._tokens.setdefault(part, []).append(name)
+
+    def prefix(self, string):
+        """ Get names starting with string """
+        names = []
+        for i in xrange(bisect.bisect_left(self._names, string), len(self._names)):
+            if not self._names[i].startswith(string):
+                break
+            names.append(self._names[i])
+        return names
+
+    def component(self, path):
+        """ Get names within a dotted path, including the path itself """
+        return list(self._components.get(path, []))
+
+    def glob(self, pattern):
+        """ Get names matching a shell-style wildcard pattern """
+
+        # Narrow down candidates using the literal prefix of the pattern and
+        # the pattern components which do not contain wildcards
+        literal = re.split(r'[*?\[]', pattern, 1)[0]
+        candidates = self.prefix(literal) if literal else self._names
+        for part in pattern.split('.'):
+            if part and _literal_pattern.match(part) and len(self._tokens.get(part, [])) < len(candidates):
+                candidates = self._tokens.get(part, [])
+        return [name for name in candidates if fnmatchcase(name, pattern)]
+
+    def search(self, pattern, anchored = False, glob = False):
+        """ Get names matching a regular expression, with re.search semantics (or
+            re.match if anchored). Plain names are matched as substrings and ^name as
+            a prefix without evaluating the expression, which gives the same result
+        :param pattern: Search pattern
+        :param anchored: Pattern must match at the start of the name (re.match semantics)
+        :param glob: Treat pattern as a shell-style wildcard pattern matched against whole names
+        :return: List of names
+        """
+
+        key = (pattern, anchored, glob)
+        if key in self._results:
+            return list(self._results[key])
+
+        if glob:
+            names = self.glob(pattern)
+        elif _literal_pattern.match(pattern):
+            names = self.prefix(pattern) if anchored else [name for name in self._names if pattern in name]
+        elif pattern.startswith('^') and _literal_pattern.match(pattern[1:]):
+            names = self.prefix(pattern[1:])
+        else:
+            expression = re.compile(pattern)
+            match = expression.match if anchored else expression.search
+            names = [name for name in self._names if match(name) is not None]
+
+        if len(self._results) >= self.max_cached:
+            self._results = { }
+        self._results[key] = names
+        return list(names)
+
+class RegisterTable(object):
+    """ Read-only register list. Register information is stored in a structured array,
+        with one record per register, and a name to record index map. The table behaves
+        as a dictionary of register information dictionaries, which are created when a
+        register is accessed. Tables are shared by boards with the same memory map """
+
+    __slots__ = ['_names', '_index', '_records', '_descriptions', '_search_index']
+
+    def __init__(self, names, records, descriptions):
+        """ Class constructor
+        :param names: List of register names
+        :param records: Structured array of register_dtype records, one per name
+        :param descriptions: List of register descriptions, one per name
+        """
+        self._names        = names
+        self._index        = dict([(name, i) for i, name in enumerate(names)])
+        self._records      = records
+        self._descriptions = descriptions
+        self._search_index = None
+
+    def _view(self, i):
+        """ Create register information dictionary for record i """
+        record = self._records[i]
+        return { 'name'        : self._names[i],
+                 'address'     : int(record['address']),
+                 'type'        : _register_types[record['type']],
+                 'device'      : _devices[record['device']],
+                 'permission'  : _permissions[record['permission']],
+                 'volatility'  : _volatilities[record['volatility']],
+                 'size'        : int(record['size']),
+                 'bitmask'     : int(record['bitmask']),
+                 'bits'        : int(record['bits']),
+                 'value'       : int(record['value']),
+                 'description' : self._descriptions[i] }
+
+    def __getitem__(self, name):
+        return self._view(self._index[name])
+
+    def __contains__(self, name):
+        return name in self._index
+
+    def __len__(self):
+        return len(self._names)
+
+    def __iter__(self):
+        return iter(self._names)
+
+    def has_key(self, name):
+        return name in self._index
+
+    def get(self, name, default = None):
+        i = self._index.get(name)
+        return default if i is None else self._view(i)
+
+    def keys(self):
+        return list(self._names)
+
+    def iterkeys(self):
+        return iter(self._names)
+
+    def values(self):
+        return [self._view(i) for i in range(len(self._names))]
+
+    def itervalues(self):
+        for i in xrange(len(self._names)):
+            yield self._view(i)
+
+    def items(self):
+        return [(name, self._view(i)) for i, name in enumerate(self._names)]
+
+    def iteritems(self):
+        for i, name in enumerate(self._names):
+            yield name, self._view(i)
+
+    @property
+    def records(self):
+        """ Structured array with the numeric information of all registers, in the same
+            order as names. The array is shared and should not be modified """
+        return self._records
+
+    @property
+    def names(self):
+        """ List of register names, in the same order as records """
+        return self._names
+
+    def index(self, name):
+        """ Get record index of register
+        :param name: Register name
+        :return: Index into records
+        """
+        return self._index[name]
+
+    def search_index(self):
+        """ Get search index over register names, created on first use """
+        if self._search_index is None:
+            self._search_index = NameIndex(self._names)
+        return self._search_index
+
+    def renamed(self, func):
+        """ Create a table with the same registers under different names. Register
+            information is shared with this table
+        :param func: Function mapping a register name to its new name
+        :return: RegisterTable
+        """
+        return RegisterTable([func(name) for name in self._names], self._records, self._descriptions)
+
 # ------------- Function wrappers to library ---------------------------
 
 def call_connect_board(board_type, ip, port):
@@ -161,10 +407,15 @@ def call_load_firmware(board_id, device, filepath):
 def call_get_register_list(board_id):
     """ Get list of available registers on board
     :param board_id: ID of board to query
-    :return: List of registers
+    :return: RegisterTable
     """
     global library
 
+    # Check if register list for this memory map has already been generated
+    checksum = call_get_memory_map_checksum(board_id)
+    if checksum is not None and checksum in _register_lists:
+        return _register_lists[checksum]
+
     # Create an integer and extract it's address
     INTP = ctypes.POINTER(ctypes.c_int)
     num  = ctypes.c_int(0)
@@ -175,31 +426,51 @@ def call_get_register_list(board_id):
     registers = library.getRegisterList(board_id, ptr)
 
     # Create device map for register names
-    names = { Device.Board : "board", Device.FPGA_1 : "fpga1", Device.FPGA_2 : "fpga2" }
+    prefixes = { Device.Board.value : "board", Device.FPGA_1.value : "fpga1", Device.FPGA_2.value : "fpga2" }
 
-    # Wrap register formats and return
-    registerList = { }
+    # Copy register information into table
+    names, descriptions = [], []
+    records = np.zeros(num.value, dtype = register_dtype)
     for i in range(num.value):
-        dev = Device(registers[i].device)
-        reg = {
-            'name'        : '%s.%s' % (names[dev], registers[i].name),
-            'address'     : registers[i].address,
-            'type'        : RegisterType(registers[i].type),
-            'device'      : dev,
-            'permission'  : Permission(registers[i].permission),
-            'size'        : registers[i].size,
-            'bitmask'     : registers[i].bitmask,
-            'bits'        : registers[i].bits,
-            'value'       : registers[i].value,
-            'description' : registers[i].description
-        }
-        registerList["%s.%s" % (names[dev], registers[i].name)] = reg
+        register = registers[i]
+        names.append('%s.%s' % (prefixes[register.device], register.name))
+        descriptions.append(register.description)
+        records[i] = (register.address, register.size, register.bitmask, register.value, register.type,
+                      register.device, register.permission, register.volatility, register.bits)
+    registerList = RegisterTable(names, records, descriptions)
 
     # Free up memory on board
     library.freeMemory(registers)
 
+    # Store register list for other boards with the same memory map
+    if checksum is not None:
+        _register_lists[checksum] = registerList
+
     return registerList
 
+def call_get_memory_map_checksum(board_id):
+    """ Get checksum of memory map loaded on board
+    :param board_id: ID of board to query
+    :return: Checksum, None if board has no memory map
+    """
+    global library
+
+    # Call function
+    checksum = ctypes.c_uint32(0)
+    if library.getMemoryMapChecksum(board_id, ctypes.byref(checksum)) != Error.Success.value:
+        return None
+    return checksum.value
+
+def call_compile_memory_map(filepath):
+    """ Compile memory map into its binary cache file
+    :param filepath: Path to memory map XML file
+    :return: Success or Failure
+    """
+    global library
+
+    # Call function
+    return Error(library.compileMemoryMap(filepath))
+
 def call_get_device_list(board_id):
     """
     :param board_id: ID of board to query
@@ -231,6 +502,115 @@ def call_get_device_list(board_id):
 
     return deviceList
 
+def wrap_values(values, n = 1, as_array = False, out = None):
+    """ Convert values returned by the library and free the memory allocated for them
+    :param values: ValuesStruct returned by the library
+    :param n: Number of words in values
+    :param as_array: Return values as a numpy uint32 array
+    :param out: Pre-allocated numpy uint32 array to copy values into
+    :return: Single value, list of values or numpy array
+    """
+    global library
+
+    try:
+        # Copy into caller-supplied array
+        if out is not None:
+            ctypes.memmove(out.ctypes.data, values.values, n * ctypes.sizeof(ctypes.c_uint32))
+            return out
+
+        # Copy into a new array
+        elif as_array:
+            array = np.empty(n, dtype = np.uint32)
+            ctypes.memmove(array.ctypes.data, values.values, n * ctypes.sizeof(ctypes.c_uint32))
+            return array
+
+        # Wrap as python values
+        elif n == 1:
+            return values.values[0]
+        else:
+            return values.values[:n]
+    finally:
+        # Values were copied, free memory allocated by library
+        library.freeMemory(values.values)
+
+def check_output_buffer(buf, n):
+    """ Check whether an array can be used as an output buffer for n words
+    :param buf: Array to check
+    :param n: Number of words which will be copied to the array
+    :return: True if array can be used, False otherwise
+    """
+    return type(buf) is np.ndarray and buf.dtype == np.uint32 and buf.flags['C_CONTIGUOUS'] \
+           and buf.flags['WRITEABLE'] and buf.size >= n
+
+def wrap_write_values(values):
+    """ Convert values to be written into a contiguous uint32 array which can be passed to the library.
+        Objects supporting the buffer protocol are wrapped without copying
+    :param values: Single value, list, tuple, numpy array or object supporting the buffer protocol
+    :return: Numpy uint32 array, None if values cannot be converted
+    """
+
+    try:
+        # Single value
+        if isinstance(values, numbers.Integral):
+            return np.array([values], dtype = np.uint32)
+
+        # Numpy arrays are only copied if they are not contiguous uint32 arrays
+        elif isinstance(values, np.ndarray):
+            return np.ascontiguousarray(values, dtype = np.uint32).ravel()
+
+        # Lists and tuples are converted in a single call
+        elif isinstance(values, (list, tuple)):
+            return np.array(values, dtype = np.uint32)
+
+        # Buffers with a different word size (such as array('L')) have to be converted
+        elif getattr(values, 'itemsize', 4) != 4:
+            return np.array(values, dtype = np.uint32)
+
+        # Any other buffer (array('I'), memoryview, bytearray) is wrapped in place
+        else:
+            return np.frombuffer(values, dtype = np.uint32)
+
+    except (TypeError, ValueError, OverflowError):
+        return None
+
+def bitmask_shift(bitmask):
+    """ Get the number of bits a register value is shifted by within its word
+    :param bitmask: Register bitmask
+    :return: Position of lowest set bit in bitmask
+    """
+    if bitmask == 0:
+        return 0
+    return (bitmask & -bitmask).bit_length() - 1
+
+def coalesce_areas(areas):
+    """ Combine memory areas which are adjacent or overlap into contiguous segments
+    :param areas: List of (address, number of words) tuples
+    :return: Segment addresses, segment word counts and, for each area, the offset
+             of its first word within the values of all segments placed one after the other
+    """
+
+    addresses, counts, offsets = [], [], [0] * len(areas)
+    preceding = 0  # Number of words in segments before the current one
+
+    # Process areas in order of address
+    for i in sorted(range(len(areas)), key = lambda i: areas[i][0]):
+        address, n = areas[i]
+
+        # Extend current segment if area starts before or where it ends
+        if len(addresses) > 0 and address <= addresses[-1] + counts[-1] * 4:
+            counts[-1] = max(counts[-1], (address - addresses[-1]) / 4 + n)
+
+        # Otherwise start a new segment
+        else:
+            if len(counts) > 0:
+                preceding += counts[-1]
+            addresses.append(address)
+            counts.append(n)
+
+        offsets[i] = preceding + (address - addresses[-1]) / 4
+
+    return addresses, counts, offsets
+
 def call_read_register(board_id, device, register, n = 1, offset = 0):
     """
     :param board_id: ID of board to operate upon
@@ -257,30 +637,22 @@ def call_write_register(board_id, device, register, values, offset = 0):
     """
     global library
 
-    # Check if we have a single value or list of values
-    if type(values) is not list:
-
-        # Create an integer and extract it's address
-        INTP = ctypes.POINTER(ctypes.c_uint32)
-        num  = ctypes.c_uint32(values)
-        addr = ctypes.addressof(num)
-        ptr  = ctypes.cast(addr, INTP)
-
-        err = library.writeRegister(board_id, device.value, register, ptr, 1, offset)
-        return err
-
-    elif type(values) is list:
-        n = len(values)
-        vals = (ctypes.c_uint32 * n) (*values)
-        return Error(library.writeRegister(board_id, device.value, register, vals, n, offset))
-    else:
+    # Convert values to a contiguous word array
+    vals = wrap_write_values(values)
+    if vals is None:
         return Error.Failure
 
-def call_read_address(board_id, address, n = 1):
+    # Pass array memory directly to library
+    ptr = vals.ctypes.data_as(ctypes.POINTER(ctypes.c_uint32))
+    return Error(library.writeRegister(board_id, device.value, register, ptr, vals.size, offset))
+
+def call_read_address(board_id, address, n = 1, as_array = False, out = None):
     """ Read form address on board
     :param board_id: ID of board to operate upon
     :param address: Memory address to read from
     :param n: Number of words to read
+    :param as_array: Return values as a numpy uint32 array
+    :param out: Pre-allocated numpy uint32 array to read values into
     :return: Memory-mapped values
     """
     global library
@@ -289,16 +661,11 @@ def call_read_address(board_id, address, n = 1):
     values = library.readAddress(board_id, address, n)
 
     # Check if value succeeded, othewise rerturn
-    if values.error == Error.Failure.value:
+    if values.error != Error.Success.value:
         return Error.Failure
 
     # Read successful, wrap data and return
-    valPtr = ctypes.cast(values.values, ctypes.POINTER(ctypes.c_uint32))
-
-    if n == 1:
-        return valPtr[0]
-    else:
-        return [valPtr[i] for i in range(n)]
+    return wrap_values(values, n, as_array, out)
 
 def call_write_address(board_id, address, values):
     """ Write to address on board
@@ -309,24 +676,98 @@ def call_write_address(board_id, address, values):
     """
     global library
 
-    # Check if we have a single value or list of values
-    if type(values) is not list:
+    # Convert values to a contiguous word array
+    vals = wrap_write_values(values)
+    if vals is None:
+        return Error.Failure
+
+    # Pass array memory directly to library
+    ptr = vals.ctypes.data_as(ctypes.POINTER(ctypes.c_uint32))
+    return Error(library.writeAddress(board_id, address, ptr, vals.size))
 
-        # Create an integer and extract it's address
-        INTP = ctypes.POINTER(ctypes.c_uint32)
-        num  = ctypes.c_uint32(values)
-        addr = ctypes.addressof(num)
-        ptr  = ctypes.cast(addr, INTP)
+def call_read_address_batch(board_id, addresses, counts):
+    """ Read from multiple memory areas on board in a single batch
+    :param board_id: ID of board to operate upon
+    :param addresses: Start address of each area
+    :param counts: Number of words to read from each area
+    :return: Numpy uint32 array with values of all areas one after the other
+    """
+    global library
 
-        return Error(library.writeAddress(board_id, address, ptr, 1))
+    # Convert arguments to word arrays
+    addresses = np.array(addresses, dtype = np.uint32)
+    counts    = np.array(counts, dtype = np.uint32)
 
-    elif type(values) is list:
-        n = len(values)
-        vals = (ctypes.c_uint32 * n) (*values)
-        return Error(library.writeAddress(board_id, address, vals, n))
-    else:
+    # Call function
+    values = library.readAddressBatch(board_id,
+                                      addresses.ctypes.data_as(ctypes.POINTER(ctypes.c_uint32)),
+                                      counts.ctypes.data_as(ctypes.POINTER(ctypes.c_uint32)),
+                                      addresses.size)
+
+    # Check if value succeeded, othewise rerturn
+    if values.error != Error.Success.value:
+        return Error.Failure
+
+    # Read successful, wrap data and return
+    return wrap_values(values, int(counts.sum()), as_array = True)
+
+def call_write_address_batch(board_id, addresses, counts, values):
+    """ Write to multiple memory areas on board in a single batch
+    :param board_id: ID of board to operate upon
+    :param addresses: Start address of each area
+    :param counts: Number of words to write to each area
+    :param values: Values for all areas, one after the other
+    :return: Success or Failure
+    """
+    global library
+
+    # Convert arguments to word arrays
+    addresses = np.array(addresses, dtype = np.uint32)
+    counts    = np.array(counts, dtype = np.uint32)
+    vals      = wrap_write_values(values)
+    if vals is None or vals.size != counts.sum():
         return Error.Failure
 
+    # Call function
+    return Error(library.writeAddressBatch(board_id,
+                                           addresses.ctypes.data_as(ctypes.POINTER(ctypes.c_uint32)),
+                                           counts.ctypes.data_as(ctypes.POINTER(ctypes.c_uint32)),
+                                           addresses.size,
+                                           vals.ctypes.data_as(ctypes.POINTER(ctypes.c_uint32))))
+
+def call_write_address_masked(board_id, addresses, masks, values):
+    """ Write to bits within multiple words on board, without reading the words first
+    :param board_id: ID of board to operate upon
+    :param addresses: Address of each word
+    :param masks: Bits to write in each word
+    :param values: New value of each word, only bits in mask are used
+    :return: Success, Failure or NotImplemented
+    """
+    global library
+
+    # Convert arguments to word arrays
+    addresses = np.array(addresses, dtype = np.uint32)
+    masks     = np.array(masks, dtype = np.uint32)
+    values    = np.array(values, dtype = np.uint32)
+
+    # Call function
+    return Error(library.writeAddressMasked(board_id,
+                                            addresses.ctypes.data_as(ctypes.POINTER(ctypes.c_uint32)),
+                                            masks.ctypes.data_as(ctypes.POINTER(ctypes.c_uint32)),
+                                            values.ctypes.data_as(ctypes.POINTER(ctypes.c_uint32)),
+                                            addresses.size))
+
+def call_set_window_size(board_id, window):
+    """ Set number of requests which can be in flight for multi-packet transfers
+    :param board_id: ID of board to operate upon
+    :param window: Number of outstanding requests
+    :return: Success, Failure or NotImplemented
+    """
+    global library
+
+    # Call function
+    return Error(library.setWindowSize(board_id, window))
+
 def call_read_device(board_id, device, address):
     """ Read from an SPI device
     :param board_id: ID of board to operate upon
@@ -337,17 +778,14 @@ def call_read_device(board_id, device, address):
     global library
 
     # Call function
-    values = library.read_device(board_id, device, address)
+    values = library.readDevice(board_id, device, address)
 
     # Check if value succeeded, otherwise reture
-    if values.error == Error.Failure.value:
+    if values.error != Error.Success.value:
         return Error.Failure
 
     # Read succeeded, wrap data and return
-    valPtr = ctypes.cast(values.values, ctypes.POINTER(ctypes.c_uint32))
-
-    # Return value
-    return valPtr[0]
+    return wrap_values(values)
 
 def call_write_device(board_id, device, address, value):
     """
@@ -360,4 +798,30 @@ def call_write_device(board_id, device, address, value):
     global library
 
     # Call function
-    return Error(library.writeDevice(board_id, device, address, value))
\ No newline at end of file
+    return Error(library.writeDevice(board_id, device, address, value))
+
+def call_execute_device_transactions(board_id, transactions):
+    """ Issue a list of SPI transactions in one call
+    :param board_id: ID of board to operate upon
+    :param transactions: List of (device, address, operation, value) tuples,
+                         value is ignored for reads
+    :return: Error and list of values, read values for reads and written values for
+             writes. Transactions which were not completed have a value of None
+    """
+    global library
+
+    # Fill in transaction array
+    requests = (SPITransactionStruct * len(transactions))()
+    for i, (device, address, op, value) in enumerate(transactions):
+        requests[i].device  = device
+        requests[i].address = address
+        requests[i].op      = op.value
+        requests[i].value   = value if value is not None else 0
+        requests[i].error   = Error.Failure.value
+
+    # Call function
+    err = Error(library.executeDeviceTransactions(board_id, requests, len(transactions)))
+
+    # Extract values of completed transactions
+    values = [r.value if r.error == Error.Success.value else None for r in requests]
+    return err, values
@@ -0,0 +1,876 @@
+from accesslayer import *
+from asyncboard import AsyncFPGABoard
+from message_pb2 import Request, Reply
+import itertools
+import threading
+import Queue
+import struct
+import time
+import zmq
+
+# Access layer server client. Boards are accessed through a server (src/server)
+# instead of loading the library in the calling process. Requests are sent over a
+# pool of DEALER sockets, each request preceded by a tag frame which the server
+# returns with its reply, such that several requests can be outstanding on the
+# same socket and replies which arrive after a request timed out are discarded
+
+# --------------- Helpers ------------------------------
+
+# Device enumeration used in requests
+_request_devices = { Device.Board  : Request.BOARD,
+                     Device.FPGA_1 : Request.FPGA_1,
+                     Device.FPGA_2 : Request.FPGA_2 }
+
+# Device name prefixes, as used by the access layer
+_device_prefixes = { Device.Board.value : "board", Device.FPGA_1.value : "fpga1", Device.FPGA_2.value : "fpga2" }
+
+# Reply status values to board status
+_statuses = dict([(e.value, e) for e in Status])
+
+# Tag frame preceding requests and replies
+_tag_format = struct.Struct('<Q')
+
+# ------------------------------------------------------
+
+# --------------- Server connection --------------------
+class _Channel(object):
+    """ DEALER socket connected to the server, used by one thread at a time """
+
+    def __init__(self, context, address):
+        """ Class constructor
+        :param context: 0MQ context
+        :param address: Server endpoint
+        """
+        self.socket = context.socket(zmq.DEALER)
+        self.socket.setsockopt(zmq.LINGER, 0)
+        self.socket.connect(address)
+
+    def send(self, tag, request):
+        """ Send request
+        :param tag: Request tag
+        :param request: Request message
+        """
+        self.socket.send_multipart([_tag_format.pack(tag), request.SerializeToString()], copy = False)
+
+    def receive(self, tags, deadline):
+        """ Receive replies to outstanding requests, in the order in which they arrive.
+            Replies to other requests are discarded
+        :param tags: Set of tags of outstanding requests, tags are removed as replies are received
+        :param deadline: Time by which all replies must have been received
+        :return: Dictionary of tag, reply pairs
+        """
+        replies = { }
+        while len(tags) > 0:
+            remaining = deadline - time.time()
+            if remaining <= 0 or not self.socket.poll(remaining * 1000):
+                raise BoardError("Timed out waiting for %d replies from server" % len(tags))
+
+            frames = self.socket.recv_multipart()
+            if len(frames) != 2 or len(frames[0]) != _tag_format.size:
+                continue
+
+            tag = _tag_format.unpack(frames[0])[0]
+            if tag in tags:
+                reply = Reply()
+                reply.ParseFromString(frames[1])
+                replies[tag] = reply
+                tags.remove(tag)
+        return replies
+
+    def close(self):
+        """ Close socket """
+        self.socket.close()
+
+
+class RemoteConnection(object):
+    """ Connection to an access layer server, shared by boards and threads. Each request
+        takes a socket from the connection's pool for the time it is outstanding """
+
+    def __init__(self, address = "tcp://localhost:5555", sockets = 4, timeout = 5.0):
+        """ Class constructor
+        :param address: Server endpoint
+        :param sockets: Maximum number of sockets, and therefore concurrent requests
+        :param timeout: Time in seconds to wait for a reply or a free socket
+        """
+        self.address  = address
+        self.timeout  = timeout
+        self._context = zmq.Context.instance()
+
+        # Sockets are created when first needed
+        self._idle    = Queue.Queue()
+        self._created = 0
+        self._size    = sockets
+        self._lock    = threading.Lock()
+
+        # Request tags are unique within the connection
+        self._tags = itertools.count(1)
+
+    def _acquire(self):
+        """ Take a socket from the pool, creating one if the pool is not full """
+        try:
+            return self._idle.get_nowait()
+        except Queue.Empty:
+            pass
+
+        with self._lock:
+            if self._created < self._size:
+                self._created += 1
+                return _Channel(self._context, self.address)
+
+        try:
+            return self._idle.get(timeout = self.timeout)
+        except Queue.Empty:
+            raise BoardError("No socket available to server %s" % self.address)
+
+    def _release(self, channel):
+        """ Return a socket to the pool """
+        self._idle.put(channel)
+
+    def pipeline(self, requests):
+        """ Send several requests on one socket without waiting for their replies,
+            then collect the replies. Requests to different boards are processed
+            concurrently by the server, requests to the same board in order
+        :param requests: List of request messages
+        :return: List of replies, in the same order as requests
+        """
+        channel = self._acquire()
+        try:
+            tags = [self._tags.next() for request in requests]
+            for tag, request in zip(tags, requests):
+                channel.send(tag, request)
+            replies = channel.receive(set(tags), time.time() + self.timeout)
+            return [replies[tag] for tag in tags]
+        finally:
+            self._release(channel)
+
+    def request(self, request):
+        """ Send request and wait for its reply
+        :param request: Request message
+        :return: Reply message
+        """
+        return self.pipeline([request])[0]
+
+    def batch(self, board_id, requests):
+        """ Send several requests to the same board in a single message. The requests
+            are processed in order, and their replies returned in a single message
+        :param board_id: Board ID
+        :param requests: List of request messages
+        :return: List of replies, in the same order as requests
+        """
+        request = Request()
+        request.command = Request.BATCH
+        request.id = board_id
+        request.requests.extend(requests)
+        return list(self.request(request).replies)
+
+    def close(self):
+        """ Close idle sockets """
+        while True:
+            try:
+                self._idle.get_nowait().close()
+            except Queue.Empty:
+                break
+            with self._lock:
+                self._created -= 1
+
+# Connections shared by boards, keyed by server address
+_connections = { }
+_connections_lock = threading.Lock()
+
+def get_connection(address = "tcp://localhost:5555"):
+    """ Get the shared connection to a server, creating it if required
+    :param address: Server endpoint
+    :return: RemoteConnection
+    """
+    with _connections_lock:
+        if address not in _connections:
+            _connections[address] = RemoteConnection(address)
+        return _connections[address]
+
+# ------------------------------------------------------
+
+# ---------------------------- Remote register handle ------------------------
+class RemoteRegisterHandle(RegisterHandle):
+    """ Register handle on a remote board, reading and writing the register by
+        memory address through the server """
+
+    def _read_words(self, address, n, as_array = False):
+        """ Read words within register from board by memory address """
+        return self._board._read_words(address, n, as_array, "Failed to read register %s from board" % self.name)
+
+    def _write_words(self, address, values):
+        """ Write words within register to board by memory address """
+        self._board._write_words(address, values, "Failed to write register %s on board" % self.name)
+
+# ---------------------------- Remote board ----------------------------------
+class RemoteBoard(object):
+    """ FPGABoard counterpart which accesses boards through an access layer server """
+
+    def __init__(self, **kwargs):
+        """ Class constructor
+        :param server: Server endpoint, or connection, defaults to tcp://localhost:5555
+        :param fpgaBoard: BoardMake of board
+        :param ip: Board IP, connects immediately if port is also given
+        :param port: Board port
+        """
+
+        # Set defaults
+        self._registerList = None
+        self._deviceList   = None
+        self._device_index = None
+        self._programmed   = False
+        self._fpga_board   = kwargs.get('fpgaBoard', None)
+        self._string_id    = "Board"
+        self.id            = None
+        self.status        = Status.NotConnected
+
+        # Register handles, invalidated when firmware changes. Writes through
+        # handles are not batched and values are not cached on remote boards
+        self._register_handles    = { }
+        self._firmware_generation = 0
+        self._batch               = None
+
+        if self._fpga_board is None:
+            raise LibraryError("No BoarMake specified in RemoteBoard initialiser")
+
+        # Get connection to server
+        server = kwargs.get('server', "tcp://localhost:5555")
+        self._connection = server if isinstance(server, RemoteConnection) else get_connection(server)
+
+        self._logger = logging.getLogger('dummy')
+
+        # Connect if ip and port are specified
+        ip   = kwargs.get('ip', None)
+        port = kwargs.get('port', None)
+        if ip is not None and port is not None:
+            self.connect(ip, port)
+
+    def _request(self, command, **fields):
+        """ Create request for this board
+        :param command: Request command
+        :param fields: Request fields to set
+        :return: Request message
+        """
+        request = Request()
+        request.command = command
+        if self.id is not None:
+            request.id = self.id
+        for k, v in fields.iteritems():
+            setattr(request, k, v)
+        return request
+
+    def _send(self, request, error):
+        """ Send request and check its reply
+        :param request: Request message
+        :param error: Error message raised if the request fails
+        :return: Reply message
+        """
+        reply = self._connection.request(request)
+        self._check_reply(reply, error)
+        return reply
+
+    @staticmethod
+    def _check_reply(reply, error):
+        """ Raise BoardError if reply reports a failure """
+        if reply.result != Reply.SUCCESS:
+            if reply.HasField('message'):
+                error = "%s: %s" % (error, reply.message)
+            raise BoardError(error)
+
+    def _register_request(self, device, register, n = 1, offset = 0):
+        """ Create raw read request for register """
+        if not type(device) is Device:
+            raise LibraryError("Device argument for read_register should be of type Device")
+        return self._request(Request.GET_REGISTER_VALUES, device = _request_devices[device],
+                             registerName = FPGABoard._remove_device(register), n = n, offset = offset, raw = True)
+
+    def _checks(self):
+        """ Check that the board is connected and programmed """
+        if self.id is None:
+            raise LibraryError("Cannot perform operation on unconnected board")
+        if not self._programmed:
+            raise LibraryError("Cannot perform operation on board which has not been programmed")
+        return True
+
+    def _read_words(self, address, n, as_array, error):
+        """ Read words from board by memory address
+        :param address: Memory address to read from
+        :param n: Number of words to read
+        :param as_array: Return values as a numpy uint32 array
+        :param error: Error message raised if the read fails
+        :return: Values
+        """
+        reply = self._send(self._request(Request.READ_ADDRESS, address = address, n = n, raw = True), error)
+        return self._wrap_values(reply, n, as_array)
+
+    def _write_words(self, address, values, error):
+        """ Write words to board by memory address
+        :param address: Memory address to write to
+        :param values: Values to write
+        :param error: Error message raised if the write fails
+        """
+        vals = wrap_write_values(values)
+        if vals is None:
+            raise LibraryError("Invalid values for address %s" % hex(address))
+        self._send(self._request(Request.WRITE_ADDRESS, address = address, data = vals.astype('<u4').tostring()), error)
+
+    def _invalidate_registers(self):
+        """ Discard register information and handles, called when firmware changes """
+        self._registerList = None
+        self._deviceList = None
+        self._device_index = None
+        self._register_handles = { }
+        self._firmware_generation += 1
+
+    def _get_register_info(self, name):
+        """ Get register information from register list
+        :param name: Register name, including device
+        :return: Register information dictionary
+        """
+        if name not in self._registerList:
+            raise LibraryError("Register '%s' not found" % name)
+        return self._registerList[name]
+
+    def _get_cache(self):
+        """ Remote boards do not have a shadow register cache """
+        return None
+
+    def initialise(self, config):
+        """ Method for explicit initialisation, see FPGABoard.initialise. Firmware
+            plugins are not supported by remote boards
+        :param config: Configuration dictionary
+        """
+        if 'plugins' in config:
+            raise LibraryError("Firmware plugins are not supported by remote boards")
+
+        self._string_id = config['id']
+
+        # Configure logging
+        if 'log' in config and eval(config['log']):
+            self._logger = logging.getLogger()  # Get default logger
+        else:
+            self._logger = logging.getLogger('dummy')
+
+        # Check if board is already connected, and if not, connect
+        if self.id is None:
+            if 'ip' not in config and 'port' not in config:
+                raise LibraryError("IP and port are required for initialisation")
+            self.connect(config['ip'], int(config['port']))
+
+        # Set number of outstanding requests for large transfers, if defined
+        if 'window' in config:
+            self.set_window_size(int(config['window']))
+
+        # Check if firmware was defined in config
+        if 'firmware' not in config:
+            raise BoardError("Firmware must be specified in configuration file")
+
+        self.load_firmware_blocking(Device.FPGA_1, config['firmware'])
+
+    def status_check(self):
+        """ Perform board status checks
+        :return: Status
+        """
+        return self.get_status()
+
+    def connect(self, ip, port):
+        """ Connect to board
+        :param ip: Board IP
+        :param port: Port to connect to
+        """
+        request = self._request(Request.CONNECT, ip = ip, port = port, board = self._fpga_board.value)
+        reply = self._connection.request(request)
+        if reply.result != Reply.SUCCESS:
+            self.status = Status.NetworkError
+            raise BoardError("Could not connect to board with ip %s" % ip)
+
+        self._logger.info(self.log("Connected to board %s, received ID %d" % (ip, reply.id)))
+        self.id = reply.id
+        self.status = Status.OK
+
+    def disconnect(self):
+        """ Disconnect from board """
+        if self.id is None:
+            self._logger.warn(self.log("Call disconnect on board which was not connected"))
+            return
+
+        self._send(self._request(Request.DISCONNECT), "Failed to disconnect from board")
+        self._logger.info(self.log("Disconnected from board with ID %s" % self.id))
+        self._invalidate_registers()
+        self._programmed   = False
+        self.id = None
+
+    def get_status(self):
+        """ Get board status
+        :return: Status
+        """
+        reply = self._send(self._request(Request.GET_STATUS), "Failed to get status from board")
+        return _statuses.get(reply.status, Status.BoardError)
+
+    def load_firmware_blocking(self, device, filepath):
+        """ Blocking call to load firmware
+         :param device: Device on board to load firmware to
+         :param filepath: Path to firmware, on the server
+         """
+        if not type(device) is Device:
+            raise LibraryError("Device argument for load_firmware_blocking should be of type Device")
+
+        self.status = Status.LoadingFirmware
+        self._invalidate_registers()
+        try:
+            self._send(self._request(Request.LOAD_FIRMWARE_BLOCKING, device = _request_devices[device],
+                                     file = filepath), "load_firmware_blocking failed on board")
+        except BoardError:
+            self._programmed = False
+            self.status = Status.LoadingFirmwareError
+            raise
+
+        self._programmed = True
+        self.status = Status.OK
+        self.get_register_list()
+        self._logger.info(self.log("Successfuly loaded firmware %s on board" % filepath))
+
+    def get_register_list(self):
+        """ Get list of registers
+        :return: RegisterTable
+        """
+        if self._registerList is not None:
+            return self._registerList
+
+        if not self._programmed:
+            raise LibraryError("Cannot get_register_list from board which has not been programmed")
+
+        reply = self._send(self._request(Request.GET_REGISTER_LIST), "Failed to get register list from board")
+
+        # Copy register information into table
+        names, descriptions = [], []
+        records = np.zeros(len(reply.registerList), dtype = register_dtype)
+        for i, register in enumerate(reply.registerList):
+            # Protobuf strings are unicode, register names are kept as str like FPGABoard's
+            names.append(str('%s.%s' % (_device_prefixes[register.device], register.name)))
+            descriptions.append(register.description)
+            records[i] = (register.address, register.size, register.bitmask, register.value, register.type,
+                          register.device, register.permission, register.volatility, register.bits)
+        self._registerList = RegisterTable(names, records, descriptions)
+
+        return self._registerList
+
+    def read_register(self, device, register, n = 1, offset = 0, as_array = False):
+        """" Get register value
+         :param device: Device on board to read register from
+         :param register: Register name
+         :param n: Number of words to read
+         :param offset: Memory address offset to read from
+         :param as_array: Return values as a numpy uint32 array
+         :return: Values
+         """
+        self._checks()
+        reply = self._send(self._register_request(device, register, n, offset),
+                           "Failed to read_register %s from board" % register)
+        return self._wrap_values(reply, n, as_array)
+
+    def read_register_into(self, device, register, buf, offset = 0):
+        """" Read register values into a pre-allocated array
+         :param device: Device on board to read register from
+         :param register: Register name
+         :param buf: Numpy uint32 array, one word is read per array element
+         :param offset: Memory address offset to read from
+         :return: buf
+         """
+        self._checks()
+        if not check_output_buffer(buf, 1):
+            raise LibraryError("Buffer argument for read_register_into should be a contiguous, writable uint32 array")
+
+        reply = self._send(self._register_request(device, register, buf.size, offset),
+                           "Failed to read_register %s from board" % register)
+        buf[:] = np.frombuffer(reply.data, dtype = '<u4')
+        return buf
+
+    @staticmethod
+    def _wrap_values(reply, n, as_array):
+        """ Convert raw register data in a reply to values """
+        values = np.frombuffer(reply.data, dtype = '<u4')
+        if as_array:
+            return values.astype(np.uint32)
+        elif n == 1:
+            return int(values[0])
+        else:
+            return values.tolist()
+
+    def write_register(self, device, register, values, offset = 0):
+        """ Set register value
+         :param device: Device on board to write register to
+         :param register: Register name
+         :param values: Values to write
+         :param offset: Memory address offset to write to
+         """
+        self._checks()
+        if not type(device) is Device:
+            raise LibraryError("Device argument for write_register should be of type Device")
+
+        vals = wrap_write_values(values)
+        if vals is None:
+            raise LibraryError("Invalid values for register %s" % register)
+
+        self._send(self._request(Request.SET_REGISTER_VALUES, device = _request_devices[device],
+                                 registerName = FPGABoard._remove_device(register), offset = offset,
+                                 data = vals.astype('<u4').tostring()),
+                   "Failed to write_register %s on board" % register)
+
+    def read_registers(self, names, as_record = False):
+        """ Read multiple registers in a single request to the server
+         :param names: List of register names, including device
+         :param as_record: Return values as a numpy record instead of a dictionary
+         :return: Dictionary or numpy record of register values
+         """
+        self._checks()
+
+        # Resolve registers, skipping duplicates
+        registers, seen = [], set()
+        for name in names:
+            if name not in seen:
+                if name not in self._registerList:
+                    raise LibraryError("Register %s not found" % name)
+                seen.add(name)
+                registers.append(self._registerList[name])
+
+        # Read all registers in one batch. The library applies bitmasks
+        requests = [self._register_request(reg['device'], reg['name'], reg['size']) for reg in registers]
+        replies = self._connection.batch(self.id, requests) if len(requests) > 0 else []
+
+        result = { }
+        for reg, reply in zip(registers, replies):
+            self._check_reply(reply, "Failed to read register %s from board" % reg['name'])
+            result[reg['name']] = self._wrap_values(reply, reg['size'], as_record or reg['size'] > 1)
+
+        if not as_record:
+            return result
+
+        # Place values in numpy record
+        record = np.zeros((), dtype = [(reg['name'], np.uint32) if reg['size'] == 1
+                                       else (reg['name'], np.uint32, (reg['size'],)) for reg in registers])
+        for reg in registers:
+            record[reg['name']] = result[reg['name']]
+        return record
+
+    def write_registers(self, values):
+        """ Write multiple registers in a single request to the server
+         :param values: Dictionary of register name, values pairs
+         """
+        self._checks()
+
+        names, requests = [], []
+        for name, value in values.iteritems():
+            if name not in self._registerList:
+                raise LibraryError("Register %s not found" % name)
+            reg  = self._registerList[name]
+            vals = wrap_write_values(value)
+            if vals is None or vals.size > reg['size']:
+                raise LibraryError("Invalid values for register %s" % name)
+            names.append(name)
+            requests.append(self._request(Request.SET_REGISTER_VALUES, device = _request_devices[reg['device']],
+                                          registerName = FPGABoard._remove_device(name),
+                                          data = vals.astype('<u4').tostring()))
+
+        if len(requests) > 0:
+            for name, reply in zip(names, self._connection.batch(self.id, requests)):
+                self._check_reply(reply, "Failed to write register %s on board" % name)
+
+    def read_address(self, address, n = 1, as_array = False):
+        """" Get register value
+         :param address: Memory address to read from
+         :param n: Number of words to read
+         :param as_array: Return values as a numpy uint32 array
+         :return: Values
+         """
+        return self._read_words(address, n, as_array, "Failed to read_address %s on board" % hex(address))
+
+    def read_address_into(self, address, buf):
+        """" Read memory values into a pre-allocated array
+         :param address: Memory address to read from
+         :param buf: Numpy uint32 array, one word is read per array element
+         :return: buf
+         """
+        if not check_output_buffer(buf, 1):
+            raise LibraryError("Buffer argument for read_address_into should be a contiguous, writable uint32 array")
+        buf[:] = self._read_words(address, buf.size, True, "Failed to read_address %s on board" % hex(address))
+        return buf
+
+    def write_address(self, address, values):
+        """ Set register value
+         :param address: Memory address to write to
+         :param values: Values to write
+         """
+        self._write_words(address, values, "Failed to write_address %s on board" % hex(address))
+
+    def set_window_size(self, window):
+        """ Set the number of requests which can be in flight when a read or write
+            is split up into multiple packets, see FPGABoard.set_window_size
+         :param window: Number of outstanding requests
+         """
+        reply = self._connection.request(self._request(Request.SET_WINDOW_SIZE, value = window))
+        if reply.result == Reply.NOT_IMPLEMENTED:
+            raise LibraryError("Window size not supported by board protocol")
+        self._check_reply(reply, "Failed to set window size %d on board" % window)
+
+    def register(self, name):
+        """ Get a handle to a register, which reads and writes the register by
+            memory address without looking it up on every access
+        :param name: Register name, including device
+        :return: RemoteRegisterHandle
+        """
+        self._checks()
+        if name not in self._register_handles:
+            self._register_handles[name] = RemoteRegisterHandle(self, name)
+        return self._register_handles[name]
+
+    def batch(self, use_opcodes = False):
+        """ Register batches are not supported by remote boards, use write_registers """
+        raise LibraryError("Register batches are not supported by remote boards, use write_registers")
+
+    def enable_cache(self, ttl = 0.0):
+        """ Shadow register caches are not supported by remote boards """
+        raise LibraryError("Shadow register cache is not supported by remote boards")
+
+    def disable_cache(self):
+        """ Remote boards do not have a shadow register cache, nothing to disable """
+        pass
+
+    def set_cache_policy(self, name, policy):
+        """ Shadow register caches are not supported by remote boards """
+        raise LibraryError("Shadow register cache is not supported by remote boards")
+
+    def get_firmware_list(self, device = None):
+        """ Listing firmware is not supported by the server """
+        raise LibraryError("Firmware list is not supported by remote boards")
+
+    def load_plugin(self, plugin):
+        """ Firmware plugins are not supported by remote boards """
+        raise LibraryError("Firmware plugins are not supported by remote boards")
+
+    def unload_plugin(self, plugin):
+        """ Firmware plugins are not supported by remote boards """
+        raise LibraryError("Firmware plugins are not supported by remote boards")
+
+    def get_available_plugins(self):
+        """ Remote boards do not have any plugins
+        :return: Empty list
+        """
+        return []
+
+    def get_loaded_plugins(self):
+        """ Remote boards do not have any plugins
+        :return: Empty dictionary
+        """
+        return { }
+
+    # ------------------------------ SPI devices ---------------------------------
+
+    def get_device_list(self):
+        """ Get list of SPI devices
+        :return: Dictionary of device name, device information pairs
+        """
+        if self._deviceList is not None:
+            return self._deviceList
+
+        reply = self._send(self._request(Request.GET_DEVICE_LIST), "Failed to get device list from board")
+        self._deviceList = { }
+        for device in reply.deviceList:
+            self._deviceList[str(device.name)] = { 'name'     : str(device.name),
+                                                   'spi_en'   : device.spi_en,
+                                                   'spi_sclk' : device.spi_sclk }
+        return self._deviceList
+
+    def read_device(self, device, address):
+        """" Get device value
+         :param device: SPI Device to read from
+         :param address: Address on device to read from
+         :return: Value
+         """
+        if device not in self.get_device_list():
+            raise LibraryError("SPI device %s not found" % device)
+
+        reply = self._send(self._request(Request.READ_DEVICE, registerName = device, address = address),
+                           "Failed to read_device %s, %s on board" % (device, hex(address)))
+        return reply.value
+
+    def write_device(self, device, address, value):
+        """ Set device value
+        :param device: SPI device to write to
+        :param address: Address on device to write to
+        :param value: Value to write
+        """
+        if device not in self.get_device_list():
+            raise LibraryError("SPI device %s not found" % device)
+
+        self._send(self._request(Request.WRITE_DEVICE, registerName = device, address = address, value = value),
+                   "Failed to write_device %s, %s on board" % (device, hex(address)))
+
+    def execute_device_transactions(self, transactions):
+        """ Issue a list of SPI transactions in a single request, see FPGABoard.execute_device_transactions
+        :param transactions: List of (device, address, operation, value) tuples
+        :return: List of values, one per transaction, read values for reads
+        """
+        devices = self.get_device_list()
+        request = self._request(Request.EXECUTE_DEVICE_TRANSACTIONS)
+        for transaction in transactions:
+            device, address, op, value = (tuple(transaction) + (None,))[:4]
+            if device not in devices:
+                raise LibraryError("Device %s for execute_device_transactions not found" % device)
+            if type(op) is not SPIOperation:
+                raise LibraryError("Operation for execute_device_transactions should be of type SPIOperation")
+            if op == SPIOperation.Write and value is None:
+                raise LibraryError("No value specified for write to device %s, %s" % (device, hex(address)))
+            spi = request.requests.add()
+            spi.command = Request.WRITE_DEVICE if op == SPIOperation.Write else Request.READ_DEVICE
+            spi.registerName = device
+            spi.address = address
+            if value is not None:
+                spi.value = value
+
+        # Report first transaction which failed
+        reply = self._connection.request(request)
+        if reply.result != Reply.SUCCESS:
+            for spi, result in zip(request.requests, reply.replies):
+                if result.result != Reply.SUCCESS:
+                    raise BoardError("Failed to execute SPI transaction on %s, %s on board" % (spi.registerName, hex(spi.address)))
+            self._check_reply(reply, "Failed to execute SPI transactions on board")
+
+        return [result.value for result in reply.replies]
+
+    def find_device(self, string, display = False, glob = False):
+        """ Return SPI device information for provided search string
+         :param string: Regular expression to match against the start of device names
+         :param display: True to output result to console
+         :param glob: True to match string as a shell-style wildcard pattern against whole device names
+         :return: List of found devices
+         """
+        self._checks()
+        if self._device_index is None:
+            self._device_index = NameIndex(self.get_device_list().keys())
+
+        matches = [self._deviceList[name] for name in self._device_index.search(string, anchored = True, glob = glob)]
+        if display:
+            string = "\n"
+            for v in sorted(matches, key = lambda l : l['name']):
+                string += 'Name: %s, spi_sclk: %d, spi_en: %d\n' % (v['name'], v['spi_sclk'], v['spi_en'])
+            print string
+        return matches
+
+    def list_device_names(self):
+        """ Print list of SPI device names """
+        self._checks()
+        print "List of SPI Devices"
+        print "-------------------"
+        for k in self.get_device_list():
+            print k
+
+    # ------------------------------------------------------------------------------
+
+    def list_register_names(self):
+        """ Print list of register names """
+        self._checks()
+        registers = { }
+        for k, v in self._registerList.iteritems():
+            registers.setdefault(v['device'], []).append(k)
+        for k, v in registers.iteritems():
+            print DeviceNames[k]
+            print '-' * len(DeviceNames[k])
+            for regname in sorted(v):
+                print '\t' + str(regname)
+
+    def find_component(self, path, display = False):
+        """ Return register information for all registers within a component
+         :param path: Dotted component path, such as fpga1.regfile
+         :param display: True to output result to console
+         :return: List of found registers
+         """
+        self._checks()
+        matches = [self._registerList[name] for name in self._registerList.search_index().component(path)]
+        if display:
+            FPGABoard._display_registers(matches)
+        return matches
+
+    def find_register(self, string, display = False, glob = False):
+        """ Return register information for provided search string
+         :param string: Regular expression to search against
+         :param display: True to output result to console
+         :param glob: True to match string as a shell-style wildcard pattern against whole register names
+         :return: List of found registers
+         """
+        self._checks()
+        matches = [self._registerList[name] for name in self._registerList.search_index().search(string, glob = glob)]
+        if display:
+            FPGABoard._display_registers(matches)
+        return matches
+
+    def log(self, string):
+        """ Format string for logging output """
+        return "%s: %s" % (self._string_id, string)
+
+    def __len__(self):
+        """ Override __len__, return number of registers """
+        if self._registerList is not None:
+            return len(self._registerList)
+        return 0
+
+
+class RemoteTPM(RemoteBoard):
+    """ RemoteBoard subclass for communicating with a TPM board """
+
+    def __init__(self, **kwargs):
+        """ Class constructor """
+        kwargs['fpgaBoard'] = BoardMake.TpmBoard
+        super(RemoteTPM, self).__init__(**kwargs)
+
+    def __getitem__(self, key):
+        """ Override __getitem__, return value from board. Keys are register names,
+            memory addresses or (SPI device, address) tuples """
+        self._checks()
+        if type(key) is int:
+            return self.read_address(key)
+        if type(key) is tuple:
+            if len(key) != 2:
+                raise LibraryError("A device name and address need to be specified for reading from SPI devices")
+            return self.read_device(key[0], key[1])
+        if not isinstance(key, basestring):
+            raise LibraryError("Unrecognised key type, must be register name or memory address")
+        if key not in self._registerList:
+            raise LibraryError("Register %s not found" % key)
+
+        reg = self._registerList[key]
+        return self.read_register(reg['device'], key, reg['size'])
+
+    def __setitem__(self, key, value):
+        """ Override __setitem__, set value on board"""
+        self._checks()
+        if type(key) is int:
+            return self.write_address(key, value)
+        if type(key) is tuple:
+            if len(key) != 2:
+                raise LibraryError("A device name and address need to be specified for writing to SPI devices")
+            return self.write_device(key[0], key[1], value)
+        if not isinstance(key, basestring):
+            raise LibraryError("Unrecognised key type, must be register name or memory address")
+        if key not in self._registerList:
+            raise LibraryError("Register %s not found" % key)
+
+        self.write_register(self._registerList[key]['device'], key, value)
+
+# ------------------------- Async remote boards ------------------------------
+class AsyncRemoteTPM(AsyncFPGABoard):
+    """ Asynchronous wrapper for RemoteTPM. Requests to different boards are
+        outstanding on the server at the same time """
+    _board_class = RemoteTPM
+
+    def read_registers(self, *args, **kwargs):
+        """ Read multiple registers, see RemoteBoard.read_registers
+        :return: AsyncResult
+        """
+        return self._submit(self.board.read_registers, *args, **kwargs)
+
+    def write_registers(self, *args, **kwargs):
+        """ Write multiple registers, see RemoteBoard.write_registers
+        :return: AsyncResult
+        """
+        return self._submit(self.board.write_registers, *args, **kwargs)
@@ -0,0 +1,229 @@
+from accesslayer import *
+from definitions import *
+from fnmatch import fnmatch
+import xml.etree.ElementTree as ET
+import time
+
+# Default time to wait for a device register to reach its expected value, in seconds
+DEFAULT_TIMEOUT = 2.0
+
+# Delay between polls of a device register, in seconds. The delay is doubled after
+# every poll up to the maximum
+POLL_MIN_DELAY = 0.001
+POLL_MAX_DELAY = 0.1
+
+# Sequence operations and their required attributes
+OPERATIONS = { 'write_device'  : ['address', 'value'],
+               'check_device'  : ['address', 'value'],
+               'wait_device'   : ['address', 'value'],
+               'write_address' : ['address', 'value'],
+               'sleep'         : ['seconds'] }
+
+# Operations which access SPI devices
+DEVICE_OPERATIONS = ['write_device', 'check_device', 'wait_device']
+
+class Sequence(object):
+    """ Board bring-up sequence loaded from an XML file. A sequence is a list of
+        steps, each made up of SPI device and memory operations. Device operations
+        in a step are applied to all devices selected by the step, with the
+        transactions for all devices issued together """
+
+    def __init__(self, filename):
+        """ Load sequence from XML file
+        :param filename: Sequence file path
+        """
+
+        # Check if file exists and is an XML file
+        try:
+            root = ET.parse(filename).getroot()
+        except ET.ParseError:
+            raise LibraryError("Sequence file %s is malformed" % filename)
+        except IOError:
+            raise LibraryError("Sequence file %s does not exist or is not accessible" % filename)
+
+        self.name    = root.get('name', filename)
+        self.timeout = float(root.get('timeout', DEFAULT_TIMEOUT))
+
+        # Parameters which can be passed to run, with their default and allowed values
+        self.parameters = { }
+        for node in root.findall('parameter'):
+            allowed = node.get('values')
+            self.parameters[node.get('name')] = { 'default' : node.get('default'),
+                                                  'values'  : allowed.split() if allowed else None }
+
+        # Load steps
+        self.steps = []
+        for node in root.findall('step'):
+            if node.get('name') is None:
+                raise LibraryError("Each step in sequence %s must have a name" % self.name)
+            step = { 'name'       : node.get('name'),
+                     'devices'    : node.get('devices', '').split(),
+                     'operations' : self._parse_operations(node) }
+            self.steps.append(step)
+
+    def _parse_operations(self, node):
+        """ Parse operations within a step or when block
+        :param node: XML node
+        :return: List of operations. When blocks are returned as (condition, operations) tuples
+        """
+
+        operations = []
+        for child in node:
+            # Operations which depend on parameter values
+            if child.tag == 'when':
+                for name, value in child.attrib.iteritems():
+                    if name not in self.parameters:
+                        raise LibraryError("Unknown parameter %s in sequence %s" % (name, self.name))
+                operations.append((child.attrib, self._parse_operations(child)))
+                continue
+
+            if child.tag not in OPERATIONS:
+                raise LibraryError("Unknown operation %s in sequence %s" % (child.tag, self.name))
+
+            # Check that required attributes are present
+            for attribute in OPERATIONS[child.tag]:
+                if attribute not in child.attrib:
+                    raise LibraryError("Operation %s in sequence %s requires attribute %s" % (child.tag, self.name, attribute))
+
+            operation = { 'type'      : child.tag,
+                          'address'   : int(child.get('address', '0'), 0),
+                          'value'     : int(child.get('value', '0'), 0),
+                          'mask'      : int(child.get('mask', '0xFFFFFFFF'), 0),
+                          'condition' : child.get('condition', 'equal'),
+                          'timeout'   : float(child.get('timeout', self.timeout)),
+                          'seconds'   : float(child.get('seconds', '0')) }
+
+            if operation['condition'] not in ['equal', 'not_equal']:
+                raise LibraryError("Condition should be equal or not_equal in sequence %s" % self.name)
+
+            operations.append(operation)
+
+        return operations
+
+    def _get_parameters(self, parameters):
+        """ Check parameters passed to run and fill in default values
+        :param parameters: Dictionary of parameter values
+        :return: Dictionary with a string value for each parameter
+        """
+
+        values = { }
+        for name, parameter in self.parameters.iteritems():
+            value = str(parameters.pop(name, parameter['default']))
+            if parameter['values'] is not None and value not in parameter['values']:
+                raise LibraryError("Value %s for parameter %s is not supported, should be one of %s" %
+                                   (value, name, ', '.join(parameter['values'])))
+            values[name] = value
+
+        if len(parameters) > 0:
+            raise LibraryError("Unknown parameters %s for sequence %s" % (', '.join(parameters.keys()), self.name))
+
+        return values
+
+    def _expand(self, operations, parameters):
+        """ Replace when blocks with their operations if their condition holds
+        :param operations: List of operations
+        :param parameters: Parameter values
+        :return: List of operations
+        """
+
+        expanded = []
+        for operation in operations:
+            if type(operation) is tuple:
+                condition, block = operation
+                if all([parameters[k] == v for k, v in condition.iteritems()]):
+                    expanded.extend(self._expand(block, parameters))
+            else:
+                expanded.append(operation)
+        return expanded
+
+    @staticmethod
+    def _matches(operation, value):
+        """ Check whether a device value matches the value expected by an operation """
+        equal = (value & operation['mask']) == (operation['value'] & operation['mask'])
+        return equal if operation['condition'] == 'equal' else not equal
+
+    def run(self, board, **parameters):
+        """ Run sequence on board
+        :param board: Connected board with firmware loaded
+        :param parameters: Values for sequence parameters
+        :return: List of reports, one per step, containing the step name, time taken,
+                 number of SPI transactions and any failed checks
+        """
+
+        parameters = self._get_parameters(parameters)
+        device_list = board.get_device_list()
+
+        report = []
+        for step in self.steps:
+            start = time.time()
+
+            # Get devices selected by step
+            devices = sorted([d for d in device_list if any([fnmatch(d, p) for p in step['devices']])])
+            operations = self._expand(step['operations'], parameters)
+            if len(devices) == 0 and any([op['type'] in DEVICE_OPERATIONS for op in operations]):
+                raise LibraryError("No devices on board match step %s" % step['name'])
+
+            # Device reads and writes are queued and issued together
+            state = { 'queue' : [], 'transactions' : 0, 'failed_checks' : [] }
+            for operation in operations:
+                if operation['type'] in ['write_device', 'check_device']:
+                    state['queue'].append(operation)
+                    continue
+
+                self._flush(board, devices, state)
+                if operation['type'] == 'wait_device':
+                    self._wait(board, devices, operation, step, state)
+                elif operation['type'] == 'write_address':
+                    board.write_address(operation['address'], operation['value'])
+                elif operation['type'] == 'sleep':
+                    time.sleep(operation['seconds'])
+            self._flush(board, devices, state)
+
+            report.append({ 'step'          : step['name'],
+                            'time'          : time.time() - start,
+                            'transactions'  : state['transactions'],
+                            'failed_checks' : state['failed_checks'] })
+
+        return report
+
+    def _flush(self, board, devices, state):
+        """ Issue queued device operations for all devices in a single transaction list """
+
+        if len(state['queue']) == 0:
+            return
+
+        # Operations are issued in order, each one to all devices
+        transactions, checks = [], []
+        for operation in state['queue']:
+            for device in devices:
+                if operation['type'] == 'write_device':
+                    transactions.append((device, operation['address'], SPIOperation.Write, operation['value']))
+                else:
+                    checks.append((len(transactions), device, operation))
+                    transactions.append((device, operation['address'], SPIOperation.Read))
+
+        values = board.execute_device_transactions(transactions)
+        state['transactions'] += len(transactions)
+        state['queue'] = []
+
+        # Failed checks do not stop the sequence, they are returned in the report
+        for index, device, operation in checks:
+            if not self._matches(operation, values[index]):
+                state['failed_checks'].append((device, operation['address'], values[index]))
+
+    def _wait(self, board, devices, operation, step, state):
+        """ Poll a register on all devices until it matches the expected value on every device """
+
+        remaining, delay, start = list(devices), POLL_MIN_DELAY, time.time()
+        while True:
+            values = board.execute_device_transactions([(d, operation['address'], SPIOperation.Read) for d in remaining])
+            state['transactions'] += len(remaining)
+            remaining = [d for d, v in zip(remaining, values) if not self._matches(operation, v)]
+            if len(remaining) == 0:
+                return
+
+            if time.time() - start > operation['timeout']:
+                raise BoardError("Timeout waiting for register %s on %s in step %s" %
+                                 (hex(operation['address']), ', '.join(remaining), step['name']))
+            time.sleep(delay)
+            delay = min(delay * 2, POLL_MAX_DELAY)
@@ -5,7 +5,7 @@ setup(name='TPM',
       version='0.2',
       description='Python wrapper for FPGA-board access layer',
       author='Alessio Magro',
-      py_modules=['accesslayer', 'interface', 'definitions',
+      py_modules=['accesslayer', 'asyncboard', 'remoteboard', 'message_pb2', 'interface', 'definitions', 'sequencer',
                   'plugins.firmwareblock', 'plugins.firmwaretest',
                   'plugins.firmwaretest2'],
      )
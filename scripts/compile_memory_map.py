@@ -0,0 +1,35 @@
+# This script compiles memory map XML files into binary cache files, which are
+# used by the access layer instead of parsing the XML file when firmware is loaded.
+# Caches are also generated the first time a memory map is loaded, so this is only
+# needed to avoid the parsing cost on first load or when the XML directory is not
+# writable by the process loading the firmware
+
+from optparse import OptionParser
+import sys
+sys.path.append("../python")
+
+from interface import *
+
+# Script entry point
+if __name__ == "__main__":
+
+    # Parse command line options
+    parser = OptionParser(usage="usage: %prog [options] memory_map.xml [memory_map.xml ...]")
+    parser.add_option("--library", dest="library", default=None, help="Path to libboard.so")
+    (options, args) = parser.parse_args()
+
+    if len(args) == 0:
+        parser.error("No memory map specified")
+
+    initialise_library(options.library)
+
+    # Compile memory maps
+    failed = 0
+    for filepath in args:
+        if call_compile_memory_map(filepath) == Error.Success:
+            print "Compiled %s" % filepath
+        else:
+            print "Failed to compile %s" % filepath
+            failed += 1
+
+    sys.exit(1 if failed > 0 else 0)
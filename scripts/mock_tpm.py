@@ -1,99 +1,270 @@
-# This script present a mock TPM, used for testing the access layer
+# This script presents one or more mock TPMs, used for testing and benchmarking
+# the access layer without hardware. Each board listens on its own UDP port,
+# all boards are served by a single process
 
+from optparse import OptionParser
+from array import array
+import random
+import select
 import socket
 import struct
+import heapq
+import time
 
 UDP_PORT = 10000
 
 # Unpack string for UCP packet header
-# 1st byte:  PSN
-# 2nd byte:  OPCODE
-# 3rd byte:  N
-# 4th byte:  ADDRESS
-UCP_header_fmt = 'IIII'
+# 1st word:  PSN
+# 2nd word:  OPCODE
+# 3rd word:  N
+# 4th word:  ADDRESS
+UCP_header_fmt  = '<IIII'
+UCP_header_size = struct.calcsize(UCP_header_fmt)
+
+# UCP reply header (PSN, ADDRESS)
+UCP_reply_fmt = '<II'
 
 # UCP OPCODES
-OPCODE_READ  = 0x01
-OPCODE_WRITE = 0x02
+OPCODE_READ        = 0x01
+OPCODE_WRITE       = 0x02
+OPCODE_BITWISE_AND = 0x03
+OPCODE_BITWISE_OR  = 0x04
+OPCODE_FIFO_READ   = 0x09
+OPCODE_FIFO_WRITE  = 0x0A
+OPCODE_BIT_WRITE   = 0x0B
+
+# SPI controller, word offsets from SPI_ADDRESS
+SPI_ADDRESS     = 0x20000000
+SPI_ADDR        = 0
+SPI_WRITE_DATA  = 1
+SPI_READ_DATA   = 2
+SPI_CHIP_SELECT = 3
+SPI_SCLK        = 4
+SPI_CMD         = 5
+SPI_WORDS       = 6
+
+# SPI command bits
+SPI_CMD_START = 0x1
+SPI_CMD_RNW   = 0x2
+
+# Number of words in a memory page
+PAGE_WORDS = 4096
+
+class Memory(object):
+    """ Mock TPM memory. Memory is allocated in pages of PAGE_WORDS words
+        when first accessed, with all words initialised to 0 """
+
+    def __init__(self, spi_busy = 0):
+        """ Class constructor
+        :param spi_busy: Number of times the SPI command register is read as busy
+                         before a transaction completes
+        """
+        self.pages = { }
+
+        # SPI emulation, device memory is stored per chip select and sclk
+        self.spi_devices = { }
+        self.spi_busy = spi_busy
+        self.spi_pending = 0
+
+    def _page(self, address):
+        """ Get page and word index for address """
+        word = address >> 2
+        index = word // PAGE_WORDS
+        if index not in self.pages:
+            self.pages[index] = array('I', [0]) * PAGE_WORDS
+        return self.pages[index], word % PAGE_WORDS
+
+    def read(self, address, n):
+        """ Read n words starting from address
+        :return: array of words
+        """
+
+        # Reading the SPI command register while a transaction is pending
+        if self.spi_pending > 0 and address <= SPI_ADDRESS + SPI_CMD * 4 < address + n * 4:
+            self.spi_pending -= 1
+            if self.spi_pending == 0:
+                page, index = self._page(SPI_ADDRESS + SPI_CMD * 4)
+                page[index] &= ~SPI_CMD_START & 0xFFFFFFFF
 
-# Mock TPM memory
-# An entry per memory location is created
-memory = { }
+        values = array('I')
+        while n > 0:
+            page, index = self._page(address)
+            count = min(n, PAGE_WORDS - index)
+            values.extend(page[index : index + count])
+            address += count * 4
+            n -= count
+        return values
 
-def readMemory(address, n):
-    """ Mock reading from TPM memory """
+    def write(self, address, values):
+        """ Write words starting from address """
+        start, i = address, 0
+        while i < len(values):
+            page, index = self._page(address)
+            count = min(len(values) - i, PAGE_WORDS - index)
+            page[index : index + count] = values[i : i + count]
+            address += count * 4
+            i += count
 
-    # Read values
-    values = []
+        # Check if an SPI transaction was issued
+        if start <= SPI_ADDRESS + SPI_CMD * 4 < address:
+            self.spi_command()
 
-    # For each memory address, check if it is alread in memory
-    # if not, create a value and store in memory
-    for i in range(n):
-        addr = address + i * 4
-        if addr in memory.keys():
-            values.append(memory[addr])
+    def spi_command(self):
+        """ Emulate SPI transaction issued through the SPI controller """
+        spi = self.read(SPI_ADDRESS, SPI_WORDS)
+        if not spi[SPI_CMD] & SPI_CMD_START:
+            return
+
+        # Device memory is identified by chip select and clock
+        device = self.spi_devices.setdefault((spi[SPI_CHIP_SELECT], spi[SPI_SCLK]), { })
+        address = spi[SPI_ADDR] & 0xFFFF
+        if spi[SPI_CMD] & SPI_CMD_RNW:
+            spi[SPI_READ_DATA] = device.get(address, 0)
         else:
-            memory[addr] = 0
-            values.append(0)
+            device[address] = (spi[SPI_WRITE_DATA] >> 8) & 0xFF
 
-    # Return values
-    return values
+        # Transaction completes immediately unless busy polls are emulated
+        if self.spi_busy == 0:
+            spi[SPI_CMD] &= ~SPI_CMD_START & 0xFFFFFFFF
+        self.spi_pending = self.spi_busy
 
-def writeMemory(address, n, values):
-    """ Mock writing to TPM memory """
+        page, index = self._page(SPI_ADDRESS)
+        page[index : index + SPI_WORDS] = spi
 
-    # Blindly store all value to memory
-    for i in range(n):
-        addr = address + i * 4
-        memory[addr] = values[i]
+class MockTPM(object):
+    """ A single mock TPM listening on a UDP port """
 
-# Script entry point
-if __name__ == "__main__":
-    
-    # Create socket
-    sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
-
-    # Bind socket
-    sock.bind(("", UDP_PORT))
-
-    # Continuously wait for packets
-    while True:
-
-        # Receive packet (blocking)
-        print "Waiting for packet"
-        data, addr = sock.recvfrom(512)
-        
-        # Received packet, extract and convert data
-        psn, opcode, n, address = struct.unpack(UCP_header_fmt, data[:16])
-        psn     = psn
-        opcode  = opcode
-        n       = n
-        address = address
+    def __init__(self, port, spi_busy = 0):
+        """ Class constructor
+        :param port: UDP port to listen on
+        :param spi_busy: Number of busy SPI command polls
+        """
+        self.port = port
+        self.memory = Memory(spi_busy)
+        self.packets = 0
+        self.sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self.sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, 4 * 1024 * 1024)
+        self.sock.bind(("", port))
+
+    def process(self, data):
+        """ Process UCP request
+        :param data: Request packet
+        :return: Reply packet, None if request is malformed
+        """
+
+        # Extract header
+        if len(data) < UCP_header_size:
+            return None
+        psn, opcode, n, address = struct.unpack(UCP_header_fmt, data[:UCP_header_size])
+        self.packets += 1
+
+        # Extract payload
+        payload = array('I')
+        payload.fromstring(data[UCP_header_size : UCP_header_size + (len(data) - UCP_header_size) // 4 * 4])
+
+        # Replies to failed requests carry a different address
+        error = struct.pack(UCP_reply_fmt, psn, ~address & 0xFFFFFFFF)
 
         # Switch on opcode
-        if (opcode == OPCODE_READ):
-         
-            # Read operation, return packet with data
-            values = readMemory(address, n)
-            packet = struct.pack("II" + "I" * n, 
-                                 psn, 
-                                 address, 
-                                 *values)
-            sock.sendto(packet, addr)
-            print "Request to read addr %#08X, provided value %d (x %d)" % (address, values[0], n)
-
-        elif (opcode == OPCODE_WRITE):
-
-            # Write opreation, extract value
-            values = struct.unpack('I' * n, data[16:])        
-
-            # Return reply packet
-            writeMemory(address, n, values)
-            packet = struct.pack("II", 
-                                 psn, 
-                                 address)
-            sock.sendto(packet, addr)
-            print "Request to write value %d to address %#08X" % (values[0], address)
+        if opcode == OPCODE_READ:
+            return struct.pack(UCP_reply_fmt, psn, address) + self.memory.read(address, n).tostring()
+
+        elif opcode == OPCODE_FIFO_READ:
+            values = array('I')
+            for i in range(n):
+                values.extend(self.memory.read(address, 1))
+            return struct.pack(UCP_reply_fmt, psn, address) + values.tostring()
+
+        # Remaining opcodes require a payload of n words
+        if len(payload) < n:
+            return error
+
+        if opcode == OPCODE_WRITE:
+            self.memory.write(address, payload[:n])
+
+        elif opcode == OPCODE_FIFO_WRITE:
+            for i in range(n):
+                self.memory.write(address, payload[i : i + 1])
+
+        elif opcode in (OPCODE_BITWISE_AND, OPCODE_BITWISE_OR):
+            values = self.memory.read(address, n)
+            for i in range(n):
+                if opcode == OPCODE_BITWISE_AND:
+                    values[i] &= payload[i]
+                else:
+                    values[i] |= payload[i]
+            self.memory.write(address, values)
+
+        # Bit write payload is assumed to be a mask followed by a value
+        elif opcode == OPCODE_BIT_WRITE and n >= 2:
+            value = self.memory.read(address, 1)
+            value[0] = (value[0] & ~payload[0] & 0xFFFFFFFF) | (payload[1] & payload[0])
+            self.memory.write(address, value)
+
         else:
-            print "Unsupported opcode %d" % opcode
-            continue
+            return error
+
+        return struct.pack(UCP_reply_fmt, psn, address)
+
+# Script entry point
+if __name__ == "__main__":
+
+    # Parse command line options
+    parser = OptionParser(usage="usage: %prog [options]")
+    parser.add_option("-p", "--port", dest="port", type="int", default=UDP_PORT,
+                      help="UDP port of first board [default: %d]" % UDP_PORT)
+    parser.add_option("-n", "--boards", dest="boards", type="int", default=1,
+                      help="Number of boards, listening on consecutive ports [default: 1]")
+    parser.add_option("-l", "--latency", dest="latency", type="float", default=0.0,
+                      help="Reply latency in milliseconds [default: 0]")
+    parser.add_option("--loss", dest="loss", type="float", default=0.0,
+                      help="Fraction of requests which are dropped [default: 0]")
+    parser.add_option("--spi-busy", dest="spi_busy", type="int", default=0,
+                      help="Number of times SPI command is polled as busy [default: 0]")
+    parser.add_option("-v", "--verbose", dest="verbose", action="store_true", default=False,
+                      help="Print every request")
+    (options, args) = parser.parse_args()
+
+    # Create boards
+    boards = { }
+    for i in range(options.boards):
+        board = MockTPM(options.port + i, options.spi_busy)
+        boards[board.sock] = board
+    print "Serving %d mock TPM(s) on ports %d-%d" % (options.boards, options.port, options.port + options.boards - 1)
+
+    # Replies waiting for their latency to elapse, ordered by send time
+    pending = []
+
+    try:
+        while True:
+            # Wait for requests, or until the next reply is due
+            timeout = max(0.0, pending[0][0] - time.time()) if pending else None
+            readable, _, _ = select.select(boards.keys(), [], [], timeout)
+
+            for sock in readable:
+                data, addr = sock.recvfrom(65536)
+
+                # Emulate packet loss
+                if options.loss > 0 and random.random() < options.loss:
+                    continue
+
+                board = boards[sock]
+                reply = board.process(data)
+                if options.verbose:
+                    print "Port %d: %d byte request from %s" % (board.port, len(data), addr[0])
+                if reply is None:
+                    continue
+
+                if options.latency > 0:
+                    heapq.heappush(pending, (time.time() + options.latency / 1000.0, sock, reply, addr))
+                else:
+                    sock.sendto(reply, addr)
+
+            # Send replies which are due
+            while pending and pending[0][0] <= time.time():
+                _, sock, reply, addr = heapq.heappop(pending)
+                sock.sendto(reply, addr)
+
+    except KeyboardInterrupt:
+        for board in sorted(boards.values(), key = lambda b: b.port):
+            print "Port %d: %d requests processed" % (board.port, board.packets)
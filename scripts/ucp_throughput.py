@@ -0,0 +1,54 @@
+# This script measures read and write throughput for large memory transfers
+# for different pipeline window sizes. Can be run against a real board or mock_tpm.py
+
+from optparse import OptionParser
+import time
+import sys
+sys.path.append("../python")
+
+import numpy as np
+from accesslayer import *
+
+# Script entry point
+if __name__ == "__main__":
+
+    # Parse command line options
+    parser = OptionParser(usage="usage: %prog [options]")
+    parser.add_option("--ip", dest="ip", default="127.0.0.1", help="Board IP [default: 127.0.0.1]")
+    parser.add_option("--port", dest="port", type="int", default=10000, help="Board port [default: 10000]")
+    parser.add_option("--library", dest="library", default=None, help="Path to libboard.so")
+    parser.add_option("--address", dest="address", type="int", default=0x1000, help="Base address [default: 0x1000]")
+    parser.add_option("--words", dest="words", type="int", default=16384, help="Words per transfer [default: 16384]")
+    parser.add_option("--iterations", dest="iterations", type="int", default=10, help="Transfers per test [default: 10]")
+    parser.add_option("--windows", dest="windows", default="1,4,16,32", help="Window sizes to test [default: 1,4,16,32]")
+    (options, args) = parser.parse_args()
+
+    # Connect to board
+    tpm = TPM(ip=options.ip, port=options.port, library=options.library)
+    values = np.arange(options.words, dtype=np.uint32)
+    buf = np.empty(options.words, dtype=np.uint32)
+    megabytes = options.words * 4 * options.iterations / 1e6
+
+    print "Window\tWrite (MB/s)\tRead (MB/s)"
+    for window in [int(w) for w in options.windows.split(',')]:
+        tpm.set_window_size(window)
+
+        # Time writes
+        t0 = time.time()
+        for i in range(options.iterations):
+            tpm.write_address(options.address, values)
+        write_time = time.time() - t0
+
+        # Time reads
+        t0 = time.time()
+        for i in range(options.iterations):
+            tpm.read_address_into(options.address, buf)
+        read_time = time.time() - t0
+
+        # Check that what was read is what was written
+        if not np.array_equal(buf, values):
+            print "Read back values do not match for window size %d" % window
+
+        print "%d\t%.2f\t\t%.2f" % (window, megabytes / write_time, megabytes / read_time)
+
+    tpm.disconnect()
@@ -6,7 +6,10 @@
 
 
 // Includes and namespaces
+#include <pthread.h>
+#include <unistd.h>
 #include <string>
+#include <memory>
 #include <map>
 
 #include "AccessLayer.hpp"
@@ -19,8 +22,60 @@ using namespace std;
 
 // The global boards map. Each board is identified via an IP address, which
 // is translated into a board ID. All operation on the board are perofmed 
-// through the same instance (similiar to the Singleton design pattern)make
-map<unsigned int, Board *> boards;
+// through the same instance (similiar to the Singleton design pattern)make.
+// Calls hold a reference to the board, such that it is only deleted once
+// the last call on a disconnected board returns
+map<unsigned int, shared_ptr<Board> > boards;
+
+// Read-write lock on the boards map, held only while looking up, adding or
+// removing boards. Calls on different boards are served concurrently
+pthread_rwlock_t boards_lock = PTHREAD_RWLOCK_INITIALIZER;
+
+// Look up a board in the map, returning an empty reference if not connected
+static shared_ptr<Board> findBoard(ID id)
+{
+    shared_ptr<Board> board;
+    pthread_rwlock_rdlock(&boards_lock);
+    map<unsigned int, shared_ptr<Board> >::iterator it = boards.find(id);
+    if (it != boards.end())
+        board = it -> second;
+    pthread_rwlock_unlock(&boards_lock);
+    return board;
+}
+
+// Look up a board and hold its lock for the lifetime of the object. Requests to
+// the same board are serialised, since protocol instances reuse their buffers
+class BoardLock
+{
+    public:
+        BoardLock(ID id) : board(NULL)
+        {
+            reference = findBoard(id);
+            if (!reference)
+                return;
+
+            // The board may have been disconnected while waiting for its lock
+            reference -> mutex.lock();
+            if (findBoard(id) == reference)
+                board = reference.get();
+            else
+            {
+                reference -> mutex.unlock();
+                reference.reset();
+            }
+        }
+
+        ~BoardLock()
+        {
+            if (board != NULL)
+                board -> mutex.unlock();
+        }
+
+        Board *board;
+
+    private:
+        shared_ptr<Board> reference;
+};
 
 // Set up internal structures to be able to communicate with a processing board
 // Arguments:
@@ -34,19 +89,15 @@ ID  connectBoard(BOARD_MAKE boardMake, const char* IP, unsigned short port)
     DEBUG_PRINT("AccessLayer::connect. Board " << IP << " has ID " << id);
     
     // If board already exists in map, return ID
-    if (boards.size() != 0)
+    if (findBoard(id))
     {
-        map<unsigned int, Board *>::iterator it;
-        it = boards.find(id);
-        if (it != boards.end())
-        {
-            DEBUG_PRINT("AccessLayer::connect. Board " << IP << " already connected");
-            return id;
-        }
+        DEBUG_PRINT("AccessLayer::connect. Board " << IP << " already connected");
+        return id;
     }
 
-    // If not, create board instance, store in map
-    Board *board;
+    // If not, create board instance. This is done without holding the lock,
+    // since connecting to the board can take some time
+    Board *board = NULL;
 
     switch (boardMake)
     {
@@ -67,11 +118,28 @@ ID  connectBoard(BOARD_MAKE boardMake, const char* IP, unsigned short port)
     }
 
     // Check if board connected succesfully
+    if (board == NULL)
+        return 0;
     if (board -> getStatus() == NETWORK_ERROR)
+    {
+        delete board;
         return 0;
+    }
+
+    // Store in map, unless the board was connected by another caller in the meantime
+    pthread_rwlock_wrlock(&boards_lock);
+    bool stored = boards.find(id) == boards.end();
+    if (stored)
+        boards[id] = shared_ptr<Board>(board);
+    pthread_rwlock_unlock(&boards_lock);
+
+    if (!stored)
+    {
+        board -> disconnect();
+        delete board;
+    }
 
     // Return generated board ID
-    boards[id] = board;
     DEBUG_PRINT("AccessLayer::connect. Connected to " << IP);
     return id;
 }
@@ -79,27 +147,29 @@ ID  connectBoard(BOARD_MAKE boardMake, const char* IP, unsigned short port)
 // Clear up internal network structures for board in question
 RETURN  disconnectBoard(ID id)
 {    
-    // Check if board exists, and if not, return
-    if (boards.size() == 0)
-        return SUCCESS;
+    // Remove board from map, such that no new calls are made on it
+    pthread_rwlock_wrlock(&boards_lock);
+    map<unsigned int, shared_ptr<Board> >::iterator it = boards.find(id);
+    shared_ptr<Board> board;
+    if (it != boards.end())
+    {
+        board = it -> second;
+        boards.erase(it);
+    }
+    pthread_rwlock_unlock(&boards_lock);
 
-    map<unsigned int, Board *>::iterator it;
-    it = boards.find(id);
-    if (it == boards.end()) 
+    // Check if board exists, and if not, return
+    if (!board)
     {
         DEBUG_PRINT("AccessLayer::disconnect. " << id << " not connected");
         return SUCCESS;    
     }
 
-    // Check if there any any pending requests, if so wait
-    // TODO
-
-    // Call board disconnect
-    Board *board = it -> second;
+    // Wait for calls on the board to finish and call board disconnect. The
+    // Board object is deleted when the last reference to it is released
+    board -> mutex.lock();
     board -> disconnect();
-
-    // Once everything is done, erase Board object and return
-    boards.erase(it);
+    board -> mutex.unlock();
 
     DEBUG_PRINT("AccessLayer::disconnect. " << id << " disconnected");
 
@@ -122,18 +192,15 @@ STATUS  getStatus(ID id)
 // Get list of registers
 REGISTER_INFO*  getRegisterList(ID id, UINT *num_registers)
 {    
-    // Check if board exists
-    map<unsigned int, Board *>::iterator it;
-    it = boards.find(id);
-    if (it == boards.end()) 
+    // Look up board, which is locked until the call returns
+    BoardLock lock(id);
+    Board *board = lock.board;
+    if (board == NULL)
     {
         DEBUG_PRINT("AccessLayer::getRegisterList. " << id << " not connected");
         return NULL;   
     }
 
-    // Get pointer to board
-    Board *board = it -> second;
-
     // Return register list
     return board -> getRegisterList(num_registers);
 }
@@ -141,18 +208,15 @@ REGISTER_INFO*  getRegisterList(ID id, UINT *num_registers)
 // Get list of SPI devices
 SPI_DEVICE_INFO*  getDeviceList(ID id, UINT *num_devices)
 {
-    // Check if board exists
-    map<unsigned int, Board *>::iterator it;
-    it = boards.find(id);
-    if (it == boards.end())
+    // Look up board, which is locked until the call returns
+    BoardLock lock(id);
+    Board *board = lock.board;
+    if (board == NULL)
     {
         DEBUG_PRINT("AccessLayer::getDeviceList. " << id << " not connected");
         return NULL;   
     }
 
-    // Get pointer to board
-    Board *board = it -> second;
-
     // Return device list
     return board -> getDeviceList(num_devices);
 }
@@ -160,18 +224,15 @@ SPI_DEVICE_INFO*  getDeviceList(ID id, UINT *num_devices)
 // Get a register's value
 VALUES  readRegister(ID id, DEVICE device, REGISTER reg, UINT n, UINT offset)
 {  
-    // Check if board exists
-    map<unsigned int, Board *>::iterator it;
-    it = boards.find(id);
-    if (it == boards.end()) 
+    // Look up board, which is locked until the call returns
+    BoardLock lock(id);
+    Board *board = lock.board;
+    if (board == NULL)
     {
         DEBUG_PRINT("AccessLayer::readAddress. " << id << " not connected");
         return {0, FAILURE};
     }
 
-    // Get pointer to board
-    Board *board = it -> second;
-
     // Get register value from board
     return board -> readRegister(device, reg, n, offset);
 }
@@ -179,18 +240,15 @@ VALUES  readRegister(ID id, DEVICE device, REGISTER reg, UINT n, UINT offset)
 // Set a register's value
 RETURN  writeRegister(ID id, DEVICE device, REGISTER reg, UINT *values, UINT n, UINT offset)
 {    
-    // Check if board exists
-    map<unsigned int, Board *>::iterator it;
-    it = boards.find(id);
-    if (it == boards.end()) 
+    // Look up board, which is locked until the call returns
+    BoardLock lock(id);
+    Board *board = lock.board;
+    if (board == NULL)
     {
         DEBUG_PRINT("AccessLayer::writeAddress. " << id << " not connected");
         return FAILURE;
     }
 
-    // Get pointer to board
-    Board *board = it -> second;
-
     // Get register value from board
     return board -> writeRegister(device, reg, values, n, offset);
 }
@@ -198,18 +256,15 @@ RETURN  writeRegister(ID id, DEVICE device, REGISTER reg, UINT *values, UINT n,
 // Read from address
 VALUES  readAddress(ID id, UINT address, UINT n)
 {
-    // Check if board exists
-    map<unsigned int, Board *>::iterator it;
-    it = boards.find(id);
-    if (it == boards.end()) 
+    // Look up board, which is locked until the call returns
+    BoardLock lock(id);
+    Board *board = lock.board;
+    if (board == NULL)
     {
         DEBUG_PRINT("AccessLayer::readAddress. " << id << " not connected");
         return {0, FAILURE};
     }
 
-    // Get pointer to board
-    Board *board = it -> second;
-
     // Get address value from board
     return board -> readAddress(address, n);
 }
@@ -218,37 +273,95 @@ VALUES  readAddress(ID id, UINT address, UINT n)
 // Write from address
 RETURN  writeAddress(ID id, UINT address, UINT *values, UINT n)
 {
-    // Check if board exists
-    map<unsigned int, Board *>::iterator it;
-    it = boards.find(id);
-    if (it == boards.end()) 
+    // Look up board, which is locked until the call returns
+    BoardLock lock(id);
+    Board *board = lock.board;
+    if (board == NULL)
     {
         DEBUG_PRINT("AccessLayer::writeAddress. " << id << " not connected");
         return FAILURE;
     }
 
-    // Get pointer to board
-    Board *board = it -> second;
-
     // Write value to address on board
     return board -> writeAddress(address, values, n);
 }
 
+// Set number of outstanding requests for multi-packet transfers
+RETURN  setWindowSize(ID id, UINT window)
+{
+    // Look up board, which is locked until the call returns
+    BoardLock lock(id);
+    Board *board = lock.board;
+    if (board == NULL)
+    {
+        DEBUG_PRINT("AccessLayer::setWindowSize. " << id << " not connected");
+        return FAILURE;
+    }
+
+    // Set window size on board's protocol
+    return board -> setWindowSize(window);
+}
+
+// Read from multiple memory areas
+VALUES  readAddressBatch(ID id, UINT *addresses, UINT *counts, UINT nsegments)
+{
+    // Look up board, which is locked until the call returns
+    BoardLock lock(id);
+    Board *board = lock.board;
+    if (board == NULL)
+    {
+        DEBUG_PRINT("AccessLayer::readAddressBatch. " << id << " not connected");
+        return {0, FAILURE};
+    }
+
+    // Get values from board
+    return board -> readAddressBatch(addresses, counts, nsegments);
+}
+
+// Write to multiple memory areas
+RETURN  writeAddressBatch(ID id, UINT *addresses, UINT *counts, UINT nsegments, UINT *values)
+{
+    // Look up board, which is locked until the call returns
+    BoardLock lock(id);
+    Board *board = lock.board;
+    if (board == NULL)
+    {
+        DEBUG_PRINT("AccessLayer::writeAddressBatch. " << id << " not connected");
+        return FAILURE;
+    }
+
+    // Write values to board
+    return board -> writeAddressBatch(addresses, counts, nsegments, values);
+}
+
+// Write to bits within multiple words
+RETURN  writeAddressMasked(ID id, UINT *addresses, UINT *masks, UINT *values, UINT n)
+{
+    // Look up board, which is locked until the call returns
+    BoardLock lock(id);
+    Board *board = lock.board;
+    if (board == NULL)
+    {
+        DEBUG_PRINT("AccessLayer::writeAddressMasked. " << id << " not connected");
+        return FAILURE;
+    }
+
+    // Write values to board
+    return board -> writeAddressMasked(addresses, masks, values, n);
+}
+
 // Get a device's value
 VALUES  readDevice(ID id, REGISTER device, UINT address)
 {
-    // Check if board exists
-    map<unsigned int, Board *>::iterator it;
-    it = boards.find(id);
-    if (it == boards.end()) 
+    // Look up board, which is locked until the call returns
+    BoardLock lock(id);
+    Board *board = lock.board;
+    if (board == NULL)
     {
         DEBUG_PRINT("AccessLayer::readDevice. " << id << " not connected");
         return {0, FAILURE};
     }
 
-    // Get pointer to board
-    Board *board = it -> second;
-
     // Get register value from board
     return board -> readDevice(device, address);
 }
@@ -256,22 +369,35 @@ VALUES  readDevice(ID id, REGISTER device, UINT address)
 // Set a device's value
 RETURN  writeDevice(ID id, REGISTER device, UINT address, UINT value)
 {
-    // Check if board exists
-    map<unsigned int, Board *>::iterator it;
-    it = boards.find(id);
-    if (it == boards.end()) 
+    // Look up board, which is locked until the call returns
+    BoardLock lock(id);
+    Board *board = lock.board;
+    if (board == NULL)
     {
         DEBUG_PRINT("AccessLayer::writeDevice. " << id << " not connected");
         return FAILURE;
     }
 
-    // Get pointer to board
-    Board *board = it -> second;
-
     // Write value to address on board
     return board -> writeDevice(device, address, value);
 }
 
+// Issue a list of SPI transactions
+RETURN  executeDeviceTransactions(ID id, SPI_TRANSACTION *transactions, UINT n)
+{
+    // Look up board, which is locked until the call returns
+    BoardLock lock(id);
+    Board *board = lock.board;
+    if (board == NULL)
+    {
+        DEBUG_PRINT("AccessLayer::executeDeviceTransactions. " << id << " not connected");
+        return FAILURE;
+    }
+
+    // Execute transactions on board
+    return board -> executeDeviceTransactions(transactions, n);
+}
+
 // Get list of firmware on board
 FIRMWARE  getFirmware(ID id, DEVICE device, UINT *num_firmware)
 {
@@ -279,18 +405,15 @@ FIRMWARE  getFirmware(ID id, DEVICE device, UINT *num_firmware)
     if (!(device == FPGA_1 || device == FPGA_2))
         return NULL;
 
-    // Check if board exists
-    map<unsigned int, Board *>::iterator it;
-    it = boards.find(id);
-    if (it == boards.end()) 
+    // Look up board, which is locked until the call returns
+    BoardLock lock(id);
+    Board *board = lock.board;
+    if (board == NULL)
     {
         DEBUG_PRINT("AccessLayer::getFirmware. " << id << " not connected");
         return NULL;   
     }
 
-    // Get pointer to board
-    Board *board = it -> second;
-
     // Cal getFirmware on board instance
     return board -> getFirmware(device, num_firmware);
 }
@@ -303,17 +426,15 @@ RETURN  loadFirmware(ID id, DEVICE device, const char* bitstream)
     if (!(device == FPGA_1 || device == FPGA_2))
         return FAILURE;
 
-    // Check if board exists
-    map<unsigned int, Board *>::iterator it;
-    it = boards.find(id);
-    if (it == boards.end()) 
+    // Look up board, which is locked until the call returns
+    BoardLock lock(id);
+    Board *board = lock.board;
+    if (board == NULL)
     {
         DEBUG_PRINT("AccessLayer::loadFirmware. " << id << " not connected");
         return FAILURE;   
     }
 
-    // Get pointer to board
-    Board *board = it -> second;
     
     // Call loadFirmware on board instance
     return board -> loadFirmwareBlocking(device, bitstream);
@@ -330,21 +451,49 @@ RETURN  loadFirmwareBlocking(ID id, DEVICE device, const char* bitstream)
         return FAILURE;
     }
 
-    // Check if board exists
-    map<unsigned int, Board *>::iterator it;
-    it = boards.find(id);
-    if (it == boards.end()) 
+    // Look up board, which is locked until the call returns
+    BoardLock lock(id);
+    Board *board = lock.board;
+    if (board == NULL)
     {
         DEBUG_PRINT("AccessLayer::loadFirmwareBlocking. " << id << " not connected");
         return FAILURE;   
     }
 
-    // Get pointer to board
-    Board *board = it -> second;
-
     // Call loadFirmwareBlocking on board instance
     return board -> loadFirmwareBlocking(device, bitstream);
 }
+
+// Compile a memory map into its binary cache file
+RETURN  compileMemoryMap(const char *filepath)
+{
+    // Check if memory map exists
+    if (access(filepath, R_OK) != 0)
+    {
+        DEBUG_PRINT("AccessLayer::compileMemoryMap. Cannot read " << filepath);
+        return FAILURE;
+    }
+
+    // Parse XML file and write cache
+    MemoryMap memory_map(const_cast<char *>(filepath), false);
+    return memory_map.saveCache();
+}
+
+// Get checksum of the memory map loaded on a board
+RETURN  getMemoryMapChecksum(ID id, UINT *checksum)
+{
+    // Look up board, which is locked until the call returns
+    BoardLock lock(id);
+    Board *board = lock.board;
+    if (board == NULL)
+    {
+        DEBUG_PRINT("AccessLayer::getMemoryMapChecksum. " << id << " not connected");
+        return FAILURE;   
+    }
+
+    // Call getMemoryMapChecksum on board instance
+    return board -> getMemoryMapChecksum(checksum);
+}
 /*
 // [Optional] Set a periodic register
 RETURN setPeriodicRegister(ID id, DEVICE device, REGISTER reg, int period, CALLBACK callback)
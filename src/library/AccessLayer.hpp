@@ -100,6 +100,48 @@ extern "C" VALUES readAddress(ID id, UINT address, UINT n = 1);
 //    VALUE 
 extern "C" RETURN writeAddress(ID id, UINT address, UINT *values, UINT n = 1);
 
+// Set the number of requests which can be in flight at any one time when a
+// read or write is split up into multiple packets
+// Arguments:
+//   id      Board ID
+//   window  Number of outstanding requests (1 issues one request at a time)
+// Returns:
+//    RETURN
+extern "C" RETURN setWindowSize(ID id, UINT window);
+
+// Read from multiple memory areas in a single pipelined batch
+// Arguments:
+//   id         Board ID
+//   addresses  Start address of each area
+//   counts     Number of words to read from each area
+//   nsegments  Number of areas
+// Returns:
+//    VALUES, containing the values of all areas one after the other
+extern "C" VALUES readAddressBatch(ID id, UINT *addresses, UINT *counts, UINT nsegments);
+
+// Write to multiple memory areas in a single pipelined batch
+// Arguments:
+//   id         Board ID
+//   addresses  Start address of each area
+//   counts     Number of words to write to each area
+//   nsegments  Number of areas
+//   values     Values for all areas, one after the other
+// Returns:
+//    RETURN
+extern "C" RETURN writeAddressBatch(ID id, UINT *addresses, UINT *counts, UINT nsegments, UINT *values);
+
+// Write to bits within multiple words, leaving the other bits untouched. The
+// merge is performed on the board, so words are not read first
+// Arguments:
+//   id         Board ID
+//   addresses  Address of each word
+//   masks      Bits to write in each word
+//   values     New value of each word (only bits in mask are used)
+//   n          Number of words
+// Returns:
+//    RETURN
+extern "C" RETURN writeAddressMasked(ID id, UINT *addresses, UINT *masks, UINT *values, UINT n);
+
 // [Optional] Set a periodic register
 // Arguments:
 //   id       Board ID
@@ -170,6 +212,16 @@ extern "C" VALUES readDevice(ID id, REGISTER device, UINT address);
 //    VALUE 
 extern "C" RETURN writeDevice(ID id, REGISTER device, UINT address, UINT value);
 
+// Issue a list of SPI transactions. Transactions are executed in order, read
+// values are stored in the transactions' value field
+// Arguments:
+//   id            Board ID
+//   transactions  List of transactions
+//   n             Number of transactions
+// Returns:
+//   RETURN, the error field of each completed transaction is set to SUCCESS
+extern "C" RETURN executeDeviceTransactions(ID id, SPI_TRANSACTION *transactions, UINT n);
+
 // ======================== FIRMWARE RELATED FUNCTIONS ========================
 
 // NOTE: Currently it is assumed that the memory map will be located in the same
@@ -198,6 +250,23 @@ extern "C" RETURN loadFirmware(ID id, DEVICE device, const char* bitstream);
 // an error occurs
 extern "C" RETURN loadFirmwareBlocking(ID id, DEVICE device, const char* bitstream);
 
+// Compile a memory map into its binary cache file, which is used instead of
+// the XML file by subsequent firmware loads until the XML file changes
+// Arguments:
+//    filepath      Path to memory map XML file
+// Returns:
+//    RETURN
+extern "C" RETURN compileMemoryMap(const char *filepath);
+
+// Get checksum of the memory map loaded on a board. Boards with the same
+// checksum share the same memory map
+// Arguments:
+//    id            Board ID
+//    checksum      Return memory map checksum
+// Returns:
+//    RETURN
+extern "C" RETURN getMemoryMapChecksum(ID id, UINT *checksum);
+
 // Request RF data from the running firmware. This is still TBD
 
 
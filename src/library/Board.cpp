@@ -10,16 +10,70 @@ Board::Board(const char *ip, unsigned short port)
     this -> protocol    = NULL;
 }
 
+// Set number of requests which can be in flight for multi-packet transfers
+RETURN Board::setWindowSize(UINT window)
+{
+    // Check if we are connected
+    if (this -> protocol == NULL)
+        return FAILURE;
+
+    return this -> protocol -> setWindowSize(window);
+}
+
+// Read from multiple memory areas in a single batch
+VALUES Board::readAddressBatch(UINT *addresses, UINT *counts, UINT nsegments)
+{
+    // Check if we are connected
+    if (this -> protocol == NULL)
+        return {NULL, FAILURE};
+
+    return this -> protocol -> readRegisterBatch(addresses, counts, nsegments);
+}
+
+// Write to multiple memory areas in a single batch
+RETURN Board::writeAddressBatch(UINT *addresses, UINT *counts, UINT nsegments, UINT *values)
+{
+    // Check if we are connected
+    if (this -> protocol == NULL)
+        return FAILURE;
+
+    return this -> protocol -> writeRegisterBatch(addresses, counts, nsegments, values);
+}
+
+// Write bits within multiple words without reading them first
+RETURN Board::writeAddressMasked(UINT *addresses, UINT *masks, UINT *values, UINT n)
+{
+    // Check if we are connected
+    if (this -> protocol == NULL)
+        return FAILURE;
+
+    return this -> protocol -> writeRegisterMasked(addresses, masks, values, n);
+}
+
+// Get checksum of the loaded memory map
+RETURN Board::getMemoryMapChecksum(UINT *checksum)
+{
+    // Check if a memory map has been loaded
+    if (this -> memory_map == NULL)
+        return FAILURE;
+
+    *checksum = this -> memory_map -> getChecksum();
+    return SUCCESS;
+}
+
 // Get values for all registers (called after getRegisterList)
 void Board::initialiseRegisterValues(REGISTER_INFO *regInfo, int num_registers)
 {
 	// For all registers
 	for(int i = 0; i < num_registers; i++)
 	{
-		REGISTER_INFO reg = regInfo[i];
+		REGISTER_INFO &reg = regInfo[i];
 		VALUES values = this -> readRegister(reg.device, reg.name);
 		if (values.error == SUCCESS)
+		{
 			reg.value = values.values[0];
+			free(values.values);
+		}
 		else
 			reg.value = 0;
 	}
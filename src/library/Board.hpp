@@ -8,6 +8,7 @@
 #include "SPI.hpp"  
 
 #include <string.h>
+#include <mutex>
 
 using namespace std;
 
@@ -20,6 +21,9 @@ class Board
         // Board constructor
         Board(const char *ip, unsigned short port);
 
+        // Board destructor, boards are deleted through Board pointers
+        virtual ~Board() { }
+
     // ---------- Public class functions --------
     public:
 
@@ -57,6 +61,23 @@ class Board
         virtual SPI_DEVICE_INFO *getDeviceList(UINT *num_devices) = 0;
         virtual VALUES          readDevice(REGISTER device, UINT address) = 0;
         virtual RETURN          writeDevice(REGISTER device, UINT address, UINT value) = 0;
+        virtual RETURN          executeDeviceTransactions(SPI_TRANSACTION *transactions, UINT n) = 0;
+
+        // Set number of requests which can be in flight for multi-packet transfers
+        RETURN setWindowSize(UINT window);
+
+        // Read from and write to multiple memory areas in a single batch
+        VALUES readAddressBatch(UINT *addresses, UINT *counts, UINT nsegments);
+        RETURN writeAddressBatch(UINT *addresses, UINT *counts, UINT nsegments, UINT *values);
+
+        // Write bits within multiple words without reading them first
+        RETURN writeAddressMasked(UINT *addresses, UINT *masks, UINT *values, UINT n);
+
+        // Get checksum of the loaded memory map
+        RETURN getMemoryMapChecksum(UINT *checksum);
+
+        // Held by the access layer for the duration of each call on the board
+        std::mutex mutex;
 	
 	// ---------- Protected call function ----------
 		void initialiseRegisterValues(REGISTER_INFO *regInfo, int num_registers);
@@ -53,6 +53,10 @@ typedef enum {SENSOR            = 1,
 // ### Register access permissions 
 typedef enum {READ = 1, WRITE = 2, READWRITE = 3} PERMISSION;
 
+// Whether a register's value can change without being written by the host.
+// Used by clients to decide whether register values can be cached
+typedef enum {VOLATILITY_UNKNOWN = 0, VOLATILE = 1, NON_VOLATILE = 2} VOLATILITY;
+
 // Encapsulate a register or sensor value. This structure is require to avoid
 // assigning a particular value as the error value, or avoid using reference
 // varaibles in the parameter list. This structure can be extended if 
@@ -69,6 +73,7 @@ typedef struct REGISTER_INFO {
     REGISTER_TYPE type;         // Sensor, board-register or firmware-register
     DEVICE        device;       // Set of FPGAs (if any) to which this is applicable
     PERMISSION    permission;   // Define register access type
+    VOLATILITY    volatility;   // Whether value can change without being written
     UINT          bitmask;      // Register bitmask
     UINT          bits;         // Number of bits
 	UINT          value;        // Initial value 
@@ -76,6 +81,19 @@ typedef struct REGISTER_INFO {
     const char    *description; // Register string description
 } REGISTER_INFO;
 
+// SPI transaction operations
+typedef enum {SPI_READ = 1, SPI_WRITE = 2} SPI_OPERATION;
+
+// Encapsulate a single SPI transaction, used to issue a list of transactions
+// to the SPI controller in one call
+typedef struct SPI_TRANSACTION {
+    REGISTER      device;       // SPI device name
+    UINT          address;      // Address on device
+    SPI_OPERATION op;           // Read or write
+    UINT          value;        // Value to write, or value read
+    RETURN        error;        // SUCCESS once transaction has completed
+} SPI_TRANSACTION;
+
 // Encapsulate SPI device information 
 typedef struct SPI_DEVICE_INFO {
     REGISTER      name;         // String representation of register
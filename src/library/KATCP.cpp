@@ -2,41 +2,132 @@
 #include "KATCP.hpp"
 #include "Utils.hpp"
 
-#include <sys/select.h>
+#include <netinet/tcp.h>
 #include <unistd.h>
 #include <stdio.h>
 #include <errno.h>
 
 #include <algorithm>
-#include <sstream>
 #include <iostream>
 
 using namespace std;
 
-// ========================== Private functions =======================
+// ========================== Helper functions ========================
+
+// Check whether line starts with prefix
+static inline bool hasPrefix(const char *line, size_t length, const char *prefix)
+{
+    size_t size = strlen(prefix);
+    return length >= size && memcmp(line, prefix, size) == 0;
+}
+
+// Escape byte, writing the one or two resulting characters to out
+static inline size_t escapeByte(unsigned char c, char *out)
+{
+    char escaped;
+    switch (c)
+    {
+        case '\0': escaped = '0';  break;
+        case '\t': escaped = 't';  break;
+        case '\n': escaped = 'n';  break;
+        case '\r': escaped = 'r';  break;
+        case '\'': escaped = '\''; break;
+        case '"':  escaped = '"';  break;
+        case '\\': escaped = '\\'; break;
+        case ' ':  escaped = '_';  break;
+        default:
+            out[0] = c;
+            return 1;
+    }
+
+    out[0] = '\\';
+    out[1] = escaped;
+    return 2;
+}
+
+// Escape words as big-endian binary data. Out must have space for 8 characters
+// per word. Returns the number of characters written
+static size_t escapeWords(const UINT *values, UINT n, char *out)
+{
+    char *start = out;
+    for(unsigned i = 0; i < n; i++)
+    {
+        out += escapeByte((values[i] >> 24) & 0xFF, out);
+        out += escapeByte((values[i] >> 16) & 0xFF, out);
+        out += escapeByte((values[i] >> 8)  & 0xFF, out);
+        out += escapeByte( values[i]        & 0xFF, out);
+    }
+    return out - start;
+}
+
+// Process KATCP escapes in place, returning the unescaped length
+static size_t unescapeData(char *data, size_t length)
+{
+    size_t j = 0;
+    for(size_t i = 0; i < length; i++)
+    {
+        char c = data[i];
+        if (c == '\\' && i + 1 < length)
+        {
+            switch (data[++i])
+            {
+                case '0': c = '\0';   break;
+                case 'e': c = '\x1b'; break;
+                case 't': c = '\t';   break;
+                case 'n': c = '\n';   break;
+                case 'r': c = '\r';   break;
+                case '_': c = ' ';    break;
+                case '@': continue;   // Empty argument
+                default:  c = data[i];
+            }
+        }
+        data[j++] = c;
+    }
+    return j;
+}
 
-// Process inform from board.
-void KATCP::processInforms(string entry)
-{  
-    string logPrefix = "#log"; 
-    string clientConnectedPrefix = "#client-connected";
+// ========================== Private functions =======================
 
-    // Emptry inform, ignore
-    if (entry.size() < 2)
-        return;
+// Process inform from board
+void KATCP::processInform(char *line, size_t length)
+{
+    // Print log messages, which are the last argument of #log informs
+    if (hasPrefix(line, length, "#log "))
+    {
+        char *message = line + length;
+        while (message > line && *(message - 1) != ' ')
+            message--;
+        size_t size = unescapeData(message, line + length - message);
+        cout << string(message, size) << endl;
+    }
 
-    // Client connected inform, ignore
-    else if (entry.substr(0, clientConnectedPrefix.size()) == clientConnectedPrefix)
-        return;
+    // Other informs, including #client-connected, are ignored
+}
 
-    // Process logs
-    else if (entry.substr(0, logPrefix.size()) == logPrefix)
+// Send data to board, continuing until all bytes are sent
+RETURN KATCP::sendData(const char *buffer, size_t count)
+{
+    size_t sent = 0;
+    unsigned int retries = 3;
+    while(sent < count)
     {
-        entry = entry.substr(logPrefix.size(), entry.size());
-        vector<string> entries = split(entry,  ' ');
-        entry = processEscapes(entries[3]);
-        cout << entry << endl;
+        ssize_t s = write(this -> sockfd, buffer + sent, count - sent);
+
+        // If write was interrupted, or unsuccesful and we still have a retry, continue
+        if (s < 0 && errno == EINTR)
+            continue;
+        else if (s < 0 && retries > 0)
+            retries--;
+        else if (s < 0)  // No retries left, issue error
+        {
+            DEBUG_PRINT("KATCP::sendData. Failed to write command to KATCP device");
+            return FAILURE;
+        }
+        else
+            sent += s;
     }
+
+    return SUCCESS;
 }
 
 // Send KATCP request
@@ -48,119 +139,113 @@ void KATCP::sendRequest(string command, vector<string> args)
         command_string += " " + s;
     command_string += "\n";
 
-    const char *buf = command_string.c_str();
-    unsigned int count = command_string.size();
-    unsigned int sent = 0;
-    unsigned int retries = 3;
+    sendData(command_string.c_str(), command_string.size());
+}
 
-    // Safe write, continue issuing the write request until
-    // all the bytes are sent
-    while(sent < count)
+// Get next line received from board. Data is read from the socket into the
+// receive buffer as needed, and lines are returned in place
+RETURN KATCP::readLine(char **line, size_t *length)
+{
+    size_t scanned = 0;
+    while (true)
     {
-        unsigned int s = write(this -> sockfd, buf, count - sent);
+        // Return next complete line, if any
+        char *start   = rx_buffer.data() + rx_start;
+        char *newline = (char *) memchr(start + scanned, '\n', rx_end - rx_start - scanned);
+        if (newline != NULL)
+        {
+            *newline = '\0';
+            *line    = start;
+            *length  = newline - start;
+            rx_start += *length + 1;
+            return SUCCESS;
+        }
+        scanned = rx_end - rx_start;
 
-        // If write was unsuccesful and we still have a retry, continue
-        if (s < 0 && retries > 0)
+        // Move partial line to the start of the buffer, and grow the buffer if
+        // the line does not fit
+        if (rx_start > 0)
         {
-            retries--;
-            continue;
+            memmove(rx_buffer.data(), start, rx_end - rx_start);
+            rx_end  -= rx_start;
+            rx_start = 0;
         }
-        else if (s < 0)  // No retries left, issue error
+        if (rx_end == rx_buffer.size())
+            rx_buffer.resize(rx_buffer.size() * 2);
+
+        // Read more data, socket reads time out if the board does not reply
+        ssize_t count = read(this -> sockfd, rx_buffer.data() + rx_end, rx_buffer.size() - rx_end);
+        if (count < 0 && errno == EINTR)
+            continue;
+        else if (count <= 0)
         {
-            DEBUG_PRINT("KATPC::sendRequest. Failed to write command to KATCP device");
-            break;
+            DEBUG_PRINT("KATCP::readLine. Error while reading reply from KATCP device");
+            return FAILURE;
         }
-        else
-            sent += s;
+        rx_end += count;
     }
 }
 
-// Read reply stream from KATCP device
-char *KATCP::readReply(UINT bytes)
-{   
-    // Read data from socket
-    int count, total = 0;
-    char *buffer = (char *) malloc(bytes * sizeof(char));
-    memset(buffer, 0, bytes * sizeof(char));
-
-    bool ready = false;
-    while (!ready)
+// Read lines until the named reply is received
+RETURN KATCP::waitReply(const char *name, char **line, size_t *length)
+{
+    char  *l;
+    size_t n;
+    size_t size = strlen(name);
+    while (readLine(&l, &n) == SUCCESS)
     {
-        if ((count = read(this -> sockfd, buffer + total, bytes)) <= 0)
+        // Replies are followed by a space or the end of the line
+        if (hasPrefix(l, n, name) && (n == size || l[size] == ' '))
         {
-            // Timeout
-            buffer[0] = '\0';
-            if (errno == EAGAIN)
-                return buffer;
-            else // Error occured
+            if (line != NULL)
             {
-                DEBUG_PRINT("KATCP::readReply. Error while reading reply from KATCP device");
-                return buffer;
+                *line   = l;
+                *length = n;
             }
+            return hasPrefix(l + size, n - size, " ok") ? SUCCESS : FAILURE;
         }
-
-        // Set timeout
-        struct timeval tv;
-        tv.tv_sec = 0;
-        tv.tv_usec = 0; 
-
-        // Successfully read data, check if any more data is pending
-        // Set up sets for select
-        fd_set readset;
-        FD_ZERO(&readset);
-        FD_SET(this -> sockfd, &readset);
-
-        int result;
-        do
-        {
-            result = select(1, &readset, NULL, NULL, &tv);
-        } while (result == -1 && errno == EINTR);
-
-        // Check if data is pending, and if so issue another read
-        total += count;
-        if (result <= 0 && buffer[total -1] == '\n')
-            ready = true;
+        processInform(l, n);
     }
 
-    // All done, return
-    return buffer;
+    return FAILURE;
 }
 
-// Process KATCP escapes
-string KATCP::processEscapes(string &s)
+// Wait for outstanding replies and discard them
+void KATCP::discardReplies(const char *name, UINT count)
 {
-    string value = "";
-    for(unsigned i = 0; i < s.size(); i++)
+    for(unsigned i = 0; i < count; i++)
     {
-        if (s[i] == '\\')
+        char *line = NULL;
+        size_t length;
+        if (waitReply(name, &line, &length) == FAILURE && line == NULL)
         {
-            if (s[i+1] == '0') 
-                value += '\0';
-            else if (s[i+1] == 'e')
-                value += '\x1b';
-            else if (s[i+1] == 't') 
-                value += '\t';
-            else if (s[i+1] == 'n') 
-                value += '\n';
-            else if (s[i+1] == 'r') 
-                value += '\r';
-            else if (s[i+1] == '\'') 
-                value += '\'';
-            else if (s[i+1] == '"') 
-                value += '\"';
-            else if (s[i+1] == '\\') 
-                value += '\\';
-            else if (s[i+1] == '_') 
-                value += ' ';
-            else
-                i--;
-            i++;
+            // Replies did not arrive, unprocessed data cannot be matched to requests
+            DEBUG_PRINT("KATCP::discardReplies. Lost " << count - i << " replies, reconnecting to board");
+            reconnect();
+            return;
         }
-        else
-            value += s[i];
     }
+}
+
+// Close connection and connect to board again, discarding unprocessed data
+RETURN KATCP::reconnect()
+{
+    char *address = this -> ip;
+    closeConnection();
+    RETURN result = createConnection(address, this -> port);
+    free(address);
+    return result;
+}
 
-    return value;
+// Place request prefix in transmit buffer
+size_t KATCP::formatRequest(const char *command, const char *reg, UINT offset, size_t payload)
+{
+    // Command, register name, offset, separators and newline
+    size_t size = strlen(command) + strlen(reg) + payload + 16;
+    if (tx_buffer.size() < size)
+        tx_buffer.resize(size);
+
+    return sprintf(tx_buffer.data(), "?%s %s %u ", command, reg, offset);
 }
 
 // =====================================================================
@@ -168,18 +253,20 @@ string KATCP::processEscapes(string &s)
 // Class constructor
 KATCP::KATCP() : Protocol()
 {
-    
+    rx_buffer.resize(KATCP_BUFFER_SIZE);
+    rx_start = rx_end = 0;
+    window_size = 4;
+    registers_listed = false;
 }
 
 // Create and initialise socket
 RETURN KATCP::createConnection(const char *IP, int port)
 {
     // Copy IP
-    this -> ip = (char *) malloc(5 * sizeof(char));
-    strcpy(this -> ip, IP);
+    this -> ip = strdup(IP);
 
     // Copy port
-    this -> port = port; 
+    this -> port = port;
 
     // Open socket
     if ((this -> sockfd = socket(AF_INET, SOCK_STREAM, 0)) == -1)
@@ -196,11 +283,15 @@ RETURN KATCP::createConnection(const char *IP, int port)
 
     // Set a receive timeout of 5 seconds
     struct timeval tv;
-    tv.tv_sec = 5;  
-    tv.tv_usec = 0; 
-    setsockopt(sockfd, SOL_SOCKET, SO_RCVTIMEO, 
+    tv.tv_sec = 5;
+    tv.tv_usec = 0;
+    setsockopt(sockfd, SOL_SOCKET, SO_RCVTIMEO,
                (char *) &tv, sizeof(struct timeval));
 
+    // Requests are pipelined, send them as soon as they are written
+    int nodelay = 1;
+    setsockopt(sockfd, IPPROTO_TCP, TCP_NODELAY, (char *) &nodelay, sizeof(nodelay));
+
     // Connect to board
     if (connect(this -> sockfd, (struct sockaddr *) &board_addr, sizeof(board_addr)) < 0)
     {
@@ -210,11 +301,12 @@ RETURN KATCP::createConnection(const char *IP, int port)
 
     DEBUG_PRINT("KATCP::constructor. Created socket for " << IP);
 
-    // Connected to board, read inform generated by on connection
-    processInforms(readReply());
-
-    // Set logging level on board
+    // Set logging level on board. Informs generated on connection are
+    // processed while waiting for the reply
+    rx_start = rx_end = 0;
+    registers_listed = false;
     sendRequest(string("log-level"), { string("warn") });
+    waitReply("!log-level");
 
     return SUCCESS;
 }
@@ -226,6 +318,10 @@ RETURN KATCP::closeConnection()
     if (this -> sockfd == -1)
         return SUCCESS;
 
+    // Discard unprocessed data and register list
+    rx_start = rx_end = 0;
+    registers_listed = false;
+
     // Check is socket is still open
     int error = 0;
     socklen_t len = sizeof (error);
@@ -234,187 +330,165 @@ RETURN KATCP::closeConnection()
 
     // Attempt to close socket
     close(this -> sockfd);
+    this -> sockfd = -1;
+
+    return SUCCESS;
+}
+
+// Set the number of requests which can be in flight at any one time
+RETURN KATCP::setWindowSize(UINT window)
+{
+    // Check that window size is valid
+    if (window == 0 || window > KATCP_MAX_WINDOW_SIZE)
+    {
+        DEBUG_PRINT("KATCP::setWindowSize. Invalid window size " << window);
+        return FAILURE;
+    }
 
+    this -> window_size = window;
     return SUCCESS;
 }
 
-// Issue a read register request, and return reply
+// Issue read register requests, and return reply. Reads are split into requests of
+// up to KATCP_CHUNK_WORDS words, with up to window_size requests in flight. Replies
+// arrive in request order and are decoded directly into the returned array
 VALUES KATCP::readRegister(UINT address, UINT n, UINT offset)
 {
-	DEBUG_PRINT("KATCP::readRegister. Reading register");
-	
-    // Send command
-    string regname = this -> registers[address];
-    sendRequest(string("read"), { regname, to_string(offset), to_string(n * 4) });
-
-    // Store values
-    vector<uint32_t> values;
-
-    // Read replies for board
-    RETURN result = FAILURE;
-    bool processed = false;
-    while (!processed)
+    DEBUG_PRINT("KATCP::readRegister. Reading register");
+
+    if (address >= this -> registers.size())
+        return {NULL, FAILURE};
+
+    const char *regname = this -> registers[address].c_str();
+    UINT *values = (UINT *) malloc(n * sizeof(UINT));
+
+    UINT chunks = (n + KATCP_CHUNK_WORDS - 1) / KATCP_CHUNK_WORDS;
+    UINT sent = 0, received = 0;
+    RETURN result = SUCCESS;
+    while (received < sent || (sent < chunks && result == SUCCESS))
     {
-        // Four bytes per word * 2 for escape characters + buffer
-        char *buffer = readReply(n * 4 * 2 + 15); 
-        string reply = string(buffer); 
-        istringstream inputStream;
-        inputStream.str(reply);
-        string endRequestPrefix = "!read"; 
-        while(!inputStream.eof())
+        // Fill up window. The KATCP offset is in bytes
+        while (sent < chunks && sent - received < this -> window_size && result == SUCCESS)
         {
-            string line;
-            getline(inputStream, line);
+            UINT first = sent * KATCP_CHUNK_WORDS;
+            UINT words = min((UINT) KATCP_CHUNK_WORDS, n - first);
+            size_t length = formatRequest("read", regname, (offset + first) * 4, 16);
+            length += sprintf(tx_buffer.data() + length, "%u\n", words * 4);
+            if (sendData(tx_buffer.data(), length) == FAILURE)
+                result = FAILURE;
+            else
+                sent++;
+        }
 
-            // Line contains result
-            if (line.substr(0, endRequestPrefix.size()) == endRequestPrefix)
-            {
-                line = line.substr(endRequestPrefix.size() + 1, line.size());
-                processed = true;
-
-                // Check if command was succesful
-                if (line.substr(0, 2) != "ok")
-                {
-                    DEBUG_PRINT("KATCP::readRegister. Command failed on board");
-                    continue;
-                } 
-
-                // Extract binary string 
-                line = line.substr(3, line.size());
-
-                // Process escapes
-                line = processEscapes(line);
-
-                // Check if size is a multiple of 4
-                if (line.size() < 4 || line.size() % 4 != 0)
-                {
-                    DEBUG_PRINT("KATCP::readRegister. Incorrect value reply size");
-                    continue;
-                }
-
-                // We have our data, convert to unsigned integers
-                const unsigned char *buf = (unsigned char *) line.c_str();
-                for (unsigned i = 0; i < line.size(); i+= 4)
-                {
-                    uint32_t value = 0;
-                    value |= (*buf++ << 24);
-                    value |= (*buf++ << 16);
-                    value |= (*buf++ << 8);
-                    value |= (*buf++     );
-                    values.push_back(value);
-                }
-                result = SUCCESS;
-            }
-            else    
-                // Other type of output, treat as inform
-                // TODO: Get these
-                processInforms(line);
+        if (received == sent)
+            break;
+
+        // Wait for next reply, which is "!read ok <data>"
+        char *line = NULL;
+        size_t length;
+        UINT first = received * KATCP_CHUNK_WORDS;
+        UINT words = min((UINT) KATCP_CHUNK_WORDS, n - first);
+        RETURN err = waitReply("!read", &line, &length);
+        if (err == FAILURE && line == NULL)
+        {
+            // Connection failed, wait for the remaining replies before returning
+            discardReplies("!read", sent - received);
+            free(values);
+            return {NULL, FAILURE};
+        }
+        received++;
+
+        if (err == FAILURE || length < 9)
+        {
+            DEBUG_PRINT("KATCP::readRegister. Command failed on board");
+            result = FAILURE;
+            continue;
+        }
+
+        // Unescape data in place and convert big-endian words
+        size_t size = unescapeData(line + 9, length - 9);
+        if (size != words * 4)
+        {
+            DEBUG_PRINT("KATCP::readRegister. Incorrect value reply size");
+            result = FAILURE;
+            continue;
         }
 
-		 free(buffer);
+        const unsigned char *data = (unsigned char *) line + 9;
+        for(unsigned i = 0; i < words; i++, data += 4)
+            values[first + i] = ((UINT) data[0] << 24) | ((UINT) data[1] << 16) |
+                                ((UINT) data[2] << 8)  |  (UINT) data[3];
     }
 
-    // Create VALUES result
-    if (result == SUCCESS)
+    if (result == FAILURE)
     {
-        UINT *retValues = (UINT *) malloc(values.size() * sizeof(UINT));
-        memcpy(retValues, &values[0], values.size() * sizeof(UINT));
-        return {retValues, result};
+        free(values);
+        return {NULL, FAILURE};
     }
-    else
-        return {NULL, result};
+
+    return {values, SUCCESS};
 }
 
-// Issue a write register request, and return reply
+// Issue write register requests, and return reply. Writes are split and pipelined
+// in the same way as reads, and values escaped directly into the request buffer
 RETURN KATCP::writeRegister(UINT address, UINT *values, UINT n, UINT offset)
 {
-	DEBUG_PRINT("KATCP::writeRegister. Writing to register");
-	
-    // Convert unsigned integer to string
-    string packedData = "";
+    DEBUG_PRINT("KATCP::writeRegister. Writing to register");
 
-    // Loop over values and package them
-    for(unsigned i = 0; i < n; i++)
+    if (address >= this -> registers.size())
+        return FAILURE;
+
+    const char *regname = this -> registers[address].c_str();
+
+    UINT chunks = (n + KATCP_CHUNK_WORDS - 1) / KATCP_CHUNK_WORDS;
+    UINT sent = 0, received = 0;
+    RETURN result = SUCCESS;
+    while (received < sent || (sent < chunks && result == SUCCESS))
     {
-        // Split unsigned integer into 4 bytes
-        unsigned char bytes[4];
-        bytes[3] = values[i] & 0xFF;
-        bytes[2] = (values[i] >> 8)  & 0xFF;
-        bytes[1] = (values[i] >> 16) & 0xFF;
-        bytes[0] = (values[i] >> 26) & 0xFF;
-
-        // Concatenate each byte to the packed string
-        for(unsigned j = 0; j < 4; j++)
+        // Fill up window. Each byte is escaped to at most two characters
+        while (sent < chunks && sent - received < this -> window_size && result == SUCCESS)
         {
-            if (bytes[j] == '\0')
-                packedData += "\\0";
-            else if (bytes[j] == '\t')
-                packedData += "\\t";
-            else if (bytes[j] == '\n')
-                packedData += "\\n";
-            else if (bytes[j] == '\r')
-                packedData += "\\r";
-            else if (bytes[j] == '\'')
-                packedData += "\\'";
-            else if (bytes[j] == '\"')
-                packedData += "\\\"";
-            else if (bytes[j] == '\\')
-                packedData += "\\\\";
-            else if (bytes[j] == ' ')
-                packedData += "\\_";
+            UINT first = sent * KATCP_CHUNK_WORDS;
+            UINT words = min((UINT) KATCP_CHUNK_WORDS, n - first);
+            size_t length = formatRequest("write", regname, (offset + first) * 4, words * 8);
+            length += escapeWords(values + first, words, tx_buffer.data() + length);
+            tx_buffer[length++] = '\n';
+            if (sendData(tx_buffer.data(), length) == FAILURE)
+                result = FAILURE;
             else
-                packedData += bytes[j];  
-        }    
-    }
+                sent++;
+        }
 
-    // Send command
-    string regname = this -> registers[address];
-    sendRequest(string("write"), { regname, to_string(offset), packedData });
+        if (received == sent)
+            break;
 
-    // Read replies from board
-    bool processed = false;
-    bool succesful = true;
-    while (!processed)
-    {
-        char *buffer = readReply();
-        string reply = string(buffer); 
-        istringstream inputStream(reply);
-        string endRequestPrefix = "!write";
-        while (!inputStream.eof())
+        // Wait for next reply
+        char *line = NULL;
+        size_t length;
+        RETURN err = waitReply("!write", &line, &length);
+        if (err == FAILURE && line == NULL)
         {
-            // Categorise statement
-            string line;
-            getline(inputStream, line);
-            // Line contains result
-            if (line.substr(0, endRequestPrefix.size()) == endRequestPrefix)
-            {
-                // Check if command was succesful
-                line = line.substr(endRequestPrefix.size() + 1, line.size());
-                string okString = "ok";
-                if (line.substr(0, okString.size()) != okString)
-                    DEBUG_PRINT("KATCP::writeRegister. Command failed on board");
-                else
-                    succesful = true;
-
-                processed = true;
-            }
-            else    
-                // Other type of output, treat as inform
-                // TODO: Get these
-                processInforms(line);
+            // Connection failed, wait for the remaining replies before returning
+            discardReplies("!write", sent - received);
+            return FAILURE;
         }
+        received++;
 
-        free(buffer);
+        if (err == FAILURE)
+        {
+            DEBUG_PRINT("KATCP::writeRegister. Command failed on board");
+            result = FAILURE;
+        }
     }
 
-    return ((succesful) ? SUCCESS : FAILURE);
+    return result;
 }
 
 // Get list of boffiles from board
 FIRMWARE KATCP::listFirmware(UINT *num_firmware)
 {
-	DEBUG_PRINT("KATCP::listFirmware. Querying board for firmware list");
-	
+    DEBUG_PRINT("KATCP::listFirmware. Querying board for firmware list");
+
     *num_firmware = 0;
 
     // Send command to board
@@ -422,68 +496,38 @@ FIRMWARE KATCP::listFirmware(UINT *num_firmware)
 
     // Clear current list of firmware
     this -> boffiles.clear();
-    
+
     // Keep reading output from katcp device until the command has been
-    // executed. Each entry is seperated by a newline
-    // Only informs starting with #listbof belong to the reply
-    bool processed = false;
-    while (!processed)
+    // executed. Only informs starting with #listbof belong to the reply
+    char *line;
+    size_t length;
+    while (readLine(&line, &length) == SUCCESS)
     {
-        // Read data, separate entitires and process one by one
-        char *buffer = readReply();
-        string reply = string(buffer); 
-        istringstream inputStream(reply);
-        string bofEntryPrefix   = "#listbof";
-        string endRequestPrefix = "!listbof";
-        while(!inputStream.eof())
+        // Line contains a new boffile
+        if (hasPrefix(line, length, "#listbof "))
         {
-            // Categorise statement
-            string line;
-            getline(inputStream, line);
-
-            // Line contains a new boffile
-            if (line.substr(0, bofEntryPrefix.size()) == bofEntryPrefix)
-            {
-                // Remove prefix and space to extract boffile name
-                line = line.substr(bofEntryPrefix.size(), line.size()); 
-                line.erase(remove_if(line.begin(), line.end(), ::isspace), line.end());
-
-                // Add boffile to list of boffiles
-                this -> boffiles.push_back(line);
-            }
-            // End of command reply line
-            else if (line.substr(0, endRequestPrefix.size()) == endRequestPrefix)
+            // Remove prefix and whitespace to extract boffile name
+            string name(line + 9, length - 9);
+            name.erase(remove_if(name.begin(), name.end(), ::isspace), name.end());
+            this -> boffiles.push_back(name);
+        }
+        // End of command reply line
+        else if (hasPrefix(line, length, "!listbof"))
+        {
+            // Check if command was successful on board
+            if (!hasPrefix(line + 8, length - 8, " ok"))
             {
-                // Check if number of processed boffiles is the same as the
-                // number sent by the server
-                line = line.substr(bofEntryPrefix.size() + 1, line.size());
-
-                // Check if command was successful on board
-                string okString = "ok";
-                if (line.substr(0, okString.size()) != okString)
-                {
-                    DEBUG_PRINT("KATCP::listFirmware. Command failed on board");
-                    this -> boffiles.clear();
-                }
-                else
-                {
-                    // Remove white spaces
-                    line = line.substr(okString.size(), line.size());
-                    line.erase(remove_if(line.begin(), line.end(), ::isspace), line.end());
-                    
-                    // Check if number of entries sent matches number received
-                    int numSent = stoi(line, 0, 10);
-                    if (numSent != (int) boffiles.size())
-                        DEBUG_PRINT("KATCP::listFirmware. Incorrect number of boffiles received");
-                }
-                processed = true;
+                DEBUG_PRINT("KATCP::listFirmware. Command failed on board");
+                this -> boffiles.clear();
             }
-            else
-                // Other type of output, treat as inform
-                processInforms(line);
+            // Check if number of entries sent matches number received
+            else if (atoi(line + 11) != (int) boffiles.size())
+                DEBUG_PRINT("KATCP::listFirmware. Incorrect number of boffiles received");
+            break;
         }
-
-        free(buffer);
+        else
+            // Other type of output, treat as inform
+            processInform(line, length);
     }
 
     // Create list of firmware and return
@@ -496,76 +540,71 @@ FIRMWARE KATCP::listFirmware(UINT *num_firmware)
     return firmware;
 }
 
-// Get list of registers from board
-REGISTER_INFO* KATCP::getRegisterList(UINT *num_registers)
+// Request register list from board and rebuild register index
+RETURN KATCP::listRegisters()
 {
-	DEBUG_PRINT("KATCP::getRegisterList. Querying board for register list");
-	
-    *num_registers = 0;
+    DEBUG_PRINT("KATCP::listRegisters. Querying board for register list");
 
     // Send command to board
     sendRequest(string("listdev"), vector<string>());
 
     // Clear current list of registers
     this -> registers.clear();
-    
+    this -> register_index.clear();
+    this -> registers_listed = false;
+
     // Keep reading output from katcp device until the command has been
-    // executed. Each entry is seperated by a newline
-    // Only informs starting with #listdev belong to the reply
-    bool processed = false;
-    while (!processed)
+    // executed. Only informs starting with #listdev belong to the reply
+    char *line;
+    size_t length;
+    while (readLine(&line, &length) == SUCCESS)
     {
-        // Read data, separate entitires and process one by one
-        char *buffer = readReply();
-        string reply = string(buffer); 
-        istringstream inputStream(reply);
-        string devEntryPrefix   = "#listdev";
-        string endRequestPrefix = "!listdev";
-        while(!inputStream.eof())
+        // Line contains a new register entry
+        if (hasPrefix(line, length, "#listdev "))
         {
-            // Categorise statement
-            string line;
-            getline(inputStream, line);
-
-            // Line contains a new register entry
-            if (line.substr(0, devEntryPrefix.size()) == devEntryPrefix) 
+            // Remove prefix and whitespace to extract register name
+            string name(line + 9, length - 9);
+            name.erase(remove_if(name.begin(), name.end(), ::isspace), name.end());
+            this -> registers.push_back(name);
+        }
+        // End of command reply line
+        else if (hasPrefix(line, length, "!listdev"))
+        {
+            // Check if command was successful on board
+            if (!hasPrefix(line + 8, length - 8, " ok"))
             {
-                // Remove prefix and empty space from line to 
-                // extract register name
-                line = line.substr(devEntryPrefix.size(), line.size());
-                line.erase(remove_if(line.begin(), line.end(), ::isspace), line.end());
-        
-                // Add register to list of registers
-                this -> registers.push_back(line);
-            }
-            // End of command reply line
-            else if  (line.substr(0, endRequestPrefix.size()) == endRequestPrefix)
-            {   
-                // End of request, check if number of processed registers is
-                // the same as the number sent by the server
-                line = line.substr(devEntryPrefix.size() + 1, line.size());
-
-                // Check if command was successful on board
-                string okString = "ok";
-                if (!(line.substr(0, okString.size()) == okString))
-                {
-                    DEBUG_PRINT("KATCP::getRegisterList. Command failed on board");
-                    this -> registers.clear();   // Failed
-                }
-
-                processed = true;  
+                DEBUG_PRINT("KATCP::listRegisters. Command failed on board");
+                this -> registers.clear();
+                return FAILURE;
             }
-            else
-                // Other type of output, treat as inform
-                processInforms(line);
-        }   
 
-        free(buffer); 
+            // Index registers by name
+            this -> register_index.reserve(this -> registers.size());
+            for(unsigned i = 0; i < this -> registers.size(); i++)
+                this -> register_index[this -> registers[i]] = i;
+
+            this -> registers_listed = true;
+            return SUCCESS;
+        }
+        else
+            // Other type of output, treat as inform
+            processInform(line, length);
     }
 
+    this -> registers.clear();
+    return FAILURE;
+}
+
+// Get list of registers from board. The list is cached until firmware is loaded
+REGISTER_INFO* KATCP::getRegisterList(UINT *num_registers)
+{
+    // Request register list if not cached
+    if (!this -> registers_listed)
+        listRegisters();
+
     // Populate list of registers and return
     *num_registers = this -> registers.size();
-    
+
     REGISTER_INFO *list = (REGISTER_INFO *) malloc(*num_registers * sizeof(REGISTER_INFO));
     for (unsigned i = 0; i < *num_registers; i++)
     {
@@ -575,9 +614,11 @@ REGISTER_INFO* KATCP::getRegisterList(UINT *num_registers)
         list[i].type = FIRMWARE_REGISTER;
         list[i].device = FPGA_1;
         list[i].permission = READWRITE;
-        list[i].size = 1; 
+        list[i].volatility = VOLATILITY_UNKNOWN;
+        list[i].size = 1;
         list[i].bitmask = 0xFFFFFFFF;
         list[i].bits = 32;
+        list[i].value = 0;  // Registers are not read when listed
         list[i].description = "";
     }
 
@@ -587,70 +628,54 @@ REGISTER_INFO* KATCP::getRegisterList(UINT *num_registers)
 // Load boffile
 RETURN KATCP::loadFirmwareBlocking(const char* boffile)
 {
-	DEBUG_PRINT("KATCP::loadFirmwareBlocking. Loading firmware");
-	
+    DEBUG_PRINT("KATCP::loadFirmwareBlocking. Loading firmware");
+
+    // Register list changes with the firmware, whether or not it loads
+    this -> registers_listed = false;
+    this -> registers.clear();
+    this -> register_index.clear();
+
     // Send command to board
     sendRequest(string("progdev"), { string(boffile) });
 
-    // Set when ready from operation
-    bool processed = false;
-    bool programmed = false;
-
-    // Keep listening to the socket until the commadn is succesful or 
+    // Keep listening to the socket until the command is succesful or
     // a warning is generated stating that the boffile couldn't be loaded
-    while (!processed)
+    char *line;
+    size_t length;
+    while (readLine(&line, &length) == SUCCESS)
     {
-        char *buffer = readReply();
-        string reply = string(buffer); 
-        istringstream inputStream(reply);
-        string progdevSuccess = "!progdev";
-        string progdevFailed  = "#log warn "; 
-        while (!inputStream.eof())
+        // End of request, check if command was successful on board
+        if (hasPrefix(line, length, "!progdev"))
         {
-            // Categorise statement
-            string line;
-            getline(inputStream, line);
-           
-            // Line contains a new boffile entry
-            if (line.substr(0, progdevSuccess.size()) == progdevSuccess)
-            { 
-                // End of request, check if number of processed boffiles is
-                // the same as the number sent by the server
-                line = line.substr(progdevSuccess.size() + 1, line.size()); 
-
-                // Check if command was successful on board
-                string okString = "ok";
-                if (line.substr(0, okString.size()) == okString)
-                    programmed = true;                
-                else
-                    DEBUG_PRINT("KATCP::loadFirmwareBlocking. Command failed on board");
-                processed = true;
-            }
-            else if (line.substr(0, progdevFailed.size()) == progdevFailed)
-            {
-                DEBUG_PRINT("KATCP::loadFirmwareBlocking. Command failed on board");
-                processed = true;
-                programmed = false;
-            }
-            // Line does not belong to command reply, ignore for now
-            else
-                // Other type of output, treat as inform
-                processInforms(line);
-        }
+            if (hasPrefix(line + 8, length - 8, " ok"))
+                return SUCCESS;
 
-        free(buffer);
+            DEBUG_PRINT("KATCP::loadFirmwareBlocking. Command failed on board");
+            return FAILURE;
+        }
+        else if (hasPrefix(line, length, "#log warn "))
+        {
+            DEBUG_PRINT("KATCP::loadFirmwareBlocking. Command failed on board");
+            return FAILURE;
+        }
+        else
+            // Other type of output, treat as inform
+            processInform(line, length);
     }
 
-    return ((programmed) ? SUCCESS : FAILURE);
+    return FAILURE;
 }
 
 // Get register index from internal list (to use as address)
 int KATCP::getRegisterIndex(REGISTER reg)
 {
-    vector<string>::iterator it;
-    it = find(this -> registers.begin(), this -> registers.end(), reg);
-    if (it == registers.end())
+    // Request register list if not cached
+    if (!this -> registers_listed && listRegisters() == FAILURE)
         return -1;
-    else 
-        return it - this -> registers.begin();
+
+    unordered_map<string, UINT>::iterator it = this -> register_index.find(reg);
+    if (it == this -> register_index.end())
+        return -1;
+    else
+        return it -> second;
 }
@@ -1,12 +1,23 @@
-#ifndef UCP_CLASS
-#define UCP_CLASS
+#ifndef KATCP_CLASS
+#define KATCP_CLASS
 
 #include "Protocol.hpp"
 
+#include <unordered_map>
 #include <vector>
 #include <string>
 
-// Protocol subclass implementing the UCP protocol
+// Maximum number of words transferred by a single read or write request. Larger
+// transfers are split into multiple requests
+#define KATCP_CHUNK_WORDS 1024
+
+// Maximum number of requests which can be in flight at any one time
+#define KATCP_MAX_WINDOW_SIZE 32
+
+// Initial size of the receive buffer, which grows to fit the longest reply line
+#define KATCP_BUFFER_SIZE 16384
+
+// Protocol subclass implementing the KATCP protocol
 class KATCP: public Protocol
 {
     public:
@@ -19,6 +30,7 @@ class KATCP: public Protocol
         RETURN closeConnection();
         VALUES readRegister(UINT address,  UINT n, UINT offset = 0);
         RETURN writeRegister(UINT address, UINT *values, UINT n = 1, UINT offset = 0);
+        RETURN setWindowSize(UINT window);
 
     // Public function which extend KATCP's functionality
     public:
@@ -30,25 +42,67 @@ class KATCP: public Protocol
 
         // Load boffile
         RETURN loadFirmwareBlocking(const char* boffile);
-    
-        // Get register index from internal list (to use as address)
+
+        // Get register index from internal list (to use as address). The list
+        // is requested from the board if it is not cached
         int getRegisterIndex(REGISTER reg);
 
     // Private functions
     private:
-        void processInforms(std::string entry);
+        void processInform(char *line, size_t length);
+        RETURN sendData(const char *buffer, size_t count);
         void sendRequest(std::string command, std::vector<std::string> args);
-        char *readReply(UINT bytes = 8192);
-        std::string processEscapes(std::string &s);
+
+        // Request register list from board and rebuild register index
+        RETURN listRegisters();
+
+        // Get next line received from board, without the trailing newline. The line
+        // is valid until the next call
+        RETURN readLine(char **line, size_t *length);
+
+        // Read lines until the reply with the given name (such as !read) is received,
+        // processing informs on the way. Returns whether the request succeeded
+        RETURN waitReply(const char *name, char **line = NULL, size_t *length = NULL);
+
+        // Wait for count outstanding replies with the given name, so that they are not
+        // taken as replies to later requests. Reconnects if they do not arrive
+        void discardReplies(const char *name, UINT count);
+
+        // Close connection and connect to board again
+        RETURN reconnect();
+
+        // Place "?command register offset " in the transmit buffer, which is grown
+        // to fit payload bytes after it. Returns the length of the prefix
+        size_t formatRequest(const char *command, const char *reg, UINT offset, size_t payload);
 
     // Public functions specific to KATCP
     public:
-        KATCP *katcp; 
+        KATCP *katcp;
 
     // Protected class members
     protected:
         std::vector<std::string> boffiles;  // Store boffiles
-        std::vector<std::string> registers; // Stores register names       
+        std::vector<std::string> registers; // Stores register names
+
+        // Register name to index in registers
+        std::unordered_map<std::string, UINT> register_index;
+
+        // Set when registers holds the register list of the loaded firmware,
+        // such that ?listdev is only issued once per progdev
+        bool registers_listed;
+
+    private:
+        // Data received from board. Bytes between rx_start and rx_end have not been
+        // processed yet
+        std::vector<char> rx_buffer;
+        size_t            rx_start;
+        size_t            rx_end;
+
+        // Request being sent, reused for escaped write payloads
+        std::vector<char> tx_buffer;
+
+        // Number of requests which can be in flight at any one time
+        UINT              window_size;
 };
 
-#endif  // UCP_CLASS
+#endif  // KATCP_CLASS
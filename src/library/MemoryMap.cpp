@@ -3,24 +3,40 @@
 #include "Utils.hpp"
 #include <algorithm>
 #include <iostream>
+#include <sys/mman.h>
+#include <sys/stat.h>
 #include <string.h>
+#include <stdlib.h>
+#include <unistd.h>
+#include <fcntl.h>
 #include <stdio.h>
+#include <vector>
 
 using namespace rapidxml;
 using namespace std;
 
 // MemoryMap constructor
-MemoryMap::MemoryMap(char *path)
+MemoryMap::MemoryMap(char *path, bool use_cache)
 {
-    // TODO: Check if filepath exists
-
-    // If so, store locally
+    // Store filepath locally
     size_t len = strlen(path);
     this -> filepath = (char *) malloc((len + 1) * sizeof(char));
     strcpy(this -> filepath, path);
+    this -> cache_file = string(path) + MEMORY_MAP_CACHE_EXTENSION;
+    this -> checksum = 0;
+    this -> xml_size = 0;
+
+    // Clear map
+    memory_map.clear();
 
     // Load file contents
     FILE *f = fopen(path, "r"); 
+    if (f == NULL)
+    {
+        DEBUG_PRINT("MemoryMap::Constructor. Could not open memory map " << path);
+        return;
+    }
+
     fseek(f, 0, SEEK_END);
     long fsize = ftell(f);
     fseek(f, 0, SEEK_SET);
@@ -31,14 +47,48 @@ MemoryMap::MemoryMap(char *path)
 
     content[fsize] = 0;
 
-    // Clear map
-    memory_map.clear();
+    // The cache is only valid for the current contents of the XML file
+    this -> checksum = crc32(content, fsize);
+    this -> xml_size = fsize;
+
+    // Use cached memory map if it is up to date
+    if (use_cache && loadCache() == SUCCESS)
+    {
+        DEBUG_PRINT("MemoryMap::Constructor. Loaded memory map from " << cache_file);
+        free(content);
+        return;
+    }
+
+    // Otherwise parse XML file and update cache. Failing to write
+    // the cache (for instance in a read-only directory) is not an error
+    parseXML(content);
+    free(content);
+
+    if (use_cache)
+        saveCache();
+}
+
+// MemoryMap destructor
+MemoryMap::~MemoryMap()
+{
+    map<DEVICE, map<string, RegisterInfo *> >::iterator iter;
+    for(iter = memory_map.begin(); iter != memory_map.end(); iter++)
+    {
+        map<string, RegisterInfo *>::iterator reg_iter;
+        for(reg_iter = (iter -> second).begin(); reg_iter != (iter -> second).end(); reg_iter++)
+            delete reg_iter -> second;
+    }
+    free(this -> filepath);
+}
 
+// Populate memory map from XML file contents
+void MemoryMap::parseXML(char *content)
+{
     // Parse memory map
     xml_document<> doc;
     doc.parse<0>(content);
 
-    DEBUG_PRINT("MemoryMap::Constructor. Loading memory map from " << path);
+    DEBUG_PRINT("MemoryMap::parseXML. Loading memory map from " << filepath);
 
     // We are at the root of the XML file, we now need to iterate through
     // the child nodes to access all FPGA and board memory maps
@@ -207,6 +257,15 @@ MemoryMap::MemoryMap(char *path)
                         else
                             ; // Unknown permission, ignore for now
                     }
+                    else if (name.compare("volatile") == 0)
+                    {
+                        // Set whether register can change without being written
+                        string value = registerAttr -> value();
+                        if (value.compare("true") == 0)
+                            reg_info -> volatility = VOLATILE;
+                        else if (value.compare("false") == 0)
+                            reg_info -> volatility = NON_VOLATILE;
+                    }
                     else if (name.compare("size") == 0)
                         // Set register size
                         reg_info -> size = stoi(registerAttr -> value(), 0, 10);
@@ -296,6 +355,15 @@ MemoryMap::MemoryMap(char *path)
                                 else
                                     ; // Unknown permission, ignore for now
                             }
+                            else if (name.compare("volatile") == 0)
+                            {
+                                // Set whether register can change without being written
+                                string value = bitAttr -> value();
+                                if (value.compare("true") == 0)
+                                    reg_info -> volatility = VOLATILE;
+                                else if (value.compare("false") == 0)
+                                    reg_info -> volatility = NON_VOLATILE;
+                            }
                             else if (name.compare("size") == 0)
                                 // Set register size
                                 reg_info -> size = stoi(bitAttr -> value(), 0, 10);
@@ -319,7 +387,162 @@ MemoryMap::MemoryMap(char *path)
             }
         }
     }
-    DEBUG_PRINT("MemoryMap::Constructor. Finished loading memory map from " << path);
+    DEBUG_PRINT("MemoryMap::parseXML. Finished loading memory map from " << filepath);
+}
+
+// Populate memory map from cache file
+RETURN MemoryMap::loadCache()
+{
+    // Map cache file into memory
+    int fd = open(cache_file.c_str(), O_RDONLY);
+    if (fd < 0)
+        return FAILURE;
+
+    struct stat st;
+    if (fstat(fd, &st) != 0 || (size_t) st.st_size < sizeof(MEMORY_MAP_CACHE_HEADER))
+    {
+        close(fd);
+        return FAILURE;
+    }
+
+    char *data = (char *) mmap(NULL, st.st_size, PROT_READ, MAP_PRIVATE, fd, 0);
+    close(fd);
+    if (data == MAP_FAILED)
+        return FAILURE;
+
+    // Check that cache was generated from the current XML file
+    MEMORY_MAP_CACHE_HEADER *header = (MEMORY_MAP_CACHE_HEADER *) data;
+    if (header -> magic != MEMORY_MAP_CACHE_MAGIC || header -> version != MEMORY_MAP_CACHE_VERSION ||
+        header -> checksum != checksum || header -> xml_size != xml_size ||
+        (size_t) st.st_size != sizeof(MEMORY_MAP_CACHE_HEADER) + 
+                               header -> num_registers * sizeof(MEMORY_MAP_CACHE_ENTRY) + header -> strings_size)
+    {
+        DEBUG_PRINT("MemoryMap::loadCache. Cache file " << cache_file << " is out of date");
+        munmap(data, st.st_size);
+        return FAILURE;
+    }
+
+    MEMORY_MAP_CACHE_ENTRY *entries = (MEMORY_MAP_CACHE_ENTRY *) (data + sizeof(MEMORY_MAP_CACHE_HEADER));
+    char *strings = (char *) (entries + header -> num_registers);
+
+    // Check that string table is terminated, so that all offsets point to valid strings
+    if (header -> strings_size == 0 || strings[header -> strings_size - 1] != 0)
+    {
+        munmap(data, st.st_size);
+        return FAILURE;
+    }
+
+    // Check that all string offsets are within the string table
+    for(unsigned i = 0; i < header -> num_registers; i++)
+        if (entries[i].name >= header -> strings_size || entries[i].module >= header -> strings_size ||
+            entries[i].description >= header -> strings_size)
+        {
+            munmap(data, st.st_size);
+            return FAILURE;
+        }
+
+    // Create register entries
+    for(unsigned i = 0; i < header -> num_registers; i++)
+    {
+        MEMORY_MAP_CACHE_ENTRY *entry = &entries[i];
+        RegisterInfo *reg_info = new RegisterInfo(strings + entry -> name);
+        reg_info -> module      = strings + entry -> module;
+        reg_info -> description = strings + entry -> description;
+        reg_info -> type        = (REGISTER_TYPE) entry -> type;
+        reg_info -> device      = (DEVICE) entry -> device;
+        reg_info -> permission  = (PERMISSION) entry -> permission;
+        reg_info -> volatility  = (VOLATILITY) entry -> volatility;
+        reg_info -> size        = entry -> size;
+        reg_info -> address     = entry -> address;
+        reg_info -> bitmask     = entry -> bitmask;
+        reg_info -> bits        = entry -> bits;
+        reg_info -> shift       = entry -> shift;
+        memory_map[reg_info -> device][reg_info -> name] = reg_info;
+    }
+
+    munmap(data, st.st_size);
+    return SUCCESS;
+}
+
+// Write memory map to cache file
+RETURN MemoryMap::saveCache()
+{
+    // Create string table, identical strings are stored once
+    vector<MEMORY_MAP_CACHE_ENTRY> entries;
+    map<string, UINT> offsets;
+    string strings;
+
+    map<DEVICE, map<string, RegisterInfo *> >::iterator iter;
+    for(iter = memory_map.begin(); iter != memory_map.end(); iter++)
+    {
+        map<string, RegisterInfo *>::iterator reg_iter;
+        for(reg_iter = (iter -> second).begin(); reg_iter != (iter -> second).end(); reg_iter++)
+        {
+            RegisterInfo *reg = reg_iter -> second;
+            string *fields[3] = { &(reg -> name), &(reg -> module), &(reg -> description) };
+            UINT field_offsets[3];
+            for(unsigned i = 0; i < 3; i++)
+            {
+                map<string, UINT>::iterator it = offsets.find(*fields[i]);
+                if (it == offsets.end())
+                {
+                    field_offsets[i] = strings.size();
+                    offsets[*fields[i]] = strings.size();
+                    strings.append(fields[i] -> c_str(), fields[i] -> size() + 1);
+                }
+                else
+                    field_offsets[i] = it -> second;
+            }
+
+            MEMORY_MAP_CACHE_ENTRY entry = { field_offsets[0], field_offsets[1], field_offsets[2],
+                                             (UINT) reg -> type, (UINT) reg -> device, 
+                                             (UINT) reg -> permission, (UINT) reg -> volatility,
+                                             reg -> size, reg -> address, reg -> bitmask, 
+                                             reg -> bits, reg -> shift };
+            entries.push_back(entry);
+        }
+    }
+
+    MEMORY_MAP_CACHE_HEADER header = { MEMORY_MAP_CACHE_MAGIC, MEMORY_MAP_CACHE_VERSION, checksum, 
+                                       xml_size, (UINT) entries.size(), (UINT) strings.size() };
+
+    // Write to a temporary file and rename it, so that a partially written
+    // cache is never loaded by another process. Each writer creates its own
+    // file, since the same memory map can be loaded by several threads
+    string temp_template = cache_file + ".XXXXXX";
+    vector<char> temp_file(temp_template.begin(), temp_template.end());
+    temp_file.push_back('\0');
+    int fd = mkstemp(&temp_file[0]);
+    FILE *f = (fd == -1) ? NULL : fdopen(fd, "wb");
+    if (f == NULL)
+    {
+        DEBUG_PRINT("MemoryMap::saveCache. Could not create cache file " << cache_file);
+        if (fd != -1)
+        {
+            close(fd);
+            unlink(&temp_file[0]);
+        }
+        return FAILURE;
+    }
+
+    // Temporary files are only accessible by their owner, the cache is shared
+    fchmod(fd, 0644);
+
+    bool written = fwrite(&header, sizeof(header), 1, f) == 1 &&
+                   (entries.size() == 0 || 
+                    fwrite(&entries[0], sizeof(MEMORY_MAP_CACHE_ENTRY), entries.size(), f) == entries.size()) &&
+                   (strings.size() == 0 || fwrite(strings.data(), strings.size(), 1, f) == 1);
+    written = (fclose(f) == 0) && written;
+
+    if (!written || rename(&temp_file[0], cache_file.c_str()) != 0)
+    {
+        DEBUG_PRINT("MemoryMap::saveCache. Could not write cache file " << cache_file);
+        unlink(&temp_file[0]);
+        return FAILURE;
+    }
+
+    DEBUG_PRINT("MemoryMap::saveCache. Written cache file " << cache_file);
+    return SUCCESS;
 }
 
 // Compose register list from memory map
@@ -372,9 +595,11 @@ REGISTER_INFO* MemoryMap::getRegisterList(UINT *num_registers)
             list[index].type = reg -> type;
             list[index].device = reg -> device;
             list[index].permission = reg -> permission;
+            list[index].volatility = reg -> volatility;
             list[index].size = reg -> size; 
             list[index].bitmask = reg -> bitmask;
             list[index].bits = reg -> bits;
+            list[index].value = 0;
             list[index].description = (reg -> description).c_str();
 
             index++;
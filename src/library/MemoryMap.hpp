@@ -7,6 +7,40 @@
 
 using namespace std;
 
+// A compiled copy of the memory map is stored next to the XML file and is used
+// instead of parsing the XML file as long as the checksum of the XML file
+// matches the one stored in the cache. The cache file consists of a header,
+// an entry per register and a string table
+#define MEMORY_MAP_CACHE_MAGIC      0x50414D4D   // "MMAP"
+#define MEMORY_MAP_CACHE_VERSION    1
+#define MEMORY_MAP_CACHE_EXTENSION  ".cache"
+
+// Memory map cache header
+typedef struct MEMORY_MAP_CACHE_HEADER {
+    UINT    magic;           // MEMORY_MAP_CACHE_MAGIC
+    UINT    version;         // MEMORY_MAP_CACHE_VERSION
+    UINT    checksum;        // CRC-32 of XML file contents
+    UINT    xml_size;        // Size of XML file in bytes
+    UINT    num_registers;   // Number of entries following the header
+    UINT    strings_size;    // Size of string table following the entries
+} MEMORY_MAP_CACHE_HEADER;
+
+// Memory map cache entry. Strings are stored as offsets into the string table
+typedef struct MEMORY_MAP_CACHE_ENTRY {
+    UINT    name;
+    UINT    module;
+    UINT    description;
+    UINT    type;
+    UINT    device;
+    UINT    permission;
+    UINT    volatility;
+    UINT    size;
+    UINT    address;
+    UINT    bitmask;
+    UINT    bits;
+    UINT    shift;
+} MEMORY_MAP_CACHE_ENTRY;
+
 // Class representing a memory map
 class MemoryMap
 {
@@ -15,8 +49,19 @@ class MemoryMap
     friend class TPM;
 
     public:
-        // MemoryMap constructor accepting filepath
-        MemoryMap(char *filepath);
+        // MemoryMap constructor accepting filepath. If use_cache is set, the memory
+        // map is loaded from the cache file if it is up to date, otherwise the cache
+        // file is (re)generated
+        MemoryMap(char *filepath, bool use_cache = true);
+
+        // MemoryMap destructor
+        ~MemoryMap();
+
+        // Write memory map to cache file
+        RETURN saveCache();
+
+        // Get checksum of XML file contents
+        UINT getChecksum() { return checksum; }
 
     private:
         // Class to hold register information
@@ -32,6 +77,7 @@ class MemoryMap
                     // Assign default values
                     this -> module      = "";
                     this -> permission  = READ;
+                    this -> volatility  = VOLATILITY_UNKNOWN;
                     this -> size        = 1;
                     this -> description = "";
                     this -> address     = 0x0;
@@ -46,6 +92,7 @@ class MemoryMap
                 REGISTER_TYPE  type;         // Sensor, board-register or firmware-register
                 DEVICE         device;       // Set of FPGAs (if any) to which this is applicable
                 PERMISSION     permission;   // Define register access type
+                VOLATILITY     volatility;   // Whether value can change without being written
                 unsigned int   size;         // Memory size in bytes 
                 string         description;  // Register string description
                 UINT           address;      // Memory-mapped address 
@@ -62,8 +109,17 @@ class MemoryMap
         // Get bitmask for register
         RegisterInfo *getRegisterInfo(DEVICE device, REGISTER reg);
 
+        // Populate memory map from XML file contents
+        void parseXML(char *content);
+
+        // Populate memory map from cache file, fails if cache is missing or out of date
+        RETURN loadCache();
+
     private:
         char        *filepath;                                    // Store filepath to memory map XML file
+        string      cache_file;                                   // Memory map cache file path
+        UINT        checksum;                                     // CRC-32 of XML file contents
+        UINT        xml_size;                                     // Size of XML file
         map<DEVICE, map<string, RegisterInfo *> >   memory_map;   // Full memory map of devices
 
         
@@ -53,6 +53,30 @@ class Protocol
         // Query board for list of firmware
         virtual FIRMWARE listFirmware(UINT *num_firmware) = 0;
 
+        // Set the number of requests which can be in flight at any one time
+        // for multi-packet transfers. Protocols which do not support
+        // pipelining ignore this
+        virtual RETURN setWindowSize(UINT window) { return NOT_IMPLEMENTED; }
+
+        // Read from multiple memory areas, each defined by an address and a number
+        // of words, in a single batch. Values are returned one area after the other
+        virtual VALUES readRegisterBatch(UINT *addresses, UINT *counts, UINT nsegments)
+        { return {NULL, NOT_IMPLEMENTED}; }
+
+        // Write to multiple memory areas in a single batch. Values for all areas
+        // are stored one after the other
+        virtual RETURN writeRegisterBatch(UINT *addresses, UINT *counts, UINT nsegments, UINT *values)
+        { return NOT_IMPLEMENTED; }
+
+        // Set the bits selected by masks[i] in the word at addresses[i] to those in
+        // values[i], leaving other bits untouched, without reading the words first
+        virtual RETURN writeRegisterMasked(UINT *addresses, UINT *masks, UINT *values, UINT n)
+        { return NOT_IMPLEMENTED; }
+
+        // Write values and then read m words from read_address in a single round trip
+        virtual VALUES writeReadRegister(UINT write_address, UINT *values, UINT n, UINT read_address, UINT m)
+        { return {NULL, NOT_IMPLEMENTED}; }
+
         // Accessors
         char *getIP() { return this -> ip; }
         unsigned short getPort() { return this -> port; }
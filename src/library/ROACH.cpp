@@ -43,12 +43,10 @@ STATUS ROACH::getStatus()
 // Get register list
 REGISTER_INFO* ROACH::getRegisterList(UINT *num_registers)
 {
-	// Call KATCP to get register information
+	// Call KATCP to get register information. The list is cached by KATCP until
+	// firmware is loaded, and register values are not read from the board
     REGISTER_INFO* regInfo = katcp -> getRegisterList(num_registers);
 	
-	// Populate structure with register values
-	this -> initialiseRegisterValues(regInfo, *num_registers);
-	
 	// All done, return
 	return regInfo;
 }
@@ -151,3 +149,6 @@ VALUES ROACH::readDevice(REGISTER device, UINT address)
 
 RETURN ROACH::writeDevice(REGISTER device, UINT address, UINT value)
 { return NOT_IMPLEMENTED; }
+
+RETURN ROACH::executeDeviceTransactions(SPI_TRANSACTION *transactions, UINT n)
+{ return NOT_IMPLEMENTED; }
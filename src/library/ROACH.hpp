@@ -51,6 +51,7 @@ class ROACH: public Board
         SPI_DEVICE_INFO *getDeviceList(UINT *num_devices);
         VALUES          readDevice(REGISTER device, UINT address);
         RETURN          writeDevice(REGISTER device, UINT address, UINT value);
+        RETURN          executeDeviceTransactions(SPI_TRANSACTION *transactions, UINT n);
 
     protected:
 
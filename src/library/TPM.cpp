@@ -5,6 +5,7 @@
 #include <stdlib.h>
 #include <string.h>
 #include <unistd.h>
+#include <algorithm>
 #include <stdio.h>
 
 // TPM constructor
@@ -47,12 +48,10 @@ STATUS TPM::getStatus()
 // Get register list from memory map
 REGISTER_INFO* TPM::getRegisterList(UINT *num_registers)
 {
-	// Call memory map to get register information
+	// Call memory map to get register information. Register values are not
+	// read from the board, the list only depends on the memory map
     REGISTER_INFO* regInfo = memory_map -> getRegisterList(num_registers);
 	
-	// Populate structure with register values
-	this -> initialiseRegisterValues(regInfo, *num_registers);
-	
 	// All done, return
 	return regInfo;
 }
@@ -111,29 +110,36 @@ RETURN TPM::writeRegister(DEVICE device, REGISTER reg, UINT *values, UINT n, UIN
         return FAILURE;
     }
 
-    // Apply shift and bitmask to all values
-    for(unsigned i = 0; i < n; i++)
-        values[i] = (values[i] << info -> shift) & info -> bitmask;
+    // If the register spans the full word, values can be written as they are
+    if (info -> bitmask == 0xFFFFFFFF)
+        return protocol -> writeRegister(info -> address, values, n, offset);
 
-    // Check if we have to apply a bitmask
-    if (info -> bitmask != 0xFFFFFFFF)
-    {
-        // Read values from board
-        VALUES vals = protocol -> readRegister(info -> address, n, offset);
+    // Otherwise apply shift and bitmask to a copy of the values, such that
+    // the caller's buffer is not modified
+    UINT *masked = (UINT *) malloc(n * sizeof(UINT));
+    for(unsigned i = 0; i < n; i++)
+        masked[i] = (values[i] << info -> shift) & info -> bitmask;
 
-        if (vals.error == FAILURE)
-        {
-            DEBUG_PRINT("TPM::writeRegister. Error reading value to apply bitmaks for register " << reg);
-            return FAILURE; 
-        }
+    // Read values from board
+    VALUES vals = protocol -> readRegister(info -> address, n, offset);
 
-        // Loop over all values, apply bitmask and mask with current value
-        for(unsigned i = 0; i < n; i++)
-            values[i] = (vals.values[i] & (~info -> bitmask)) | values[i];
+    if (vals.error == FAILURE)
+    {
+        DEBUG_PRINT("TPM::writeRegister. Error reading value to apply bitmaks for register " << reg);
+        free(masked);
+        return FAILURE; 
     }
 
+    // Loop over all values, apply bitmask and mask with current value
+    for(unsigned i = 0; i < n; i++)
+        masked[i] = (vals.values[i] & (~info -> bitmask)) | masked[i];
+    free(vals.values);
+
     // Finished pre-processing, write values to register
-    return protocol -> writeRegister(info -> address, values, n, offset);
+    RETURN ret = protocol -> writeRegister(info -> address, masked, n, offset);
+    free(masked);
+
+    return ret;
 }
 
 // Get address value
@@ -151,112 +157,173 @@ RETURN TPM::writeAddress(UINT address, UINT *values, UINT n)
 // Get list of SPI devices
 SPI_DEVICE_INFO *TPM::getDeviceList(UINT *num_devices)
 {
+    // No devices are defined until firmware is loaded
+    if (spi_devices == NULL)
+    {
+        *num_devices = 0;
+        return NULL;
+    }
+
     return spi_devices -> getSPIList(num_devices);
 }
 
-// Read value from device
+// Read from an SPI device
 VALUES TPM::readDevice(REGISTER device, UINT address)
 {
-    // Get device information 
-    std::pair<int, int> info = spi_devices -> getSPIInfo(device);
-
-    // If device was not found, return error
-    if (info.first == -1 && info.second == -1)
+    // Issue a single read transaction
+    SPI_TRANSACTION transaction = {device, address, SPI_READ, 0, FAILURE};
+    if (executeDeviceTransactions(&transaction, 1) == FAILURE)
     {
-        DEBUG_PRINT("TPM::readDevice. Device " << device << " was not found in device list");
-        return {0, FAILURE};
+        DEBUG_PRINT("TPM::readDevice. Failed to read from device " << device);
+        return {NULL, FAILURE};
     }
 
-    // Wait for SPI switch to be ready
-    // TODO: Make nicer
-    for(;;)
-    {
-        VALUES vals = protocol -> readRegister(spi_devices -> cmd_address);
-        printf("First Value: %d\n", (vals.values[0] & (spi_devices -> cmd_start_mask)));
-        if ((vals.values[0] & (spi_devices -> cmd_start_mask)) == 0)
-            break;
-        sleep(1);
-    }
+    // Return value in allocated memory, as for other reads
+    UINT *value = (UINT *) malloc(sizeof(UINT));
+    *value = transaction.value;
+    return {value, SUCCESS};
+}
 
-    // All systems go, issue request as an array of values
-    UINT values[6];
-    values[0] = address;  // Address
-    values[1] = 0;        // Applicable only to write operations
-    values[2] = 0;        // Skip
-    values[3] = 1 << info.first;   // spi_en
-    values[4] = 1 << info.second;  // spi_sclk 
-    values[5] = 0x03;     // Read operation    
-    
-    // Issue request
-    if (protocol -> writeRegister(0x2000000, values, 6) == FAILURE)
+// Write to an SPI device
+RETURN TPM::writeDevice(REGISTER device, UINT address, UINT value)
+{
+    // Issue a single write transaction
+    SPI_TRANSACTION transaction = {device, address, SPI_WRITE, value, FAILURE};
+    if (executeDeviceTransactions(&transaction, 1) == FAILURE)
     {
-        DEBUG_PRINT("TPM::readDevice. Failed to read from device " << device);
-        return {0, FAILURE};
+        DEBUG_PRINT("TPM::writeDevice. Failed to write to device " << device);
+        return FAILURE;
     }
 
-    // Wait for request to be completed on board
-    for(;;)
-    {
-        VALUES vals = protocol -> readRegister(spi_devices -> cmd_address);
-        printf("Second Value: %d\n", (vals.values[0] & (spi_devices -> cmd_start_mask)));
-        if ((vals.values[0] & (spi_devices -> cmd_start_mask)) == 0)
-            break;
-        sleep(1);
-    }
+    return SUCCESS;
+}
 
-    // Request ready on device, grab data
-    VALUES vals = protocol -> readRegister(spi_devices -> read_data);
-    printf("%#010x\n", spi_devices -> read_data);
-    vals.values[0] = vals.values[0] & 0xFF;
-    printf("%#010x\n", vals.values[0]);
-    // All done
-    return vals;
+// Read SPI controller registers, from address up to and including command register
+VALUES TPM::pollSPI()
+{
+    return protocol -> readRegister(spi_devices -> spi_address, SPI_CONTROLLER_WORDS);
 }
 
-// Write value to device
-RETURN TPM::writeDevice(REGISTER device, UINT address, UINT value)
+// Check whether an SPI transaction has completed. The controller registers read back
+// must match the issued request. This cannot tell the request apart from a previous
+// identical transaction, so status must be read after the request was processed,
+// which writeReadRegister ensures by reading again if the request was re-transmitted
+bool TPM::spiCompleted(UINT *request, UINT *status)
 {
-    // Get device information 
-    std::pair<int, int> info = spi_devices -> getSPIInfo(device);
+    return (status[5] & spi_devices -> cmd_start_mask) == 0 &&
+           (status[5] & spi_devices -> cmd_rnw_mask) == (request[5] & spi_devices -> cmd_rnw_mask) &&
+           (status[0] & spi_devices -> spi_address_mask) == (request[0] & spi_devices -> spi_address_mask) &&
+           (status[3] & spi_devices -> chip_select_mask) == (request[3] & spi_devices -> chip_select_mask) &&
+           (status[4] & spi_devices -> sclk_mask) == (request[4] & spi_devices -> sclk_mask);
+}
 
-    // If device was not found, return error
-    if (info.first == -1 && info.second == -1)
+// Issue a list of SPI transactions. Each request is written to the SPI controller
+// together with a read of the controller's registers, so a transaction which
+// completes immediately costs a single round trip. Otherwise the controller
+// is polled with an increasing delay between polls
+RETURN TPM::executeDeviceTransactions(SPI_TRANSACTION *transactions, UINT n)
+{
+    // Check if SPI devices are available
+    if (spi_devices == NULL)
     {
-        DEBUG_PRINT("TPM::readDevice. Device " << device << " was not found in device list");
+        DEBUG_PRINT("TPM::executeDeviceTransactions. No SPI devices loaded");
         return FAILURE;
     }
 
-    // Wait for SPI switch to be ready
-    // TODO: Make nicer
+    // No transaction has been executed yet
+    for(unsigned i = 0; i < n; i++)
+        transactions[i].error = FAILURE;
+
+    // Wait for any transaction issued elsewhere to complete
+    UINT delay = 0, waited = 0;
     for(;;)
     {
-        VALUES vals = protocol -> readRegister(spi_devices -> cmd_address);
-        if ((vals.values[0] & (spi_devices -> cmd_start_mask)) == 0)
+        VALUES vals = pollSPI();
+        if (vals.error == FAILURE)
+            return FAILURE;
+
+        UINT cmd = vals.values[5];
+        free(vals.values);
+        if ((cmd & spi_devices -> cmd_start_mask) == 0)
             break;
-    }
 
-    // All system go, issue request as an array of values
-    UINT values[6];
-    values[0] = address;  // Address
-    values[1] = (value & 0xFF) << 8;  // Value to write
-    values[2] = 0;        // Skip
-    values[3] = 1 << info.first;   // spi_en
-    values[4] = 1 << info.second;  // spi_sclk   
-    values[5] = 0x01;     // Write operation    
-     
-    // Issue request
-    if (protocol -> writeRegister(0x20000000, values, 6) == FAILURE)
-    {
-        DEBUG_PRINT("TPM::readDevice. Failed to read from device " << device);
-        return FAILURE;
+        // Back off before polling again
+        if (waited >= SPI_POLL_TIMEOUT)
+        {
+            DEBUG_PRINT("TPM::executeDeviceTransactions. Timeout waiting for SPI controller");
+            return FAILURE;
+        }
+        usleep(delay);
+        waited += delay;
+        delay = (delay == 0) ? SPI_POLL_MIN_DELAY : std::min(delay * 2, (UINT) SPI_POLL_MAX_DELAY);
     }
 
-    // Wait for request to be completed on board
-    for(;;)
+    // Issue transactions one by one
+    for(unsigned i = 0; i < n; i++)
     {
-        VALUES vals = protocol -> readRegister(spi_devices -> cmd_address);
-        if ((vals.values[0] & (spi_devices -> cmd_start_mask)) == 0)
-            break;
+        SPI_TRANSACTION &transaction = transactions[i];
+
+        // Get device information
+        std::pair<int, int> info = spi_devices -> getSPIInfo(transaction.device);
+        if (info.first == -1 && info.second == -1)
+        {
+            DEBUG_PRINT("TPM::executeDeviceTransactions. Device " << transaction.device << " was not found in device list");
+            return FAILURE;
+        }
+
+        // Create request as an array of controller register values
+        bool read = transaction.op == SPI_READ;
+        UINT request[SPI_CONTROLLER_WORDS];
+        request[0] = transaction.address;                              // Address
+        request[1] = read ? 0 : (transaction.value & 0xFF) << 8;      // Value to write
+        request[2] = 0;                                                // Skip
+        request[3] = 1 << info.first;                                  // spi_en
+        request[4] = 1 << info.second;                                 // spi_sclk
+        request[5] = spi_devices -> cmd_start_mask | (read ? spi_devices -> cmd_rnw_mask : 0);
+
+        // Issue request and read back controller status in the same round trip
+        VALUES vals = protocol -> writeReadRegister(spi_devices -> spi_address, request, SPI_CONTROLLER_WORDS,
+                                                    spi_devices -> spi_address, SPI_CONTROLLER_WORDS);
+
+        // If protocol cannot combine requests, issue them separately
+        if (vals.error == NOT_IMPLEMENTED)
+        {
+            if (protocol -> writeRegister(spi_devices -> spi_address, request, SPI_CONTROLLER_WORDS) == FAILURE)
+                return FAILURE;
+            vals = pollSPI();
+        }
+
+        // Wait for transaction to complete
+        delay = 0, waited = 0;
+        for(;;)
+        {
+            if (vals.error == FAILURE)
+            {
+                DEBUG_PRINT("TPM::executeDeviceTransactions. Failed to issue request to device " << transaction.device);
+                return FAILURE;
+            }
+
+            bool completed = spiCompleted(request, vals.values);
+            if (completed && read)
+                transaction.value = (vals.values[2] & spi_devices -> read_data_mask) & 0xFF;
+            free(vals.values);
+
+            if (completed)
+                break;
+
+            // Back off before polling again
+            if (waited >= SPI_POLL_TIMEOUT)
+            {
+                DEBUG_PRINT("TPM::executeDeviceTransactions. Timeout waiting for device " << transaction.device);
+                return FAILURE;
+            }
+            usleep(delay);
+            waited += delay;
+            delay = (delay == 0) ? SPI_POLL_MIN_DELAY : std::min(delay * 2, (UINT) SPI_POLL_MAX_DELAY);
+            vals = pollSPI();
+        }
+
+        transaction.error = SUCCESS;
     }
 
     // All done
@@ -304,12 +371,10 @@ RETURN TPM::loadFirmwareBlocking(DEVICE device, const char* bitstream)
     // Load SPI XML file
     spi_devices = new SPI(const_cast<char *>((info -> module).c_str()));       
        
-    // Populate general SPI properties
-    info = memory_map -> getRegisterInfo(BOARD, "spi");
-    spi_devices -> spi_address = info -> address;
-    
+    // Populate general SPI properties. Register addresses already include
+    // the address of the SPI component
     info = memory_map -> getRegisterInfo(BOARD, "spi.address");
-    spi_devices -> spi_address += info -> address;
+    spi_devices -> spi_address = info -> address;
     spi_devices -> spi_address_mask = info -> bitmask;
 
     info = memory_map -> getRegisterInfo(BOARD, "spi.write_data");
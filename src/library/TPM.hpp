@@ -10,6 +10,15 @@
 
 #include <string.h>
 
+// Number of SPI controller registers, from address up to and including command
+#define SPI_CONTROLLER_WORDS 6
+
+// SPI completion polling: delays (in us) start at the minimum and are doubled
+// after every poll up to the maximum, until the timeout is reached
+#define SPI_POLL_MIN_DELAY   10
+#define SPI_POLL_MAX_DELAY   10000
+#define SPI_POLL_TIMEOUT     1000000
+
 // Board derived class representing a Tile Processing Modules
 class TPM: public Board
 {
@@ -52,7 +61,14 @@ class TPM: public Board
         SPI_DEVICE_INFO *getDeviceList(UINT *num_devices);
         VALUES          readDevice(REGISTER device, UINT address);
         RETURN          writeDevice(REGISTER device, UINT address, UINT value);
+        RETURN          executeDeviceTransactions(SPI_TRANSACTION *transactions, UINT n);
+
+    private:
+        // Read SPI controller registers
+        VALUES pollSPI();
 
+        // Check whether SPI controller has completed request
+        bool spiCompleted(UINT *request, UINT *status);
 };
 
 #endif // TPM_CLASS
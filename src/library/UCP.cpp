@@ -9,6 +9,9 @@ UCP::UCP() : Protocol()
     // Initialise sequence number
     sequence_number = rand() % 100000;
 
+    // Issue one request at a time by default
+    window_size = 1;
+
     // Allocate packet once and re-use
     header      = (ucp_command_header *) malloc(sizeof(ucp_command_header));
     packet      = (ucp_command_packet *) malloc(sizeof(ucp_command_packet));
@@ -83,7 +86,7 @@ RETURN UCP::sendPacket(char *message, size_t length)
 }
 
 // Receive packet from board
-size_t UCP::receivePacket(char *buffer, size_t max_length)
+ssize_t UCP::receivePacket(char *buffer, size_t max_length)
 {
     // Wait for reply from board
     return recvfrom(sockfd,       // Socket
@@ -94,82 +97,172 @@ size_t UCP::receivePacket(char *buffer, size_t max_length)
                     NULL);        // No structure provided, ignore
 }
 
-// Issue a read register request, and return reply
-VALUES UCP::readRegister(UINT address, UINT n, UINT offset)
+// Set the number of requests which can be in flight at any one time
+RETURN UCP::setWindowSize(UINT window)
 {
-    // Value per payload
-    unsigned values_per_payload = MAX_PAYLOAD_SIZE / sizeof(UINT);
-
-    // Check if we need to split this request up into multiple packets
-    unsigned num_packets = n / values_per_payload + 1;
+    // Check that window size is valid
+    if (window == 0 || window > MAX_WINDOW_SIZE)
+    {
+        DEBUG_PRINT("UCP::setWindowSize. Invalid window size " << window);
+        return FAILURE;
+    }
 
-    // Allocate memory area for full reply
-    UINT *values = (UINT *) malloc(n * sizeof(UINT));
+    this -> window_size = window;
+    return SUCCESS;
+}
 
-    // Issue requests one by one
-    for(unsigned i = 0; i < num_packets; i++)
-    {
-        // Increment sequence number
-        UINT seqno = sequence_number++;
+// Send a single read or write request
+RETURN UCP::sendRequest(UINT seqno, ucp_request &request)
+{
+    // Fill out request header
+    (packet -> header).psn     = lendian(seqno);
+    (packet -> header).opcode  = lendian(request.opcode);
+    (packet -> header).nvalues = lendian(request.nvalues);
+    (packet -> header).address = lendian(request.address);
+
+    // Read requests consist of the header only
+    if (request.opcode == OPCODE_READ)
+        return sendPacket((char *) packet, sizeof(ucp_command_header));
+
+    // Place data in packet
+    memcpy(&(packet -> data), request.data, request.nvalues * sizeof(UINT));
+    return sendPacket((char *) packet, sizeof(ucp_command_header) + request.nvalues * sizeof(UINT));
+}
 
-        // Number of words for current request
-        unsigned num_values = (i == num_packets - 1) ? n - i * values_per_payload: values_per_payload;
+// Issue a list of requests keeping up to window requests in flight. Replies are
+// matched to requests by PSN, so they can arrive in any order. If no reply
+// arrives within the socket timeout, only the outstanding requests are re-sent
+RETURN UCP::transferWindowed(std::vector<ucp_request> &requests, UINT window, unsigned *retransmitted)
+{
+    unsigned num_requests = requests.size();
+    if (retransmitted != NULL)
+        *retransmitted = num_requests;
 
-        // New address
-        UINT currentAddress = address + (offset + i * values_per_payload) * sizeof(UINT);
+    // Reserve a block of sequence numbers, request i is assigned base + i
+    UINT base = sequence_number.fetch_add(num_requests);
 
-        // Fill out request
-        header -> psn     = lendian(seqno);
-        header -> opcode  = lendian(OPCODE_READ);
-        header -> nvalues = lendian(num_values);
-        header -> address = lendian(currentAddress); 
+    // Keep track of which requests have been acknowledged
+    std::vector<bool> completed(num_requests, false);
+    unsigned next = 0, in_flight = 0, num_completed = 0, retries = 0;
 
-        // Send out packet  
-        DEBUG_PRINT("UCP::readRegister. Sending packet");
-        if (sendPacket((char *) header, sizeof(ucp_command_header)) == FAILURE)
+    while (num_completed < num_requests)
+    {
+        // Fill up window
+        while (in_flight < window && next < num_requests)
         {
-            DEBUG_PRINT("UCP::readRegister. Failed to send packet");
-            free(values);
-            return {0, FAILURE};
+            if (sendRequest(base + next, requests[next]) == FAILURE)
+            {
+                DEBUG_PRINT("UCP::transferWindowed. Failed to send packet");
+                return FAILURE;
+            }
+            next++;
+            in_flight++;
         }
 
-        // Sucessfully sent out packet, calculate responce size
-        size_t reply_size = sizeof(ucp_reply_header) + num_values * sizeof(UINT);
+        // Wait for packet
+        ssize_t ret = receivePacket((char *) read_reply, sizeof(ucp_read_reply));
 
-        // Allocate buffer for reply
-        memset(read_reply, 0, sizeof(ucp_read_reply));
+        // If nothing was received, re-transmit requests which are still outstanding
+        if (ret < (ssize_t) sizeof(ucp_reply_header))
+        {
+            if (++retries > MAX_RETRIES)
+            {
+                DEBUG_PRINT("UCP::transferWindowed. Failed to receive reply");
+                return FAILURE;
+            }
+
+            DEBUG_PRINT("UCP::transferWindowed. Timeout, re-transmitting " << in_flight << " requests");
+            for(unsigned i = 0; i < next; i++)
+            {
+                if (completed[i])
+                    continue;
+
+                if (retransmitted != NULL && i < *retransmitted)
+                    *retransmitted = i;
+
+                if (sendRequest(base + i, requests[i]) == FAILURE)
+                {
+                    DEBUG_PRINT("UCP::transferWindowed. Failed to send packet");
+                    return FAILURE;
+                }
+            }
+            continue;
+        }
 
-        // Wait for packet
-        DEBUG_PRINT("UCP::readRegister. Receiving reply");
-        size_t ret = receivePacket((char *) read_reply, reply_size);
+        // Convert reply header to host endiannes
+        UINT psn  = lendian((read_reply -> header).psn);
+        UINT addr = lendian((read_reply -> header).addr);
 
-        // Convert reply data to host endiannes
-        (read_reply -> header).addr = lendian((read_reply -> header).addr);
-        (read_reply -> header).psn = lendian((read_reply -> header).psn);
+        // Ignore replies to earlier transfers and duplicates caused by re-transmission
+        UINT index = psn - base;
+        if (index >= next || completed[index])
+            continue;
 
-        // Check number of bytes read
-        if (ret < 0 || ret < reply_size)
+        // Check if request was succesful on board
+        ucp_request &request = requests[index];
+        if (addr != request.address)
         {
-            // Something wrong, return error
-            DEBUG_PRINT("UCP::readRegister. Failed to receive reply");
-            free(values);
-            return {NULL, FAILURE};
+            DEBUG_PRINT("UCP::transferWindowed. Command failed on board");
+            return FAILURE;
         }
 
-        // Check if request was succesful on board
-        else if ((read_reply -> header).psn != seqno || (read_reply -> header).addr != currentAddress)
-        {   
-            // Something wrong, return error
-            DEBUG_PRINT("UCP::readRegister. Command failed on board");
-            free(values);
-            return {NULL, FAILURE};
+        // Copy read values to their place in the reply
+        if (request.opcode == OPCODE_READ)
+        {
+            if (ret < (ssize_t) (sizeof(ucp_reply_header) + request.nvalues * sizeof(UINT)))
+            {
+                DEBUG_PRINT("UCP::transferWindowed. Received incomplete reply");
+                return FAILURE;
+            }
+            memcpy(request.data, read_reply -> data, request.nvalues * sizeof(UINT));
         }
 
-        // Successfuly received reply, return values
-        // TODO: Check endiannes
-        
-        // Create array containing required values
-        memcpy(values + i * values_per_payload, read_reply -> data, num_values * sizeof(UINT));           
+        completed[index] = true;
+        num_completed++;
+        in_flight--;
+
+        // Only consecutive timeouts count towards MAX_RETRIES
+        retries = 0;
+    }
+
+    // All done
+    return SUCCESS;
+}
+
+// Split a memory area into requests which fit in a packet
+void UCP::splitRequest(std::vector<ucp_request> &requests, UINT opcode, UINT address, UINT n, UINT *data)
+{
+    // Value per payload
+    unsigned values_per_payload = MAX_PAYLOAD_SIZE / sizeof(UINT);
+
+    for(unsigned i = 0; i < n; i += values_per_payload)
+    {
+        ucp_request request;
+        request.opcode  = opcode;
+        request.address = address + i * sizeof(UINT);
+        request.nvalues = (n - i < values_per_payload) ? n - i : values_per_payload;
+        request.data    = data + i;
+        requests.push_back(request);
+    }
+}
+
+// Issue a read register request, and return reply
+VALUES UCP::readRegister(UINT address, UINT n, UINT offset)
+{
+    // Allocate memory area for full reply
+    UINT *values = (UINT *) malloc(n * sizeof(UINT));
+
+    // Split request up into multiple packets
+    std::vector<ucp_request> requests;
+    splitRequest(requests, OPCODE_READ, address + offset * sizeof(UINT), n, values);
+
+    // Issue requests
+    DEBUG_PRINT("UCP::readRegister. Sending " << requests.size() << " packets");
+    if (transferWindowed(requests, window_size) == FAILURE)
+    {
+        DEBUG_PRINT("UCP::readRegister. Failed to read register");
+        free(values);
+        return {NULL, FAILURE};
     }
 
     return {values, SUCCESS};
@@ -178,76 +271,146 @@ VALUES UCP::readRegister(UINT address, UINT n, UINT offset)
 // Issue a write register request, and return reply
 RETURN UCP::writeRegister(UINT address, UINT *values, UINT n, UINT offset)
 {
-    // Value per payload
-    unsigned values_per_payload = MAX_PAYLOAD_SIZE / sizeof(UINT);
+    // Split request up into multiple packets
+    std::vector<ucp_request> requests;
+    splitRequest(requests, OPCODE_WRITE, address + offset * sizeof(UINT), n, values);
+
+    // Issue requests
+    DEBUG_PRINT("UCP::writeRegister. Sending " << requests.size() << " packets");
+    if (transferWindowed(requests, window_size) == FAILURE)
+    {
+        DEBUG_PRINT("UCP::writeRegister. Failed to write register");
+        return FAILURE;
+    }
+ 
+    // All done
+    return SUCCESS;
+}
+
+// Read from multiple memory areas in a single pipelined batch. All requests in the
+// batch are independent, so they are issued at once regardless of window_size
+VALUES UCP::readRegisterBatch(UINT *addresses, UINT *counts, UINT nsegments)
+{
+    // Calculate total number of values
+    UINT total = 0;
+    for(unsigned i = 0; i < nsegments; i++)
+        total += counts[i];
+
+    // Allocate memory area for full reply
+    UINT *values = (UINT *) malloc(total * sizeof(UINT));
 
-    // Check if we need to split this request up into multiple packets
-    unsigned num_packets = n / values_per_payload + 1;
+    // Split each area up into multiple packets
+    std::vector<ucp_request> requests;
+    for(unsigned i = 0, index = 0; i < nsegments; index += counts[i], i++)
+        splitRequest(requests, OPCODE_READ, addresses[i], counts[i], values + index);
 
-    // Issue requests one by one
-    for(unsigned i = 0; i < num_packets; i++)
+    // Issue requests
+    DEBUG_PRINT("UCP::readRegisterBatch. Sending " << requests.size() << " packets");
+    UINT window = requests.size() < MAX_WINDOW_SIZE ? requests.size() : MAX_WINDOW_SIZE;
+    if (transferWindowed(requests, window) == FAILURE)
     {
-        // Increment sequence number
-        UINT seqno = sequence_number++;
-
-        // Number of words for current request
-        unsigned num_values = (i == num_packets - 1) ? n - i * values_per_payload: values_per_payload;
-
-        // New address
-        UINT currentAddress = address + (offset + i * values_per_payload) * sizeof(UINT);
-
-        // Fill out request
-        (packet -> header).psn     = lendian(seqno);
-        (packet -> header).opcode  = lendian(OPCODE_WRITE);
-        (packet -> header).nvalues = lendian(num_values);
-        (packet -> header).address = lendian(currentAddress);
-
-        // Place data in packet
-        memcpy(&(packet -> data), values + i * values_per_payload, num_values * sizeof(UINT));
-    
-        // Send out packet  
-        DEBUG_PRINT("UCP::writeRegister. Sending packet");
-        if (sendPacket((char *) packet, sizeof(ucp_command_header) + num_values * sizeof(UINT)) == FAILURE)
-        {
-            DEBUG_PRINT("UCP::writeRegister. Failed to send packet");
-            return FAILURE;
-        }
+        DEBUG_PRINT("UCP::readRegisterBatch. Failed to read batch");
+        free(values);
+        return {NULL, FAILURE};
+    }
 
-        // Sucessfully sent out packet, calculate responce size
-        size_t reply_size = sizeof(ucp_write_reply);
+    return {values, SUCCESS};
+}
 
-        // Allocate buffer for reply
-        memset(write_reply, 0, sizeof(ucp_write_reply));
+// Write to multiple memory areas in a single pipelined batch
+RETURN UCP::writeRegisterBatch(UINT *addresses, UINT *counts, UINT nsegments, UINT *values)
+{
+    // Split each area up into multiple packets
+    std::vector<ucp_request> requests;
+    for(unsigned i = 0, index = 0; i < nsegments; index += counts[i], i++)
+        splitRequest(requests, OPCODE_WRITE, addresses[i], counts[i], values + index);
+
+    // Issue requests
+    DEBUG_PRINT("UCP::writeRegisterBatch. Sending " << requests.size() << " packets");
+    UINT window = requests.size() < MAX_WINDOW_SIZE ? requests.size() : MAX_WINDOW_SIZE;
+    if (transferWindowed(requests, window) == FAILURE)
+    {
+        DEBUG_PRINT("UCP::writeRegisterBatch. Failed to write batch");
+        return FAILURE;
+    }
 
-        // Wait for packet
-        DEBUG_PRINT("UCP::writeRegister. Receiving reply");
-        size_t ret = receivePacket((char *) write_reply, reply_size);
+    // All done
+    return SUCCESS;
+}
 
-        // Convert reply data to host endiannes
-        (write_reply -> header).addr = lendian((write_reply -> header).addr);
-        (write_reply -> header).psn = lendian((write_reply -> header).psn);
+// Write to bits within multiple words using the bit write opcode. Each word is
+// updated with a single request carrying the mask followed by the new value, which
+// the board applies atomically, so unmasked and unchanged bits never glitch
+RETURN UCP::writeRegisterMasked(UINT *addresses, UINT *masks, UINT *values, UINT n)
+{
+    // Compute operands for each word, a mask followed by a value
+    std::vector<UINT> operands(2 * n);
+    for(unsigned i = 0; i < n; i++)
+    {
+        operands[2 * i]     = masks[i];
+        operands[2 * i + 1] = values[i] & masks[i];
+    }
 
-        // Check number of bytes read
-        if (ret < 0 || ret < reply_size)
-        {
-            // Something wrong, return error
-            DEBUG_PRINT("UCP::writeRegister. Failed to receive reply");
-            return FAILURE;
-        }
-        // Check if request was succesful on board
-        else if ((write_reply -> header).psn != seqno || (write_reply -> header).addr != currentAddress)
-        {   
-            // Something wrong, return error
-            DEBUG_PRINT("UCP::readRegister. Command failed on board");
-            return FAILURE;
-        }
+    // Create one request per word
+    std::vector<ucp_request> requests;
+    for(unsigned i = 0; i < n; i++)
+        splitRequest(requests, OPCODE_BIT_WRITE, addresses[i], 2, &operands[2 * i]);
 
+    // Issue requests
+    DEBUG_PRINT("UCP::writeRegisterMasked. Sending " << n << " bit write requests");
+    UINT window = requests.size() < MAX_WINDOW_SIZE ? requests.size() : MAX_WINDOW_SIZE;
+    if (transferWindowed(requests, window) == FAILURE)
+    {
+        DEBUG_PRINT("UCP::writeRegisterMasked. Failed to write bits");
+        return FAILURE;
     }
- 
+
     // All done
     return SUCCESS;
 }
 
+// Write values and read back a memory area, issuing both requests before waiting
+// for replies. The board processes requests in the order they arrive, so the read
+// reflects the write unless a write packet was lost. In that case the read may
+// have been processed before the re-transmitted write, so it is issued again
+VALUES UCP::writeReadRegister(UINT write_address, UINT *values, UINT n, UINT read_address, UINT m)
+{
+    // Allocate memory area for read values
+    UINT *read_values = (UINT *) malloc(m * sizeof(UINT));
+
+    // Create write requests followed by read requests
+    std::vector<ucp_request> requests;
+    splitRequest(requests, OPCODE_WRITE, write_address, n, values);
+    unsigned num_writes = requests.size();
+    splitRequest(requests, OPCODE_READ, read_address, m, read_values);
+
+    // Issue all requests at once
+    DEBUG_PRINT("UCP::writeReadRegister. Sending " << requests.size() << " packets");
+    UINT window = requests.size() < MAX_WINDOW_SIZE ? requests.size() : MAX_WINDOW_SIZE;
+    unsigned retransmitted;
+    if (transferWindowed(requests, window, &retransmitted) == FAILURE)
+    {
+        DEBUG_PRINT("UCP::writeReadRegister. Failed to write and read register");
+        free(read_values);
+        return {NULL, FAILURE};
+    }
+
+    // If a write was re-transmitted, read again now that all writes have been acknowledged
+    if (retransmitted < num_writes)
+    {
+        DEBUG_PRINT("UCP::writeReadRegister. Write was re-transmitted, reading again");
+        std::vector<ucp_request> reads(requests.begin() + num_writes, requests.end());
+        if (transferWindowed(reads, window) == FAILURE)
+        {
+            DEBUG_PRINT("UCP::writeReadRegister. Failed to read register");
+            free(read_values);
+            return {NULL, FAILURE};
+        }
+    }
+
+    return {read_values, SUCCESS};
+}
+
 // TODO: Implement this when functionality is defined
 FIRMWARE UCP::listFirmware(UINT *num_firmware)
 {
@@ -3,6 +3,15 @@
 
 #include "Protocol.hpp"
 
+#include <atomic>
+#include <vector>
+
+// Maximum number of requests which can be in flight at any one time
+#define MAX_WINDOW_SIZE 64
+
+// Number of times missing replies are re-transmitted before giving up
+#define MAX_RETRIES 3
+
 // Protocol subclass implementing the UCP protocol
 class UCP: public Protocol
 {
@@ -17,17 +26,47 @@ class UCP: public Protocol
         VALUES readRegister(UINT address, UINT n = 1, UINT offset = 0);
         RETURN writeRegister(UINT address, UINT *values, UINT n = 1, UINT offset = 0);
         FIRMWARE listFirmware(UINT *num_firmware);
+        RETURN setWindowSize(UINT window);
+        VALUES readRegisterBatch(UINT *addresses, UINT *counts, UINT nsegments);
+        RETURN writeRegisterBatch(UINT *addresses, UINT *counts, UINT nsegments, UINT *values);
+        RETURN writeRegisterMasked(UINT *addresses, UINT *masks, UINT *values, UINT n);
+        VALUES writeReadRegister(UINT write_address, UINT *values, UINT n, UINT read_address, UINT m);
+
+    private:
+        // A single request within a multi-packet transfer. For reads, data points
+        // to where the reply should be stored, for writes to the values to send
+        struct ucp_request
+        {
+            UINT opcode;
+            UINT address;
+            UINT nvalues;
+            UINT *data;
+        };
 
     private:
         // Send packet
         RETURN sendPacket(char *message, size_t length);
 
         // Receive packet
-        size_t receivePacket(char *buffer, size_t max_length);
+        ssize_t receivePacket(char *buffer, size_t max_length);
+
+        // Split a memory area into requests which fit in a packet
+        void splitRequest(std::vector<ucp_request> &requests, UINT opcode, UINT address, UINT n, UINT *data);
+
+        // Send a single read or write request
+        RETURN sendRequest(UINT seqno, ucp_request &request);
+
+        // Issue a list of requests keeping up to window requests in flight. If
+        // retransmitted is given, it is set to the index of the first request
+        // which had to be re-transmitted, or to the number of requests if none was
+        RETURN transferWindowed(std::vector<ucp_request> &requests, UINT window, unsigned *retransmitted = NULL);
 
     private:
-        // Sequence number
-        UINT  sequence_number;
+        // Sequence number, allocated atomically per transfer
+        std::atomic<UINT> sequence_number;
+
+        // Number of requests which can be in flight at any one time
+        UINT  window_size;
 
     private:
     
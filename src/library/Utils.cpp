@@ -58,6 +58,33 @@ UINT lendian(UINT value)
     return value;
 }
 
+// Generate CRC-32 lookup table
+static bool generateCRCTable(UINT *table)
+{
+    for(UINT i = 0; i < 256; i++)
+    {
+        UINT value = i;
+        for(unsigned j = 0; j < 8; j++)
+            value = (value & 1) ? (value >> 1) ^ 0xEDB88320 : value >> 1;
+        table[i] = value;
+    }
+    return true;
+}
+
+// Compute CRC-32 checksum of a buffer (same polynomial as zlib)
+UINT crc32(const char *data, size_t size)
+{
+    // Lookup table is generated on first call
+    static UINT table[256];
+    static bool generated = generateCRCTable(table);
+    (void) generated;
+
+    UINT crc = 0xFFFFFFFF;
+    for(size_t i = 0; i < size; i++)
+        crc = table[(crc ^ (unsigned char) data[i]) & 0xFF] ^ (crc >> 8);
+    return crc ^ 0xFFFFFFFF;
+}
+
 // Convert string to number (Windows only)
 #if defined(_WIN32) || defined(WIN32) || defined(WIN64) || defined(_WIN64)
     int stoi(std::string input, int beg, int base)
@@ -23,6 +23,9 @@ char *extractXMLFile(const char *filepath);
 // Convert to little endian if required
 UINT lendian(UINT value);
 
+// Compute CRC-32 checksum of a buffer (same polynomial as zlib)
+UINT crc32(const char *data, size_t size);
+
 // Convert string to number (Windows only)
 #if defined(_WIN32) || defined(WIN32) || defined(WIN64) || defined(_WIN64)
     int stoi(std::string input, int beg, int base);
@@ -0,0 +1,210 @@
+// Load test for the access layer server. A number of clients, each in its own
+// thread, issue register reads to one or more boards and the request rate and
+// latency distribution are reported. Boards are spread over the clients, so
+// that the effect of serving boards in parallel can be measured, for instance
+// against scripts/mock_tpm.py with reply latency enabled
+
+#include <zmq.hpp>
+#include <algorithm>
+#include <iostream>
+#include <thread>
+#include <vector>
+#include <string>
+#include <stdlib.h>
+#include <unistd.h>
+#include <time.h>
+
+#include "message.pb.h"
+
+// Test configuration
+std::string serverAddress("tcp://localhost:5555");
+std::vector<std::string> boardIPs;
+int         boardPort   = 10000;
+std::string memoryMap;
+std::string registerName;
+unsigned    numWords    = 1;
+bool        rawData     = false;
+unsigned    numClients  = 4;
+unsigned    numRequests = 1000;
+
+// Get current time in seconds
+double now()
+{
+    struct timespec ts;
+    clock_gettime(CLOCK_MONOTONIC, &ts);
+    return ts.tv_sec + ts.tv_nsec * 1e-9;
+}
+
+// Send request and wait for reply
+bool sendRequest(zmq::socket_t &socket, Request &request, Reply &reply)
+{
+    int size = request.ByteSize();
+    zmq::message_t message(size);
+    request.SerializeToArray(message.data(), size);
+    socket.send(message);
+
+    zmq::message_t response;
+    socket.recv(&response);
+    return reply.ParseFromArray(response.data(), response.size()) && reply.result() == Reply::SUCCESS;
+}
+
+// Connect to board and load its memory map, returning the board ID
+int setupBoard(zmq::socket_t &socket, const std::string &ip)
+{
+    Request request;
+    Reply   reply;
+    request.set_command(Request::CONNECT);
+    request.set_ip(ip);
+    request.set_port(boardPort);
+    if (!sendRequest(socket, request, reply))
+    {
+        std::cerr << "Could not connect to board " << ip << std::endl;
+        return -1;
+    }
+    int id = reply.id();
+
+    if (!memoryMap.empty())
+    {
+        request.Clear();
+        request.set_command(Request::LOAD_FIRMWARE_BLOCKING);
+        request.set_id(id);
+        request.set_device(Request::FPGA_1);
+        request.set_file(memoryMap);
+        if (!sendRequest(socket, request, reply))
+        {
+            std::cerr << "Could not load " << memoryMap << " on board " << ip << std::endl;
+            return -1;
+        }
+    }
+
+    return id;
+}
+
+// Client thread, issuing requests to a board and recording the latency of each
+void client(zmq::context_t *context, int id, std::vector<double> *latencies, unsigned *failures)
+{
+    zmq::socket_t socket(*context, ZMQ_REQ);
+    socket.connect(serverAddress.c_str());
+
+    Request request;
+    Reply   reply;
+    request.set_id(id);
+    request.set_device(Request::FPGA_1);
+    if (registerName.empty())
+        request.set_command(Request::GET_STATUS);
+    else
+    {
+        request.set_command(Request::GET_REGISTER_VALUES);
+        request.set_registername(registerName);
+        request.set_n(numWords);
+        request.set_raw(rawData);
+    }
+
+    latencies -> reserve(numRequests);
+    for(unsigned i = 0; i < numRequests; i++)
+    {
+        double start = now();
+        if (!sendRequest(socket, request, reply))
+            (*failures)++;
+        latencies -> push_back(now() - start);
+    }
+}
+
+void usage(const char *name)
+{
+    std::cerr << "Usage: " << name << " [options] board_ip [board_ip ...]" << std::endl
+              << "  -s  Server endpoint [default: " << serverAddress << "]" << std::endl
+              << "  -p  Board port [default: " << boardPort << "]" << std::endl
+              << "  -f  Memory map loaded on each board" << std::endl
+              << "  -r  Register to read, status requests are sent if not specified" << std::endl
+              << "  -n  Number of words to read [default: " << numWords << "]" << std::endl
+              << "  -d  Request register values as raw data instead of a values list" << std::endl
+              << "  -c  Number of clients [default: " << numClients << "]" << std::endl
+              << "  -m  Number of requests per client [default: " << numRequests << "]" << std::endl;
+}
+
+int main(int argc, char *argv[])
+{
+    GOOGLE_PROTOBUF_VERIFY_VERSION;
+
+    // Parse command line options
+    int option;
+    while ((option = getopt(argc, argv, "s:p:f:r:n:dc:m:h")) != -1)
+    {
+        switch (option)
+        {
+            case 's': serverAddress = optarg;       break;
+            case 'p': boardPort     = atoi(optarg); break;
+            case 'f': memoryMap     = optarg;       break;
+            case 'r': registerName  = optarg;       break;
+            case 'n': numWords      = atoi(optarg); break;
+            case 'd': rawData       = true;         break;
+            case 'c': numClients    = atoi(optarg); break;
+            case 'm': numRequests   = atoi(optarg); break;
+            default:
+                usage(argv[0]);
+                return option == 'h' ? 0 : 1;
+        }
+    }
+
+    for(int i = optind; i < argc; i++)
+        boardIPs.push_back(argv[i]);
+
+    if (boardIPs.empty() || numClients == 0 || numRequests == 0)
+    {
+        usage(argv[0]);
+        return 1;
+    }
+
+    zmq::context_t context(1);
+
+    // Connect to boards
+    std::vector<int> ids;
+    {
+        zmq::socket_t socket(context, ZMQ_REQ);
+        socket.connect(serverAddress.c_str());
+        for(unsigned i = 0; i < boardIPs.size(); i++)
+        {
+            int id = setupBoard(socket, boardIPs[i]);
+            if (id < 0)
+                return 1;
+            ids.push_back(id);
+        }
+    }
+
+    // Run clients, boards are assigned to clients in turn
+    std::vector<std::vector<double> > latencies(numClients);
+    std::vector<unsigned> failures(numClients, 0);
+    std::vector<std::thread> clients;
+
+    double start = now();
+    for(unsigned i = 0; i < numClients; i++)
+        clients.push_back(std::thread(client, &context, ids[i % ids.size()], &latencies[i], &failures[i]));
+    for(unsigned i = 0; i < numClients; i++)
+        clients[i].join();
+    double elapsed = now() - start;
+
+    // Report
+    std::vector<double> all;
+    unsigned failed = 0;
+    for(unsigned i = 0; i < numClients; i++)
+    {
+        all.insert(all.end(), latencies[i].begin(), latencies[i].end());
+        failed += failures[i];
+    }
+    std::sort(all.begin(), all.end());
+
+    double total = 0;
+    for(unsigned i = 0; i < all.size(); i++)
+        total += all[i];
+
+    std::cout << all.size() << " requests from " << numClients << " clients to " << ids.size()
+              << " boards in " << elapsed << " s (" << failed << " failed)" << std::endl;
+    std::cout << "Throughput: " << all.size() / elapsed << " requests/s" << std::endl;
+    std::cout << "Latency (ms): mean " << total / all.size() * 1e3
+              << ", median " << all[all.size() / 2] * 1e3
+              << ", 99th percentile " << all[(all.size() * 99) / 100] * 1e3
+              << ", max " << all.back() * 1e3 << std::endl;
+
+    return 0;
+}
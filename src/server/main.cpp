@@ -1,8 +1,17 @@
 #include <zmq.hpp>
+#include <condition_variable>
 #include <iostream>
+#include <sstream>
+#include <thread>
+#include <mutex>
+#include <deque>
+#include <map>
+#include <vector>
 #include <stdlib.h>
 #include <unistd.h>
 #include <string.h>
+#include <signal.h>
+#include <stdio.h>
 #include <time.h>
 
 #include "AccessLayer.hpp"
@@ -10,18 +19,35 @@
 
 #include "message.pb.h"
 
+// ---------------------------- LOGGING -----------------------------------
+
+// Log levels, selected with -v
+#define LOG_ERROR 1
+#define LOG_INFO  2
+#define LOG_DEBUG 3
+
+int logLevel = LOG_ERROR;
+
+// Log a message if level is enabled. Messages are written with a single call
+// so that lines from different workers do not interleave
+#define LOG(level, msg) \
+    do { \
+        if (logLevel >= level) { \
+            std::ostringstream stream; \
+            stream << msg << std::endl; \
+            std::cerr << stream.str(); \
+        } \
+    } while (0)
+
 // --------------------- REQUEST HANDLING FUNCTIONS ------------------------
 
 // Process connect to board request
 void processConnectBoard(Request *message, Reply *replyMessage)
 {
-    std::cout << "Received connect request to " << message -> ip()  << std::endl;
+    LOG(LOG_INFO, "Received connect request to " << message -> ip() << ":" << message -> port());
 
     // Call library connectBoard
-    ID id = connectBoard(message -> ip().c_str(), message -> port());
-
-    // TEMPORARY: Load firmware
-    loadFirmwareBlocking(id, FPGA_1, "/home/lessju/map.xml");
+    ID id = connectBoard((BOARD_MAKE) message -> board(), message -> ip().c_str(), message -> port());
 
     // Check if call failed
     if (id > 0)
@@ -30,13 +56,16 @@ void processConnectBoard(Request *message, Reply *replyMessage)
         replyMessage -> set_id(id);
     }
     else
+    {
+        LOG(LOG_ERROR, "Failed to connect to " << message -> ip() << ":" << message -> port());
         replyMessage -> set_result(Reply::FAILURE);
+    }
 }
 
 // Process disconnect from board request
 void processDisconnectBoard(Request *message, Reply *replyMessage)
 {
-    std::cout << "Received disconnect request" << std::endl;
+    LOG(LOG_INFO, "Received disconnect request for board " << message -> id());
 
     // Call library disconnectBoard
     RETURN err = disconnectBoard(message -> id());
@@ -48,8 +77,6 @@ void processDisconnectBoard(Request *message, Reply *replyMessage)
 // Process get register list request
 void processGetRegisterList(Request *message, Reply *replyMessage)
 {
-    std::cout << "Received get register list request" << std::endl;
-
     // Call library function
     unsigned int num_registers;
     REGISTER_INFO *list = getRegisterList(message -> id(), &num_registers);
@@ -58,7 +85,7 @@ void processGetRegisterList(Request *message, Reply *replyMessage)
     if (num_registers == 0 || list == NULL)
         replyMessage -> set_result(Reply::FAILURE);
     else
-    {                       
+    {
         // Set result type
         replyMessage -> set_result(Reply::SUCCESS);
 
@@ -67,30 +94,34 @@ void processGetRegisterList(Request *message, Reply *replyMessage)
         {
             // Create new RegisterInfoType instance and populate
             Reply::RegisterInfoType *regInfo = replyMessage -> add_registerlist();
-            regInfo -> set_name(list[i].name);               
+            regInfo -> set_name(list[i].name);
             regInfo -> set_size(list[i].size);
             regInfo -> set_description(list[i].description);
             regInfo -> set_permission(convertPermissionEnum(list[i].permission));
             regInfo -> set_type(convertTypeEnum(list[i].type));
             regInfo -> set_device(convertDeviceEnum(list[i].device));
+            regInfo -> set_value(list[i].value);
+            regInfo -> set_bits(list[i].bits);
+            regInfo -> set_address(list[i].address);
+            regInfo -> set_bitmask(list[i].bitmask);
+            regInfo -> set_shift(list[i].bitmask == 0 ? 0 : __builtin_ctz(list[i].bitmask));
+            regInfo -> set_volatility((Reply::VolatilityType) list[i].volatility);
         }
     }
 
     // Free up memory
-    free(list);
+    freeMemory(list);
 }
 
 // Process get register value request
 void processGetRegisterValue(Request *message, Reply *replyMessage)
 {
-    std::cout << "Received get register value request" << std::endl;
-
     // Extract enums
     DEVICE dev = convertDeviceEnum(message -> device());
 
     // Call library function
     REGISTER regName = message -> registername().c_str();
-    VALUES vals = readRegister(message -> id(), dev, regName, 1);
+    VALUES vals = readRegister(message -> id(), dev, regName, 1, message -> offset());
 
     // Check if call succeeded
     if (vals.error == FAILURE)
@@ -100,44 +131,75 @@ void processGetRegisterValue(Request *message, Reply *replyMessage)
         replyMessage -> set_result(Reply::SUCCESS);
         replyMessage -> set_value(vals.values[0]);
     }
+
+    // Free up memory
+    freeMemory(vals.values);
+}
+
+// Copy values read from the board into reply, either as raw little-endian words
+// or into the packed values field
+void setReplyValues(Request *message, Reply *replyMessage, UINT *values, UINT n)
+{
+    if (message -> raw())
+        replyMessage -> set_data(values, n * sizeof(UINT));
+    else
+    {
+        replyMessage -> mutable_values() -> Resize(n, 0);
+        memcpy(replyMessage -> mutable_values() -> mutable_data(), values, n * sizeof(UINT));
+    }
+}
+
+// Get values to write from request. Values are taken from data if present,
+// otherwise from the values field. Both are passed to the library without
+// copying (library writes do not modify the values buffer)
+bool getRequestValues(Request *message, UINT **values, UINT *n)
+{
+    *values = message -> mutable_values() -> mutable_data();
+    *n = message -> values_size();
+    if (message -> has_data())
+    {
+        if (message -> data().size() % sizeof(UINT) != 0)
+            return false;
+        *values = (UINT *) message -> data().data();
+        *n = message -> data().size() / sizeof(UINT);
+    }
+    return true;
 }
 
 // Process get register values request
 void processGetRegisterValues(Request *message, Reply *replyMessage)
 {
-    std::cout << "Received get register values request" << std::endl;
-
     // Extract enum
     DEVICE dev = convertDeviceEnum(message -> device());
 
     // Call library function
     REGISTER regName = message -> registername().c_str();
-    VALUES vals = readRegister(message -> id(), dev, regName, message -> n());
+    UINT n = message -> n();
+    VALUES vals = readRegister(message -> id(), dev, regName, n, message -> offset());
 
     // Check if call succeeded
     if (vals.error == FAILURE)
         replyMessage -> set_result(Reply::FAILURE);
     else
     {
-        // Set values and success
-        for(unsigned i = 0; i < message -> n(); i++)
-            replyMessage -> add_values(vals.values[i]);
+        setReplyValues(message, replyMessage, vals.values, n);
         replyMessage -> set_result(Reply::SUCCESS);
     }
+
+    // Free up memory
+    freeMemory(vals.values);
 }
 
 // Process set register value request
 void processSetRegisterValue(Request *message, Reply *replyMessage)
 {
-    std::cout << "Received set register value request" << std::endl;
-
     // Extract enums
     DEVICE dev = convertDeviceEnum(message -> device());
 
     // Call library function
     REGISTER regName = message -> registername().c_str();
     uint32_t value = message -> value();
-    RETURN err = writeRegister(message -> id(), dev, regName, 1, &value);
+    RETURN err = writeRegister(message -> id(), dev, regName, &value, 1, message -> offset());
 
     // Check if call succeeded
     replyMessage -> set_result(convertErrorEnum(err));
@@ -146,15 +208,160 @@ void processSetRegisterValue(Request *message, Reply *replyMessage)
 // Process set register values request
 void processSetRegisterValues(Request *message, Reply *replyMessage)
 {
-    std::cout << "Received set register values request" << std::endl;
-
     // Extract enums
     DEVICE dev = convertDeviceEnum(message -> device());
 
+    // Get values to write
+    UINT *values, n;
+    if (!getRequestValues(message, &values, &n))
+    {
+        LOG(LOG_ERROR, "Register data for " << message -> registername() << " is not a whole number of words");
+        replyMessage -> set_result(Reply::FAILURE);
+        return;
+    }
+
     // Call library function
     REGISTER regName = message -> registername().c_str();
-    RETURN err = writeRegister(message -> id(), dev, regName, message -> n(), 
-                              message -> mutable_values() -> mutable_data());
+    RETURN err = writeRegister(message -> id(), dev, regName, values, n, message -> offset());
+
+    // Check if call succeeded
+    replyMessage -> set_result(convertErrorEnum(err));
+}
+
+// Process read address request
+void processReadAddress(Request *message, Reply *replyMessage)
+{
+    // Call library function
+    UINT n = message -> n();
+    VALUES vals = readAddress(message -> id(), message -> address(), n);
+
+    // Check if call succeeded
+    if (vals.error == FAILURE)
+        replyMessage -> set_result(Reply::FAILURE);
+    else
+    {
+        setReplyValues(message, replyMessage, vals.values, n);
+        replyMessage -> set_result(Reply::SUCCESS);
+    }
+
+    // Free up memory
+    freeMemory(vals.values);
+}
+
+// Process write address request
+void processWriteAddress(Request *message, Reply *replyMessage)
+{
+    // Get values to write
+    UINT *values, n;
+    if (!getRequestValues(message, &values, &n))
+    {
+        LOG(LOG_ERROR, "Data for address " << message -> address() << " is not a whole number of words");
+        replyMessage -> set_result(Reply::FAILURE);
+        return;
+    }
+
+    // Call library function
+    RETURN err = writeAddress(message -> id(), message -> address(), values, n);
+
+    // Check if call succeeded
+    replyMessage -> set_result(convertErrorEnum(err));
+}
+
+// Process set window size request
+void processSetWindowSize(Request *message, Reply *replyMessage)
+{
+    // Call library function
+    RETURN err = setWindowSize(message -> id(), message -> value());
+
+    // Check if call succeeded
+    replyMessage -> set_result(convertErrorEnum(err));
+}
+
+// Process get SPI device list request
+void processGetDeviceList(Request *message, Reply *replyMessage)
+{
+    // Call library function
+    unsigned int num_devices = 0;
+    SPI_DEVICE_INFO *list = getDeviceList(message -> id(), &num_devices);
+
+    // Boards without SPI devices return an empty list
+    replyMessage -> set_result(Reply::SUCCESS);
+    for(unsigned i = 0; list != NULL && i < num_devices; i++)
+    {
+        Reply::SPIInfoType *devInfo = replyMessage -> add_devicelist();
+        devInfo -> set_name(list[i].name);
+        devInfo -> set_spi_sclk(list[i].spi_sclk);
+        devInfo -> set_spi_en(list[i].spi_en);
+    }
+
+    // Free up memory
+    freeMemory(list);
+}
+
+// Process read SPI device request
+void processReadDevice(Request *message, Reply *replyMessage)
+{
+    // Call library function
+    VALUES vals = readDevice(message -> id(), message -> registername().c_str(), message -> address());
+
+    // Check if call succeeded
+    if (vals.error == FAILURE)
+        replyMessage -> set_result(Reply::FAILURE);
+    else
+    {
+        replyMessage -> set_result(Reply::SUCCESS);
+        replyMessage -> set_value(vals.values[0]);
+    }
+
+    // Free up memory
+    freeMemory(vals.values);
+}
+
+// Process write SPI device request
+void processWriteDevice(Request *message, Reply *replyMessage)
+{
+    // Call library function
+    RETURN err = writeDevice(message -> id(), message -> registername().c_str(),
+                             message -> address(), message -> value());
+
+    // Check if call succeeded
+    replyMessage -> set_result(convertErrorEnum(err));
+}
+
+// Process a list of SPI transactions, passed as READ_DEVICE and WRITE_DEVICE
+// requests, in a single library call. Each transaction has a reply holding
+// its result and the value read or written
+void processExecuteDeviceTransactions(Request *message, Reply *replyMessage)
+{
+    // Fill in transactions
+    std::vector<SPI_TRANSACTION> transactions(message -> requests_size());
+    for(int i = 0; i < message -> requests_size(); i++)
+    {
+        const Request &request = message -> requests(i);
+        if (request.command() != Request::READ_DEVICE && request.command() != Request::WRITE_DEVICE)
+        {
+            LOG(LOG_ERROR, "Unsupported command " << request.command() << " in SPI transactions");
+            replyMessage -> set_result(Reply::NOT_IMPLEMENTED);
+            return;
+        }
+
+        transactions[i].device  = request.registername().c_str();
+        transactions[i].address = request.address();
+        transactions[i].op      = request.command() == Request::READ_DEVICE ? SPI_READ : SPI_WRITE;
+        transactions[i].value   = request.value();
+        transactions[i].error   = FAILURE;
+    }
+
+    // Call library function
+    RETURN err = executeDeviceTransactions(message -> id(), transactions.data(), transactions.size());
+
+    // Add a reply per transaction
+    for(unsigned i = 0; i < transactions.size(); i++)
+    {
+        Reply *reply = replyMessage -> add_replies();
+        reply -> set_result(convertErrorEnum(transactions[i].error));
+        reply -> set_value(transactions[i].value);
+    }
 
     // Check if call succeeded
     replyMessage -> set_result(convertErrorEnum(err));
@@ -163,16 +370,13 @@ void processSetRegisterValues(Request *message, Reply *replyMessage)
 // Process load firmware blocking
 void processLoadFirmwareBlocking(Request *message, Reply *replyMessage)
 {
-    std::cout << "Received load firmware blocking request" << std::endl;
+    LOG(LOG_INFO, "Received load firmware blocking request for board " << message -> id()
+                  << ", file: " << message -> file());
 
     // Convert device type
     DEVICE dev = convertDeviceEnum(message -> device());
 
-    std::cout << "ID: " << message -> id() << ", file: " << message -> file() << std::endl;
-
-    RETURN err = loadFirmwareBlocking(message -> id(), dev,
-                                     "/home/lessju/map.xml");
-                                    // message -> file().c_str());
+    RETURN err = loadFirmwareBlocking(message -> id(), dev, message -> file().c_str());
 
     // Check if call failed and send result
     replyMessage -> set_result(convertErrorEnum(err));
@@ -181,162 +385,506 @@ void processLoadFirmwareBlocking(Request *message, Reply *replyMessage)
 // Process load firmware
 void processLoadFirmware(Request *message, Reply *replyMessage)
 {
-    std::cout << "Received load firmware request" << std::endl;
+    LOG(LOG_INFO, "Received load firmware request for board " << message -> id()
+                  << ", file: " << message -> file());
 
     // Convert device type
     DEVICE dev = convertDeviceEnum(message -> device());
 
-    std::cout << "ID: " << message -> id() << ", file: " << message -> file() << std::endl;
-
-    RETURN err = loadFirmwareBlocking(message -> id(), dev,
-                                     "/home/lessju/map.xml");
-//                                     message -> file().c_str());
+    RETURN err = loadFirmware(message -> id(), dev, message -> file().c_str());
 
     // Check if call failed and send result
     replyMessage -> set_result(convertErrorEnum(err));
 }
 
-// ------------------------------------------------------------------------
+void processRequest(Request *message, Reply *replyMessage);
 
-// 0MQ Connection string
-std::string connectionString("tcp://*:5555");
+// Process a batch of requests to the same board, in order. The batch fails
+// if any of its requests fails, in which case the remaining are still processed
+void processBatch(Request *message, Reply *replyMessage)
+{
+    LOG(LOG_DEBUG, "Received batch of " << message -> requests_size() << " requests for board " << message -> id());
 
-// Main server entry point
-int main(int argc, char *argv[])
+    replyMessage -> set_result(Reply::SUCCESS);
+    for(int i = 0; i < message -> requests_size(); i++)
+    {
+        Request *request = message -> mutable_requests(i);
+        Reply   *reply   = replyMessage -> add_replies();
+
+        // Batched requests are queued with the batch, so they cannot change
+        // the board registry or contain further batches
+        if (request -> command() == Request::CONNECT || request -> command() == Request::DISCONNECT ||
+            request -> command() == Request::BATCH)
+        {
+            LOG(LOG_ERROR, "Unsupported command " << request -> command() << " in batch");
+            reply -> set_result(Reply::NOT_IMPLEMENTED);
+        }
+        else
+        {
+            request -> set_id(message -> id());
+            processRequest(request, reply);
+        }
+
+        if (reply -> result() != Reply::SUCCESS)
+            replyMessage -> set_result(Reply::FAILURE);
+    }
+}
+
+// Process a request and fill in its reply
+void processRequest(Request *message, Reply *replyMessage)
 {
-    // Verify protobuf version
-    GOOGLE_PROTOBUF_VERIFY_VERSION;
+    // Switch on request type
+    switch(message -> command())
+    {
+        // Connect to board
+        case Request::CONNECT:
+        {
+            processConnectBoard(message, replyMessage);
+            break;
+        }
 
-    // Prepare context and publisher
-    zmq::context_t context(1);
-    zmq::socket_t  socket(context, ZMQ_REP);
-    socket.bind(connectionString.c_str());
+        // Disconnect from board
+        case Request::DISCONNECT:
+        {
+            processDisconnectBoard(message, replyMessage);
+            break;
+        }
 
-    // Wait for requests
-    while (true)
-    {   
-        // Create 0MQ request
-        zmq::message_t request;
+        // Batch of requests to the same board
+        case Request::BATCH:
+        {
+            processBatch(message, replyMessage);
+            break;
+        }
 
-        // Receive request from client
-        socket.recv(&request);
+        // Reset board
+        case Request::RESET_BOARD:
+        {
+            // NOTE: Not implemented yet, reply with dummy value
+            replyMessage -> set_result(Reply::SUCCESS);
+            break;
+        }
 
-        // Create Message object
-        Request message;
+        // Get board status
+        case Request::GET_STATUS:
+        {
+            // NOTE: Not implemented yet, reply with dummy value
+            replyMessage -> set_result(Reply::SUCCESS);
+            replyMessage -> set_status(Reply::OK);
+            break;
+        }
 
-        // Deserialise message
-        std::string msg_str(static_cast<char *>(request.data()), request.size());
-        message.ParseFromString(msg_str);
+        // Get register list
+        case Request::GET_REGISTER_LIST:
+        {
+            processGetRegisterList(message, replyMessage);
+            break;
+        }
 
-        Reply replyMessage;
+        // Get register value
+        case Request::GET_REGISTER_VALUE:
+        {
+            processGetRegisterValue(message, replyMessage);
+            break;
+        }
 
-        // Switch on request type
-        switch(message.command())
+        // Get register values
+        case Request::GET_REGISTER_VALUES:
         {
-            // Connect to board
-            case Request::CONNECT:
-            {
-                processConnectBoard(&message, &replyMessage);
-                break;
-            }
+            processGetRegisterValues(message, replyMessage);
+            break;
+        }
 
-            // Disconnect from board
-            case Request::DISCONNECT:
-            {
-                processDisconnectBoard(&message, &replyMessage);
-                break;
-            }
+        // Set register value
+        case Request::SET_REGISTER_VALUE:
+        {
+            processSetRegisterValue(message, replyMessage);
+            break;
+        }
 
-            // Reset board
-            case Request::RESET_BOARD:
-            {
-                std::cout << "Received reset board request" << std::endl;
+        // Set register values
+        case Request::SET_REGISTER_VALUES:
+        {
+            processSetRegisterValues(message, replyMessage);
+            break;
+        }
 
-                // NOTE: Not implemented yet, reply with dummy value
-                replyMessage.set_result(Reply::SUCCESS);
+        // Load firmware blocking
+        case Request::LOAD_FIRMWARE_BLOCKING:
+        {
+            processLoadFirmwareBlocking(message, replyMessage);
+            break;
+        }
 
-                // Done
-                break;
-            }
+        // Load firmware
+        case Request::LOAD_FIRMWARE:
+        {
+            processLoadFirmware(message, replyMessage);
+            break;
+        }
 
-            // Get board status
-            case Request::GET_STATUS:
-            {
-                std::cout << "Received get status request" << std::endl;
+        // Read from memory address
+        case Request::READ_ADDRESS:
+        {
+            processReadAddress(message, replyMessage);
+            break;
+        }
 
-                // NOTE: Not implemented yet, reply with dummy value
-                replyMessage.set_result(Reply::SUCCESS);
-                replyMessage.set_status(Reply::OK);
+        // Write to memory address
+        case Request::WRITE_ADDRESS:
+        {
+            processWriteAddress(message, replyMessage);
+            break;
+        }
 
-                // Done
-                break;                
-            }
+        // Set number of requests in flight for multi-packet transfers
+        case Request::SET_WINDOW_SIZE:
+        {
+            processSetWindowSize(message, replyMessage);
+            break;
+        }
 
-            // Get register list
-            case Request::GET_REGISTER_LIST:
-            {
-                processGetRegisterList(&message, &replyMessage);
-                break;
-            }
+        // Get SPI device list
+        case Request::GET_DEVICE_LIST:
+        {
+            processGetDeviceList(message, replyMessage);
+            break;
+        }
 
-            // Get register value
-            case Request::GET_REGISTER_VALUE:
-            {
-                processGetRegisterValue(&message, &replyMessage);
-                break;
-            }
+        // Read from SPI device
+        case Request::READ_DEVICE:
+        {
+            processReadDevice(message, replyMessage);
+            break;
+        }
 
-            // Get register values
-            case Request::GET_REGISTER_VALUES:
-            {
-                processGetRegisterValues(&message, &replyMessage);
-                break;
-            }
+        // Write to SPI device
+        case Request::WRITE_DEVICE:
+        {
+            processWriteDevice(message, replyMessage);
+            break;
+        }
 
-            // Set reigtser value
-            case Request::SET_REGISTER_VALUE:
-            {
-                processSetRegisterValue(&message, &replyMessage);
-                break;
-            }
+        // Issue list of SPI transactions
+        case Request::EXECUTE_DEVICE_TRANSACTIONS:
+        {
+            processExecuteDeviceTransactions(message, replyMessage);
+            break;
+        }
 
-            // Set register values
-            case Request::SET_REGISTER_VALUES:
-            {
-                processSetRegisterValues(&message, &replyMessage);
-                break;
-            }
+        default:
+        {
+            LOG(LOG_ERROR, "Unsupported command " << message -> command());
+            replyMessage -> set_result(Reply::NOT_IMPLEMENTED);
+        }
+    }
+}
+
+// ------------------------- REQUEST DISPATCHING --------------------------
+
+// Requests are received on a ROUTER socket by the main thread and placed in
+// a queue per board. Workers take the next request from any board which is
+// not being served by another worker, such that requests to different boards
+// are processed in parallel and requests to the same board in order. Replies
+// are passed back to the main thread over an inproc socket and routed to the
+// client from there, since 0MQ sockets cannot be shared between threads
+
+// Endpoint over which workers pass replies to the main thread
+#define REPLY_ENDPOINT "inproc://replies"
+
+// A request waiting to be processed, with the routing frames needed to reply
+struct Job
+{
+    std::vector<zmq::message_t> envelope;
+    Request                     request;
+};
 
-            // Load firmware blocking
-            case Request::LOAD_FIRMWARE_BLOCKING:
+// Requests for a single board
+struct BoardQueue
+{
+    std::deque<Job *> jobs;
+    bool              busy;   // A worker is processing a request for this board
+
+    BoardQueue() : busy(false) { }
+};
+
+class Dispatcher
+{
+    public:
+        Dispatcher() : stopping(false) { }
+
+        // Add request to a board's queue
+        void submit(const std::string &board, Job *job)
+        {
+            std::lock_guard<std::mutex> lock(mutex);
+            BoardQueue &queue = queues[board];
+            queue.jobs.push_back(job);
+
+            // Board becomes ready if it was idle
+            if (!queue.busy && queue.jobs.size() == 1)
             {
-                processLoadFirmwareBlocking(&message, &replyMessage);
-                break;
+                ready.push_back(board);
+                condition.notify_one();
             }
+        }
 
-            // Load firmware
-            case Request::LOAD_FIRMWARE:
+        // Wait for the next request from a board which is not being served.
+        // Returns NULL when the dispatcher is stopped
+        Job *next(std::string &board)
+        {
+            std::unique_lock<std::mutex> lock(mutex);
+            condition.wait(lock, [this] { return stopping || !ready.empty(); });
+            if (stopping)
+                return NULL;
+
+            board = ready.front();
+            ready.pop_front();
+
+            BoardQueue &queue = queues[board];
+            queue.busy = true;
+            Job *job = queue.jobs.front();
+            queue.jobs.pop_front();
+            return job;
+        }
+
+        // Mark the current request for a board as done
+        void done(const std::string &board)
+        {
+            std::lock_guard<std::mutex> lock(mutex);
+            BoardQueue &queue = queues[board];
+            queue.busy = false;
+
+            // Requests arrived while processing, board is ready again
+            if (!queue.jobs.empty())
             {
-                processLoadFirmware(&message, &replyMessage);
-                break;
+                ready.push_back(board);
+                condition.notify_one();
             }
+            else
+                queues.erase(board);
+        }
+
+        // Wake up all workers and stop them
+        void stop()
+        {
+            std::lock_guard<std::mutex> lock(mutex);
+            stopping = true;
+            condition.notify_all();
+        }
+
+    private:
+        std::mutex                        mutex;
+        std::condition_variable           condition;
+        std::map<std::string, BoardQueue> queues;
+        std::deque<std::string>           ready;   // Boards with requests and no worker
+        bool                              stopping;
+};
+
+// Get the queue a request is placed in. Connect requests do not have an ID yet
+std::string boardKey(Request &request)
+{
+    std::ostringstream key;
+    if (request.command() == Request::CONNECT)
+        key << "ip " << request.ip();
+    else
+        key << "id " << request.id();
+    return key.str();
+}
+
+// Free buffer handed over to 0MQ once the message has been sent
+void freeBuffer(void *data, void *hint)
+{
+    free(data);
+}
+
+// Send reply, preceded by the request's routing frames
+void sendReply(zmq::socket_t &socket, std::vector<zmq::message_t> &envelope, Reply &replyMessage)
+{
+    for(unsigned i = 0; i < envelope.size(); i++)
+        socket.send(envelope[i], ZMQ_SNDMORE);
+
+    // Serialise directly into a buffer which is owned by the 0MQ message,
+    // avoiding intermediate copies
+    int size = replyMessage.ByteSize();
+    void *buffer = malloc(size);
+    replyMessage.SerializeToArray(buffer, size);
+
+    zmq::message_t reply(buffer, size, freeBuffer, NULL);
+    socket.send(reply);
+}
+
+// Worker thread, processing requests until the dispatcher is stopped
+void worker(zmq::context_t *context, Dispatcher *dispatcher)
+{
+    zmq::socket_t socket(*context, ZMQ_PUSH);
+    int linger = 0;
+    socket.setsockopt(ZMQ_LINGER, &linger, sizeof(linger));
+    socket.connect(REPLY_ENDPOINT);
+
+    std::string board;
+    Job *job;
+    while ((job = dispatcher -> next(board)) != NULL)
+    {
+        struct timespec start, end;
+        clock_gettime(CLOCK_MONOTONIC, &start);
+
+        Reply replyMessage;
+        processRequest(&job -> request, &replyMessage);
+        sendReply(socket, job -> envelope, replyMessage);
+
+        clock_gettime(CLOCK_MONOTONIC, &end);
+        LOG(LOG_DEBUG, "Processed command " << job -> request.command() << " for " << board << " in "
+                       << (end.tv_sec - start.tv_sec) * 1e3 + (end.tv_nsec - start.tv_nsec) * 1e-6 << " ms");
+
+        delete job;
+        dispatcher -> done(board);
+    }
+}
+
+// Receive request from client and queue it, or reply directly if it is malformed
+void receiveRequest(zmq::socket_t &frontend, Dispatcher &dispatcher)
+{
+    Job *job = new Job;
+
+    // Routing frames are followed by the request itself
+    zmq::message_t frame;
+    frontend.recv(&frame);
+    while (frame.more())
+    {
+        job -> envelope.push_back(std::move(frame));
+        frontend.recv(&frame);
+    }
+
+    // Deserialise message without copying
+    if (job -> envelope.empty() || !job -> request.ParseFromArray(frame.data(), frame.size()))
+    {
+        LOG(LOG_ERROR, "Received malformed request");
+        Reply replyMessage;
+        replyMessage.set_result(Reply::FAILURE);
+        if (!job -> envelope.empty())
+            sendReply(frontend, job -> envelope, replyMessage);
+        delete job;
+        return;
+    }
+
+    dispatcher.submit(boardKey(job -> request), job);
+}
+
+// Forward a reply from a worker to the client
+void forwardReply(zmq::socket_t &replies, zmq::socket_t &frontend)
+{
+    zmq::message_t frame;
+    do
+    {
+        replies.recv(&frame);
+        frontend.send(frame, frame.more() ? ZMQ_SNDMORE : 0);
+    }
+    while (frame.more());
+}
+
+// ------------------------------------------------------------------------
+
+// Default 0MQ connection string and number of workers
+std::string connectionString("tcp://*:5555");
+unsigned    numWorkers = 4;
+
+volatile sig_atomic_t interrupted = 0;
+
+void signalHandler(int signal)
+{
+    interrupted = 1;
+}
+
+void usage(const char *name)
+{
+    std::cerr << "Usage: " << name << " [-b endpoint] [-w workers] [-v level]" << std::endl
+              << "  -b  0MQ endpoint to bind to [default: " << connectionString << "]" << std::endl
+              << "  -w  Number of worker threads [default: " << numWorkers << "]" << std::endl
+              << "  -v  Log level, 0 (none) to 3 (every request) [default: " << logLevel << "]" << std::endl;
+}
+
+// Main server entry point
+int main(int argc, char *argv[])
+{
+    // Verify protobuf version
+    GOOGLE_PROTOBUF_VERIFY_VERSION;
 
+    // Parse command line options
+    int option;
+    while ((option = getopt(argc, argv, "b:w:v:h")) != -1)
+    {
+        switch (option)
+        {
+            case 'b':
+                connectionString = optarg;
+                break;
+            case 'w':
+                numWorkers = atoi(optarg);
+                break;
+            case 'v':
+                logLevel = atoi(optarg);
+                break;
             default:
-                std::cout << "Unsupported command" << std::endl;
+                usage(argv[0]);
+                return option == 'h' ? 0 : 1;
+        }
+    }
+
+    if (numWorkers == 0)
+    {
+        usage(argv[0]);
+        return 1;
+    }
+
+    // Prepare context, client facing socket and socket receiving replies from workers
+    zmq::context_t context(1);
+    zmq::socket_t  frontend(context, ZMQ_ROUTER);
+    zmq::socket_t  replies(context, ZMQ_PULL);
+    int linger = 0;
+    frontend.setsockopt(ZMQ_LINGER, &linger, sizeof(linger));
+    replies.setsockopt(ZMQ_LINGER, &linger, sizeof(linger));
+    frontend.bind(connectionString.c_str());
+    replies.bind(REPLY_ENDPOINT);
+
+    // Start workers
+    Dispatcher dispatcher;
+    std::vector<std::thread> workers;
+    for(unsigned i = 0; i < numWorkers; i++)
+        workers.push_back(std::thread(worker, &context, &dispatcher));
+
+    LOG(LOG_INFO, "Serving on " << connectionString << " with " << numWorkers << " workers");
+
+    signal(SIGINT, signalHandler);
+    signal(SIGTERM, signalHandler);
+
+    // Wait for requests and replies
+    zmq_pollitem_t items[] = { { (void *) frontend, 0, ZMQ_POLLIN, 0 },
+                               { (void *) replies,  0, ZMQ_POLLIN, 0 } };
+    while (!interrupted)
+    {
+        try
+        {
+            zmq::poll(items, 2, -1);
+        }
+        catch (zmq::error_t &e)
+        {
+            if (e.num() == EINTR)
+                continue;
+            throw;
         }
-        
-        // Serialise message
-        std::string replyString;
-        replyMessage.SerializeToString(&replyString);
 
-        // Send reply back to client
-        zmq::message_t reply(replyString.size());
-        memcpy((void *) reply.data(), replyString.c_str(), replyString.size());
-        socket.send(reply);
+        if (items[1].revents & ZMQ_POLLIN)
+            forwardReply(replies, frontend);
 
-        printf("Sent reply to client\n");
+        if (items[0].revents & ZMQ_POLLIN)
+            receiveRequest(frontend, dispatcher);
     }
 
+    // Stop workers. Requests still queued are dropped
+    LOG(LOG_INFO, "Shutting down");
+    dispatcher.stop();
+    for(unsigned i = 0; i < workers.size(); i++)
+        workers[i].join();
+
     return 0;
 }
-
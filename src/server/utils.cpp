@@ -1,4 +1,4 @@
-#include "Utils.hpp"
+#include "utils.hpp"
 #include "message.pb.h"
 
 // Disable return type warning temporarily
@@ -10,6 +10,8 @@ Reply::ResultType convertErrorEnum(RETURN err)
 {
     if (err == SUCCESS)
         return Reply::SUCCESS;
+    else if (err == NOT_IMPLEMENTED)
+        return Reply::NOT_IMPLEMENTED;
     else
         return Reply::FAILURE;
 }
@@ -1,5 +1,38 @@
+import numpy as np
 import PyTango
 import pickle
+import struct
+
+# Headers for encoded register (device, offset, words) and address (address, words) commands
+register_header = struct.Struct('<III')
+address_header = struct.Struct('<II')
+
+def read_register(proxy, device, register, words, offset = 0):
+    """ Read register values through the encoded interface
+    :return: Numpy uint32 array """
+    request = register_header.pack(device, offset, words) + register
+    _, data = proxy.command_inout("read_register_block", ('tpm_register', request))
+    return np.frombuffer(data, dtype = '<u4')
+
+def write_register(proxy, device, register, values, offset = 0):
+    """ Write register values through the encoded interface
+    :return: True if successful, false if not """
+    values = np.ascontiguousarray(values, dtype = '<u4')
+    request = register_header.pack(device, offset, values.size) + values.tostring() + register
+    return proxy.command_inout("write_register_block", ('tpm_register', request))
+
+def read_address(proxy, address, words):
+    """ Read memory values through the encoded interface
+    :return: Numpy uint32 array """
+    _, data = proxy.command_inout("read_address_block", ('tpm_address', address_header.pack(address, words)))
+    return np.frombuffer(data, dtype = '<u4')
+
+def write_address(proxy, address, values):
+    """ Write memory values through the encoded interface
+    :return: True if successful, false if not """
+    values = np.ascontiguousarray(values, dtype = '<u4')
+    request = address_header.pack(address, values.size) + values.tostring()
+    return proxy.command_inout("write_address_block", ('tpm_address', request))
 
 # class BoardState(Enum):
 #     """ Board State enumeration """
@@ -62,33 +95,20 @@ tpm_instance.poll_attribute('port', 3000)
 #tpm_instance.poll_attribute('port', 0) #to stop polling
 
 # Read from register
-arguments={}
-arguments['device'] = 2
-arguments['register'] = 'fpga1.regfile.block2048b'
-arguments['words'] = 512
-arguments['offset'] = 0
-args = pickle.dumps(arguments)
-print tpm_instance.read_register(args)
+print read_register(tpm_instance, 2, 'fpga1.regfile.block2048b', 512)
 
 # Write to vector register
-arguments = {}
-arguments['device'] = 2
-arguments['register'] = 'fpga1.regfile.block2048b'
-arguments['values'] = [100,1,2,3]
-arguments['offset'] = 512-4
-args = pickle.dumps(arguments)
-tpm_instance.write_register(args)
+write_register(tpm_instance, 2, 'fpga1.regfile.block2048b', np.array([100, 1, 2, 3]), offset = 512 - 4)
 
 # Read from register
-arguments={}
-arguments['device'] = 2
-arguments['register'] = 'fpga1.regfile.block2048b'
-arguments['words'] = 4
-arguments['offset'] = 512-4
-args = pickle.dumps(arguments)
-print tpm_instance.read_register(args)
+print read_register(tpm_instance, 2, 'fpga1.regfile.block2048b', 4, offset = 512 - 4)
 print '============================================'
 
+# Poll registers in the device server, events are pushed to subscribers when values change
+tpm_instance.command_inout("set_polling_groups", ["regfile 1000 0 0 fpga1.regfile.*"])
+tpm_instance.command_inout("start_polling")
+tpm_instance.subscribe_event('fpga1.regfile.block2048b', PyTango.EventType.CHANGE_EVENT, PyTango.utils.EventCallBack())
+
 # tpm_instance.command_inout("getDeviceList")
 # tpm_instance.command_inout("getRegisterList")
 # args = 'fpga1.regfile.jesd_ctrl.ext_trig_en'
@@ -149,29 +169,11 @@ tpm_instance.poll_attribute('port', 3000)
 #tpm_instance.poll_attribute('port', 0) #to stop polling
 
 # Read from register
-arguments={}
-arguments['device'] = 2
-arguments['register'] = 'fpga1.regfile.block2048b'
-arguments['words'] = 512
-arguments['offset'] = 0
-args = pickle.dumps(arguments)
-print tpm_instance.read_register(args)
+print read_register(tpm_instance, 2, 'fpga1.regfile.block2048b', 512)
 
 # Write to vector register
-arguments = {}
-arguments['device'] = 2
-arguments['register'] = 'fpga1.regfile.block2048b'
-arguments['values'] = [100,1,2,3]
-arguments['offset'] = 512-4
-args = pickle.dumps(arguments)
-tpm_instance.write_register(args)
+write_register(tpm_instance, 2, 'fpga1.regfile.block2048b', np.array([100, 1, 2, 3]), offset = 512 - 4)
 
 # Read from register
-arguments={}
-arguments['device'] = 2
-arguments['register'] = 'fpga1.regfile.block2048b'
-arguments['words'] = 4
-arguments['offset'] = 512-4
-args = pickle.dumps(arguments)
-print tpm_instance.read_register(args)
+print read_register(tpm_instance, 2, 'fpga1.regfile.block2048b', 4, offset = 512 - 4)
 print '============================================'
\ No newline at end of file
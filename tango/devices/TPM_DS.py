@@ -55,8 +55,13 @@ from PyTango._PyTango import DevFailed
 from accesslayer import *
 from definitions import *
 from types import *
+from fnmatch import fnmatch
+import numpy as np
 import pickle
+import threading
 import inspect
+import struct
+import time
 #----- PROTECTED REGION END -----#	//	TPM_DS.additionnal_import
 
 ## Device States Description
@@ -80,6 +85,7 @@ class TPM_DS (PyTango.Device_4Impl):
         'disconnect': all_states_list,
         'flush_attributes': all_states_list,
         'generate_attributes': all_states_list,
+        'generate_component_attributes': all_states_list,
         'get_device_list': all_states_list,
         'get_firmware_list': all_states_list,
         'get_register_info': all_states_list,
@@ -89,16 +95,35 @@ class TPM_DS (PyTango.Device_4Impl):
         'read_address': all_states_list,
         'read_device': all_states_list,
         'read_register': all_states_list,
+        'read_register_block': all_states_list,
+        'read_address_block': all_states_list,
+        'read_attr_hardware': all_states_list,
         'remove_command': all_states_list,
         'run_plugin_command': all_states_list,
         'set_attribute_levels': all_states_list,
         'set_board_state': all_states_list,
+        'set_polling_groups': all_states_list,
+        'start_polling': all_states_list,
+        'stop_polling': all_states_list,
         'write_address': all_states_list,
         'write_device': all_states_list,
         'write_register': all_states_list,
+        'write_register_block': all_states_list,
+        'write_address_block': all_states_list,
         'sink_alarm_state': all_states_list
     }
 
+    # Encoded (DevEncoded) register and address commands. Register requests start with a
+    # header containing the device, offset and number of words, address requests with
+    # the address and number of words. Write requests are then followed by the values,
+    # as little-endian 32-bit words, and register requests end with the register name.
+    # Read replies contain the values only
+    register_header = struct.Struct('<III')
+    address_header = struct.Struct('<II')
+    encoded_register_format = 'tpm_register'
+    encoded_address_format = 'tpm_address'
+    encoded_values_format = 'uint32'
+
     def call_plugin_command(self, argin = None):
         """ This method is responsible for calling a command from attached plugins.
         The input to this command has to include a set of arguments required by the command to be called.
@@ -178,6 +203,192 @@ class TPM_DS (PyTango.Device_4Impl):
         except:
             return None
 
+    def decode_request(self, argin, data_format, header, with_values):
+        """ Split an encoded register or address request into its parts.
+
+        :param argin: Encoded request, as a (format, data) tuple.
+        :param data_format: Expected request format.
+        :param header: Header structure for the request format.
+        :param with_values: True if the header is followed by values.
+        :return: Header fields, values as a uint32 array (None for reads) and the rest of the request. """
+        request_format, data = argin
+        if request_format != data_format or len(data) < header.size:
+            raise LibraryError("Malformed %s request" % data_format)
+
+        fields = header.unpack_from(data)
+        values, end = None, header.size
+        if with_values:
+            end += fields[-1] * 4
+            if len(data) < end:
+                raise LibraryError("Malformed %s request, expected %d values" % (data_format, fields[-1]))
+            values = np.frombuffer(data, dtype = '<u4', count = fields[-1], offset = header.size)
+        return fields, values, data[end:]
+
+    def check_register_bounds(self, register, words, offset):
+        """ Check that a register access falls within the register.
+
+        :param register: Register name.
+        :param words: Number of words accessed.
+        :param offset: Offset of first word.
+        :return: True if access is within register, false if not. """
+        reg_info = self.tpm_instance.get_register_list().get(register)
+        if reg_info is None:
+            self.info_stream("Register %s not found." % register)
+            return False
+        return words + offset <= reg_info['size']
+
+    def attribute_selected(self, name):
+        """ Check whether an attribute should be created for a register, using the
+        attribute_include and attribute_exclude device properties.
+
+        :param name: Register name.
+        :return: True if register is included and not excluded. """
+        return any([fnmatch(name, pattern) for pattern in self.attribute_include]) and \
+               not any([fnmatch(name, pattern) for pattern in self.attribute_exclude])
+
+    def add_register_attribute(self, name, size):
+        """ Create the attribute for a register, without going through the create_*_attribute commands.
+
+        :param name: Register name.
+        :param size: Register size in words. """
+        if size > 1:
+            attr = SpectrumAttr(name, PyTango.DevULong, PyTango.READ_WRITE, size)
+            self.add_attribute(attr, self.read_general_vector, self.write_general_vector)
+        else:
+            attr = Attr(name, PyTango.DevULong)
+            self.add_attribute(attr, self.read_general_scalar, self.write_general_scalar)
+        self.attr_registers[name] = size
+
+    def remove_register_attribute(self, name):
+        """ Remove the attribute for a register.
+
+        :param name: Register name. """
+        self.remove_attribute(name)
+        del self.attr_registers[name]
+        self.attr_snapshot.pop(name, None)
+
+    def update_attributes(self, registers):
+        """ Bring register attributes in line with a set of registers. Attributes are only
+        removed if their register is not in the set or its size has changed, and only
+        missing attributes are created.
+
+        :param registers: Dictionary of register name, size pairs.
+        :return: Number of attributes removed and created. """
+        removed = [name for name, size in self.attr_registers.iteritems() if registers.get(name) != size]
+        for name in removed:
+            self.remove_register_attribute(name)
+
+        created = [name for name in registers.iterkeys() if name not in self.attr_registers]
+        for name in created:
+            self.add_register_attribute(name, registers[name])
+
+        return len(removed), len(created)
+
+    def parse_polling_groups(self, lines):
+        """ Parse polling group definitions. Each group is defined on one line as:
+        name period_ms absolute_deadband relative_deadband pattern [pattern ...]
+        Registers matching any of the wildcard patterns are polled every period_ms milliseconds,
+        and an event is pushed when a value changes by more than either deadband. Deadbands of 0
+        push events on any change.
+
+        :param lines: List of group definitions.
+        :return: List of polling groups. """
+        groups = []
+        for line in lines:
+            fields = line.split()
+            if len(fields) < 5:
+                raise LibraryError("Polling group '%s' should contain name, period, deadbands and patterns" % line)
+            try:
+                groups.append({ 'name'      : fields[0],
+                                'period'    : float(fields[1]) / 1000.0,
+                                'absolute'  : float(fields[2]),
+                                'relative'  : float(fields[3]),
+                                'patterns'  : fields[4:],
+                                'registers' : [],
+                                'due'       : 0 })
+            except ValueError:
+                raise LibraryError("Invalid period or deadband in polling group '%s'" % line)
+            if groups[-1]['period'] <= 0:
+                raise LibraryError("Polling group %s should have a positive period" % fields[0])
+        return groups
+
+    def value_moved(self, group, name, value):
+        """ Check whether a register value moved outside the group deadbands since its last event.
+
+        :param group: Polling group.
+        :param name: Register name.
+        :param value: New value.
+        :return: True if an event should be pushed. """
+        if name not in self.polled_values:
+            return True
+        previous = np.asarray(self.polled_values[name], dtype = np.int64)
+        change = np.abs(np.asarray(value, dtype = np.int64) - previous)
+        if group['absolute'] == 0 and group['relative'] == 0:
+            return bool(np.any(change != 0))
+        return bool(np.any(change > group['absolute']) if group['absolute'] > 0 else False) or \
+               bool(np.any(change > group['relative'] * np.abs(previous)) if group['relative'] > 0 else False)
+
+    def poll_groups(self, groups, stop):
+        """ Read the registers of all due polling groups in one batch and push events for moved values.
+
+        :param groups: Due polling groups.
+        :param stop: Stop event of the polling thread. """
+        names = sorted(set([name for group in groups for name in group['registers']]))
+        if not names:
+            return
+
+        # Board access is serialised with commands and attribute reads through the device
+        # monitor. Polling may have been stopped while waiting for it, such as by a firmware load
+        with PyTango.AutoTangoMonitor(self):
+            if stop.is_set():
+                return
+            values = self.tpm_instance.read_registers(names)
+            if values is None:
+                raise LibraryError("Board is not connected or firmware is not loaded")
+            for group in groups:
+                for name in group['registers']:
+                    if self.value_moved(group, name, values[name]):
+                        self.polled_values[name] = values[name]
+                        self.push_change_event(name, values[name])
+                        self.push_archive_event(name, values[name])
+
+    def polling_loop(self, groups, stop):
+        """ Background acquisition loop. Groups which are due are polled together, then the
+        loop sleeps until the next group is due or polling is stopped. A failed cycle is
+        logged and polling continues with the next one.
+
+        :param groups: Polling groups, with resolved register names.
+        :param stop: Event set to stop the loop. """
+        try:
+            while not stop.is_set():
+                now = time.time()
+                due = [group for group in groups if group['due'] <= now]
+                try:
+                    self.poll_groups(due, stop)
+                except Exception as e:
+                    self.error_stream("Failed to poll registers: %s" % e)
+
+                # Skip missed cycles rather than polling in a burst
+                for group in due:
+                    group['due'] = max(group['due'] + group['period'], now)
+                stop.wait(max(0, min([group['due'] for group in groups]) - time.time()))
+        finally:
+            # Allow polling to be started again if the loop exits unexpectedly. Polling
+            # may have been restarted with a new thread in the meantime
+            with PyTango.AutoTangoMonitor(self):
+                if self.polling_stop is stop:
+                    self.polling_thread = None
+
+    def read_attribute_values(self, name):
+        """ Get register values for an attribute. Values are taken from the snapshot acquired
+        in read_attr_hardware, registers missing from the snapshot are read from the board.
+
+        :param name: Attribute (register) name.
+        :return: Register value for scalar attributes, array of values for vector attributes. """
+        if name in self.attr_snapshot:
+            return self.attr_snapshot[name]
+        return self.tpm_instance.read_registers([name])[name]
+
     def read_general_scalar(self, attr):
         """ A method that reads from a scalar attribute.
 
@@ -185,16 +396,8 @@ class TPM_DS (PyTango.Device_4Impl):
         :type: PyTango.DevAttr
         :return: The read data.
         :rtype: PyTango.DevULong """
-        self.info_stream("Reading attribute %s", attr.get_name())
-        arguments = {}
-        dev = self.get_device(attr.get_name())
-        arguments['device'] = dev.value
-        arguments['register'] = attr.get_name()
-        arguments['words'] = 1
-        arguments['offset'] = 0
-        args = str(arguments)
-        values_array = self.read_register(args)  #get actual value by reading from register
-        attr.set_value(values_array[0]) # readRegister returns an array, so a scalar requires a read from 0'th location
+        self.debug_stream("Reading attribute %s", attr.get_name())
+        attr.set_value(self.read_attribute_values(attr.get_name()))
 
     def write_general_scalar(self, attr):
         """ A method that writes to a scalar attribute.
@@ -204,6 +407,7 @@ class TPM_DS (PyTango.Device_4Impl):
         :return: Success or failure.
         :rtype: PyTango.DevBoolean """
         self.info_stream("Writing attribute %s", attr.get_name())
+        self.attr_snapshot.pop(attr.get_name(), None)
         data = attr.get_write_value()
         arguments = {}
         dev = self.get_device(attr.get_name())
@@ -215,22 +419,14 @@ class TPM_DS (PyTango.Device_4Impl):
         self.write_register(args)
 
     def read_general_vector(self, attr):
-        """ A method that reads from a scalar attribute.
+        """ A method that reads from a vector attribute.
 
         :param attr: The attribute to read from.
         :type: PyTango.DevAttr
         :return: The read data.
         :rtype: PyTango.DevVarULongArray """
-        self.info_stream("Reading attribute %s", attr.get_name())
-        arguments = {}
-        dev = self.get_device(attr.get_name())
-        arguments['device'] = dev.value
-        arguments['register'] = attr.get_name()
-        arguments['words'] = 1
-        arguments['offset'] = 0
-        args = str(arguments)
-        values_array = self.read_register(args)  #get actual values by reading from register
-        attr.set_value(values_array) # readRegister returns an array
+        self.debug_stream("Reading attribute %s", attr.get_name())
+        attr.set_value(self.read_attribute_values(attr.get_name()))
 
     def write_general_vector(self, attr):
         """ A method that writes to a vector attribute.
@@ -240,6 +436,7 @@ class TPM_DS (PyTango.Device_4Impl):
         :return: Success or failure.
         :rtype: PyTango.DevBoolean """
         self.info_stream("Writting attribute %s", attr.get_name())
+        self.attr_snapshot.pop(attr.get_name(), None)
         data = attr.get_write_value()
         arguments = {}
         dev = self.get_device(attr.get_name())
@@ -263,7 +460,7 @@ class TPM_DS (PyTango.Device_4Impl):
     def delete_device(self):
         self.debug_stream("In delete_device()")
         #----- PROTECTED REGION ID(TPM_DS.delete_device) ENABLED START -----#
-        
+        self.stop_polling()
         #----- PROTECTED REGION END -----#	//	TPM_DS.delete_device
 
     def init_device(self):
@@ -278,6 +475,16 @@ class TPM_DS (PyTango.Device_4Impl):
         self.set_state(DevState.ON)
         self.set_board_state(BoardState.Init.value)
         self.tpm_instance = TPM()
+        self.attr_snapshot = {}
+        self.attr_registers = {}
+        self.polling_thread = None
+        self.polling_stop = None
+        self.polled_values = {}
+        try:
+            self.polling_group_definitions = self.parse_polling_groups(self.polling_groups)
+        except LibraryError as e:
+            self.error_stream("Invalid polling_groups property: %s" % e)
+            self.polling_group_definitions = []
         #connect_args = pickle.dumps({'ip': "127.0.0.1", 'port': 10000})
         #self.connect(connect_args)
         #self.tpm_instance = TPM(ip="127.0.0.1", port=10000)
@@ -348,7 +555,21 @@ class TPM_DS (PyTango.Device_4Impl):
     def read_attr_hardware(self, data):
         self.debug_stream("In read_attr_hardware()")
         #----- PROTECTED REGION ID(TPM_DS.read_attr_hardware) ENABLED START -----#
-        
+        # Read all register attributes requested in this cycle in one batch. Registers
+        # are sorted by address and adjacent registers combined into single reads, the
+        # attribute read methods then take their values from the snapshot
+        self.attr_snapshot = {}
+        state_ok = self.check_state_flow(inspect.stack()[0][3])
+        if state_ok and self.attr_is_programmed_read:
+            multi_attr = self.get_device_attr()
+            register_dict = self.tpm_instance.get_register_list()
+            names = [multi_attr.get_attr_by_ind(index).get_name() for index in data]
+            names = [name for name in names if name in register_dict]
+            if names:
+                try:
+                    self.attr_snapshot = self.tpm_instance.read_registers(names)
+                except (DevFailed, LibraryError, BoardError) as df:
+                    self.debug_stream("Failed to read attributes: %s" % df)
         #----- PROTECTED REGION END -----#	//	TPM_DS.read_attr_hardware
 
 
@@ -461,6 +682,7 @@ class TPM_DS (PyTango.Device_4Impl):
         #----- PROTECTED REGION ID(TPM_DS.disconnect) ENABLED START -----#
         state_ok = self.check_state_flow(inspect.stack()[0][3])
         if state_ok:
+            self.stop_polling()
             self.tpm_instance.disconnect()
         else:
             self.debug_stream("Invalid state")
@@ -477,13 +699,11 @@ class TPM_DS (PyTango.Device_4Impl):
         #----- PROTECTED REGION ID(TPM_DS.flush_attributes) ENABLED START -----#
         state_ok = self.check_state_flow(inspect.stack()[0][3])
         if state_ok:
-            if self.attr_is_programmed_read:
-                register_dict = self.tpm_instance.get_register_list()
-                if not register_dict: #if dict is empty
-                    for reg_name, entries in register_dict.iteritems():
-                        self.remove_attribute(reg_name)
-            else:
-                self.info_stream("Device not programmed. No attributes removed.")
+            try:
+                for reg_name in self.attr_registers.keys():
+                    self.remove_register_attribute(reg_name)
+            except DevFailed as df:
+                self.debug_stream("Failed to remove attributes: %s" % df)
         else:
             self.debug_stream("Invalid state")
         #----- PROTECTED REGION END -----#	//	TPM_DS.flush_attributes
@@ -497,23 +717,55 @@ class TPM_DS (PyTango.Device_4Impl):
         :rtype: PyTango.DevVoid """
         self.debug_stream("In generate_attributes()")
         #----- PROTECTED REGION ID(TPM_DS.generate_attributes) ENABLED START -----#
+        # Attributes are compared with the current register list, so after a firmware
+        # change only attributes for registers which were removed or resized are removed,
+        # and only attributes for new registers are created. With lazy_attributes set,
+        # no new attributes are created here (see generate_component_attributes)
         state_ok = self.check_state_flow(inspect.stack()[0][3])
         if state_ok:
             register_dict = self.tpm_instance.get_register_list()
+            registers = {}
+            if register_dict is not None:
+                registers = dict(zip(register_dict.names, register_dict.records['size'].tolist()))
+            if self.lazy_attributes:
+                registers = dict([(name, size) for name, size in registers.iteritems() if name in self.attr_registers])
+            else:
+                registers = dict([(name, size) for name, size in registers.iteritems() if self.attribute_selected(name)])
             try:
-                for reg_name, entries in register_dict.iteritems():
-                    size = entries.get('size')
-                    #print reg_name, size
-                    if size > 1:
-                        args = {'name': reg_name, 'length': size}
-                        self.create_vector_attribute(pickle.dumps(args))
-                        self.info_stream("Name: %s - Size: %s" % (reg_name, size))
-                    else:
-                        self.create_scalar_attribute(reg_name)
+                removed, created = self.update_attributes(registers)
+                self.info_stream("Attributes updated: %d removed, %d created" % (removed, created))
             except DevFailed as df:
-                self.debug_stream("Firmware attribute generation failed for: %s - Error: %s" % (reg_name, df))
-            else:
-                self.debug_stream("Invalid state")
+                self.debug_stream("Firmware attribute generation failed: %s" % df)
+        else:
+            self.debug_stream("Invalid state")
+        #----- PROTECTED REGION END -----#	//	TPM_DS.generate_attributes
+
+    def generate_component_attributes(self, argin):
+        """ Creates attributes for all registers within a component, such as fpga1.jesd. Used to create attributes on demand when lazy_attributes is set.
+        
+        :param argin: Dotted component path.
+        :type: PyTango.DevString
+        :return: Number of attributes created.
+        :rtype: PyTango.DevULong """
+        self.debug_stream("In generate_component_attributes()")
+        argout = 0
+        #----- PROTECTED REGION ID(TPM_DS.generate_component_attributes) ENABLED START -----#
+        state_ok = self.check_state_flow(inspect.stack()[0][3])
+        if state_ok:
+            register_dict = self.tpm_instance.get_register_list()
+            if register_dict is not None:
+                names = [name for name in register_dict.search_index().component(argin)
+                         if name not in self.attr_registers and self.attribute_selected(name)]
+                try:
+                    for name in names:
+                        self.add_register_attribute(name, int(register_dict[name]['size']))
+                        argout += 1
+                except DevFailed as df:
+                    self.debug_stream("Failed to create attributes for %s: %s" % (argin, df))
+        else:
+            self.debug_stream("Invalid state")
+        #----- PROTECTED REGION END -----#	//	TPM_DS.generate_component_attributes
+        return argout
 
     # def get_device_list(self):
     #     """ Returns a list of devices, as a serialized python dictionary, stored as a string.
@@ -642,12 +894,14 @@ class TPM_DS (PyTango.Device_4Impl):
             arguments = pickle.loads(argin)
             device = arguments['device']
             filepath = arguments['path']
-            self.flush_attributes()
+            self.stop_polling()
             try:
                 self.tpm_instance.load_firmware_blocking(Device(device), filepath)
                 self.generate_attributes()
                 self.attr_is_programmed_read = True
                 self.info_stream("Firmware loaded.")
+                if self.polling_group_definitions:
+                    self.start_polling()
             except DevFailed as df:
                 self.debug_stream("Failed to load firmware: %s" % df)
                 self.attr_is_programmed_read = False
@@ -916,6 +1170,85 @@ class TPM_DS (PyTango.Device_4Impl):
         else:
             self.info_stream("Wrong state given. Expected one of: %s" % self.all_states_list)
 
+    def set_polling_groups(self, argin):
+        """ Replaces the polling groups defined in the polling_groups property. Each group is defined as:
+        name period_ms absolute_deadband relative_deadband pattern [pattern ...]
+        Polling is restarted if running.
+        
+        :param argin: Polling group definitions, one per entry.
+        :type: PyTango.DevVarStringArray
+        :return: True if groups are valid, false if not.
+        :rtype: PyTango.DevBoolean """
+        self.debug_stream("In set_polling_groups()")
+        argout = False
+        #----- PROTECTED REGION ID(TPM_DS.set_polling_groups) ENABLED START -----#
+        state_ok = self.check_state_flow(inspect.stack()[0][3])
+        if state_ok:
+            try:
+                self.polling_group_definitions = self.parse_polling_groups(argin)
+                argout = True
+                if self.polling_thread is not None:
+                    self.stop_polling()
+                    self.start_polling()
+            except LibraryError as e:
+                self.info_stream("Invalid polling groups: %s" % e)
+        else:
+            self.debug_stream("Invalid state")
+        #----- PROTECTED REGION END -----#	//	TPM_DS.set_polling_groups
+        return argout
+        
+    def start_polling(self):
+        """ Starts the background acquisition thread, which reads polling groups in batches and pushes change and archive events when values move.
+        
+        :param : 
+        :type: PyTango.DevVoid
+        :return: 
+        :rtype: PyTango.DevVoid """
+        self.debug_stream("In start_polling()")
+        #----- PROTECTED REGION ID(TPM_DS.start_polling) ENABLED START -----#
+        state_ok = self.check_state_flow(inspect.stack()[0][3])
+        if state_ok and self.polling_thread is None:
+            # Resolve group registers to existing attributes, events are pushed by the device
+            groups = [dict(group) for group in self.polling_group_definitions]
+            for group in groups:
+                group['registers'] = sorted([name for name in self.attr_registers
+                                             if any([fnmatch(name, pattern) for pattern in group['patterns']])])
+                for name in group['registers']:
+                    self.set_change_event(name, True, False)
+                    self.set_archive_event(name, True, False)
+            groups = [group for group in groups if group['registers']]
+            if not groups:
+                self.info_stream("No attributes to poll.")
+                return
+
+            self.polled_values = {}
+            self.polling_stop = threading.Event()
+            self.polling_thread = threading.Thread(target = self.polling_loop, args = (groups, self.polling_stop),
+                                                   name = "TPM_DS polling")
+            self.polling_thread.daemon = True
+            self.polling_thread.start()
+            self.info_stream("Polling %d groups" % len(groups))
+        elif not state_ok:
+            self.debug_stream("Invalid state")
+        #----- PROTECTED REGION END -----#	//	TPM_DS.start_polling
+        
+    def stop_polling(self):
+        """ Stops the background acquisition thread.
+        
+        :param : 
+        :type: PyTango.DevVoid
+        :return: 
+        :rtype: PyTango.DevVoid """
+        self.debug_stream("In stop_polling()")
+        #----- PROTECTED REGION ID(TPM_DS.stop_polling) ENABLED START -----#
+        # The thread is not joined, since it may be waiting for the device monitor held by
+        # the caller. It exits without touching the board once it gets the monitor
+        if self.polling_thread is not None:
+            self.polling_stop.set()
+            self.polling_thread = None
+        #----- PROTECTED REGION END -----#	//	TPM_DS.stop_polling
+        
+
     # def write_address(self, argin):
     #     """ Writes values to a register location. The actual physical address has to be provided.
     #
@@ -1024,6 +1357,110 @@ class TPM_DS (PyTango.Device_4Impl):
             self.debug_stream("Invalid state")
         #----- PROTECTED REGION END -----#	//	TPM_DS.write_register
         return argout
+
+    def read_register_block(self, argin):
+        """ Reads values from a register location. Request and values are binary encoded, avoiding the cost of pickling large blocks.
+        
+        :param argin: Header with device, offset and number of words, followed by the register name.
+        :type: PyTango.DevEncoded
+        :return: Register values, as little-endian 32-bit words.
+        :rtype: PyTango.DevEncoded """
+        self.debug_stream("In read_register_block()")
+        argout = (self.encoded_values_format, '')
+        #----- PROTECTED REGION ID(TPM_DS.read_register_block) ENABLED START -----#
+        state_ok = self.check_state_flow(inspect.stack()[0][3])
+        if state_ok:
+            try:
+                (device, offset, words), _, register = self.decode_request(argin, self.encoded_register_format,
+                                                                            self.register_header, False)
+                if self.check_register_bounds(register, words, offset):
+                    values = np.empty(words, dtype = '<u4')
+                    self.tpm_instance.read_register_into(Device(device), register, values, offset)
+                    argout = (self.encoded_values_format, values.tostring())
+                else:
+                    self.info_stream("Register size limit exceeded, no values read.")
+            except (DevFailed, LibraryError, BoardError) as df:
+                self.debug_stream("Failed to read register: %s" % df)
+        else:
+            self.debug_stream("Invalid state")
+        #----- PROTECTED REGION END -----#	//	TPM_DS.read_register_block
+        return argout
+        
+    def write_register_block(self, argin):
+        """ Writes values to a register location. Request and values are binary encoded, avoiding the cost of pickling large blocks.
+        
+        :param argin: Header with device, offset and number of words, followed by the values and the register name.
+        :type: PyTango.DevEncoded
+        :return: True if successful, false if not.
+        :rtype: PyTango.DevBoolean """
+        self.debug_stream("In write_register_block()")
+        argout = False
+        #----- PROTECTED REGION ID(TPM_DS.write_register_block) ENABLED START -----#
+        state_ok = self.check_state_flow(inspect.stack()[0][3])
+        if state_ok:
+            try:
+                (device, offset, words), values, register = self.decode_request(argin, self.encoded_register_format,
+                                                                                 self.register_header, True)
+                if self.check_register_bounds(register, words, offset):
+                    self.tpm_instance.write_register(Device(device), register, values, offset)
+                    argout = True
+                else:
+                    self.info_stream("Register size limit exceeded, no changes committed.")
+            except (DevFailed, LibraryError, BoardError) as df:
+                self.debug_stream("Failed to write register: %s" % df)
+        else:
+            self.debug_stream("Invalid state")
+        #----- PROTECTED REGION END -----#	//	TPM_DS.write_register_block
+        return argout
+        
+    def read_address_block(self, argin):
+        """ Reads values from a memory address. Request and values are binary encoded, avoiding the cost of pickling large blocks.
+        
+        :param argin: Header with address and number of words.
+        :type: PyTango.DevEncoded
+        :return: Memory values, as little-endian 32-bit words.
+        :rtype: PyTango.DevEncoded """
+        self.debug_stream("In read_address_block()")
+        argout = (self.encoded_values_format, '')
+        #----- PROTECTED REGION ID(TPM_DS.read_address_block) ENABLED START -----#
+        state_ok = self.check_state_flow(inspect.stack()[0][3])
+        if state_ok:
+            try:
+                (address, words), _, _ = self.decode_request(argin, self.encoded_address_format,
+                                                             self.address_header, False)
+                values = np.empty(words, dtype = '<u4')
+                self.tpm_instance.read_address_into(address, values)
+                argout = (self.encoded_values_format, values.tostring())
+            except (DevFailed, LibraryError, BoardError) as df:
+                self.debug_stream("Failed to read address: %s" % df)
+        else:
+            self.debug_stream("Invalid state")
+        #----- PROTECTED REGION END -----#	//	TPM_DS.read_address_block
+        return argout
+        
+    def write_address_block(self, argin):
+        """ Writes values to a memory address. Request and values are binary encoded, avoiding the cost of pickling large blocks.
+        
+        :param argin: Header with address and number of words, followed by the values.
+        :type: PyTango.DevEncoded
+        :return: True if successful, false if not.
+        :rtype: PyTango.DevBoolean """
+        self.debug_stream("In write_address_block()")
+        argout = False
+        #----- PROTECTED REGION ID(TPM_DS.write_address_block) ENABLED START -----#
+        state_ok = self.check_state_flow(inspect.stack()[0][3])
+        if state_ok:
+            try:
+                (address, words), values, _ = self.decode_request(argin, self.encoded_address_format,
+                                                                  self.address_header, True)
+                self.tpm_instance.write_address(address, values)
+                argout = True
+            except (DevFailed, LibraryError, BoardError) as df:
+                self.debug_stream("Failed to write address: %s" % df)
+        else:
+            self.debug_stream("Invalid state")
+        #----- PROTECTED REGION END -----#	//	TPM_DS.write_address_block
+        return argout
         
     def sink_alarm_state(self):
         """ This method is designed to turn off the device alarm state. It however, the cause that triggers an alarm is still present, alarm will turn back on.
@@ -1074,6 +1511,22 @@ class TPM_DSClass(PyTango.DeviceClass):
 
     #    Device Properties
     device_property_list = {
+        'attribute_include':
+            [PyTango.DevVarStringArray,
+            "Wildcard patterns of register names for which attributes are created.",
+            ["*"] ],
+        'attribute_exclude':
+            [PyTango.DevVarStringArray,
+            "Wildcard patterns of register names for which attributes are not created.",
+            [] ],
+        'lazy_attributes':
+            [PyTango.DevBoolean,
+            "Only create attributes on request, per component, through generate_component_attributes.",
+            [False] ],
+        'polling_groups':
+            [PyTango.DevVarStringArray,
+            "Registers polled by the device, one group per entry: name period_ms absolute_deadband relative_deadband pattern [pattern ...]",
+            [] ],
         }
 
 
@@ -1100,6 +1553,9 @@ class TPM_DSClass(PyTango.DeviceClass):
         'generate_attributes':
             [[PyTango.DevVoid, "none"],
             [PyTango.DevVoid, "none"]],
+        'generate_component_attributes':
+            [[PyTango.DevString, "Dotted component path."],
+            [PyTango.DevULong, "Number of attributes created."]],
         'get_device_list':
             [[PyTango.DevVoid, "none"],
             [PyTango.DevString, "Dictionary of devices."]],
@@ -1127,6 +1583,12 @@ class TPM_DSClass(PyTango.DeviceClass):
         'read_register':
             [[PyTango.DevString, "Associated register information."],
             [PyTango.DevVarULongArray, "Register values."]],
+        'read_register_block':
+            [[PyTango.DevEncoded, "Header with device, offset and number of words, followed by the register name."],
+            [PyTango.DevEncoded, "Register values, as little-endian 32-bit words."]],
+        'read_address_block':
+            [[PyTango.DevEncoded, "Header with address and number of words."],
+            [PyTango.DevEncoded, "Memory values, as little-endian 32-bit words."]],
         'remove_command':
             [[PyTango.DevString, "Command name."],
             [PyTango.DevBoolean, "True if command removal was successful, false otherwise."]],
@@ -1139,6 +1601,15 @@ class TPM_DSClass(PyTango.DeviceClass):
         'set_board_state':
             [[PyTango.DevLong, "Board status value."],
             [PyTango.DevVoid, "none"]],
+        'set_polling_groups':
+            [[PyTango.DevVarStringArray, "Polling group definitions, one per entry."],
+            [PyTango.DevBoolean, "True if groups are valid, false if not."]],
+        'start_polling':
+            [[PyTango.DevVoid, "none"],
+            [PyTango.DevVoid, "none"]],
+        'stop_polling':
+            [[PyTango.DevVoid, "none"],
+            [PyTango.DevVoid, "none"]],
         'write_address':
             [[PyTango.DevString, "Associated register information."],
             [PyTango.DevBoolean, "True if successful, false if not."]],
@@ -1148,6 +1619,12 @@ class TPM_DSClass(PyTango.DeviceClass):
         'write_register':
             [[PyTango.DevString, "Associated register information."],
             [PyTango.DevBoolean, "True if successful, false if not."]],
+        'write_register_block':
+            [[PyTango.DevEncoded, "Header with device, offset and number of words, followed by the values and the register name."],
+            [PyTango.DevBoolean, "True if successful, false if not."]],
+        'write_address_block':
+            [[PyTango.DevEncoded, "Header with address and number of words, followed by the values."],
+            [PyTango.DevBoolean, "True if successful, false if not."]],
         'sink_alarm_state':
             [[PyTango.DevVoid, "none"],
             [PyTango.DevVoid, "none"]],